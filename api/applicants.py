@@ -4,10 +4,13 @@ All business logic delegated to ApplicantService, CSVImportService, ExportServic
 File streaming (make_response / send_file) stays here as an HTTP concern.
 """
 
-from flask import Blueprint, make_response, request, jsonify
-from flask_login import current_user, login_required
+import msgpack
+import zlib
+from datetime import date, datetime
+from decimal import Decimal
+from flask import Blueprint, Response, current_app, g, make_response, request, jsonify, stream_with_context
 from utils.permissions import require_admin, require_faculty_or_admin
-from services.applicant_service import ApplicantService
+from services.applicant_service import ApplicantService, VersionConflictError
 from services.csv_import_service import CSVImportService, SessionValidationError
 from services.export_service import ExportService
 
@@ -17,13 +20,51 @@ _csv_svc = CSVImportService()
 _export_svc = ExportService()
 
 _XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+_MSGPACK_MIME = "application/msgpack"
+_STREAM_BATCH_ROWS = 200
+
+
+def _msgpack_default(value):
+    """Encode DB types msgpack doesn't handle natively."""
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def _wants_msgpack():
+    """True when the client explicitly prefers MessagePack over JSON."""
+    return request.accept_mimetypes.best_match(["application/json", _MSGPACK_MIME]) == _MSGPACK_MIME
+
+
+def _gzip_chunks(chunks, level):
+    """
+    Gzip a stream of text chunks, sync-flushing after each one so every
+    WSGI write is a complete deflate block the client can decode on arrival.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode("utf-8"))
+        yield data + compressor.flush(zlib.Z_SYNC_FLUSH)
+    yield compressor.flush()
+
+
+def _expected_version(data):
+    """Optional application_info version a client edit was based on (None when absent/invalid)."""
+    version = data.get("version")
+    return version if isinstance(version, int) and not isinstance(version, bool) else None
 
 
 @applicants_api.route("/upload", methods=["POST"])
+@require_admin
 def upload_csv():
-    """Handle CSV file upload and processing (Admin only)."""
-    if not current_user.is_authenticated or not current_user.is_admin:
-        return jsonify({"success": False, "message": "Access denied"}), 403
+    """
+    Handle CSV file upload and processing (Admin only).
+
+    With ?async=1 the import runs on a background worker and the response is
+    202 with a job_id to poll at /upload-status/<job_id>.
+    """
 
     if "file" not in request.files:
         return jsonify({"success": False, "message": "No file uploaded"})
@@ -35,9 +76,15 @@ def upload_csv():
     if not file.filename.lower().endswith(".csv"):
         return jsonify({"success": False, "message": "Please upload a CSV file"})
 
+    if request.args.get("async") == "1":
+        try:
+            job_id = _csv_svc.submit_import(file.read(), g.user.email, g.user)
+        except Exception as e:
+            return jsonify({"success": False, "message": f"Error queuing import: {str(e)}"}), 500
+        return jsonify({"success": True, "job_id": job_id, "status": "queued"}), 202
+
     try:
-        result = _csv_svc.import_file(file.read(), current_user.email, current_user)
-        from datetime import datetime
+        result = _csv_svc.import_file(file.read(), g.user.email, g.user)
         return jsonify({
             "success": True,
             "message": result["message"],
@@ -59,16 +106,91 @@ def upload_csv():
         return jsonify({"success": False, "message": f"Error processing file: {str(e)}"})
 
 
+@applicants_api.route("/upload-status/<job_id>", methods=["GET"])
+@require_admin
+def upload_status(job_id):
+    """
+    Report the status of a background CSV import (Admin only).
+
+    A job record only changes when its status does, so the status doubles as
+    a weak ETag: polls that send it back in If-None-Match get an empty 304.
+    """
+
+    try:
+        job = _csv_svc.get_job(job_id)
+    except Exception as e:
+        return jsonify({"success": False, "message": f"Error loading job: {str(e)}"}), 500
+    if job is None:
+        return jsonify({"success": False, "message": "Unknown or expired job"}), 404
+
+    etag = f"{job_id}:{job['status']}"
+    if request.if_none_match.contains_weak(etag):
+        response = Response(status=304)
+    else:
+        response = jsonify({"success": True, **job})
+    response.set_etag(etag, weak=True)
+    response.headers["Cache-Control"] = "private, max-age=0, must-revalidate"
+    return response
+
+
 @applicants_api.route("/applicants", methods=["GET"])
 def get_applicants():
-    """Get all applicants, optionally filtered by session."""
+    """Get all applicants, optionally filtered by session (streamed JSON or MessagePack)."""
     session_id = request.args.get("session_id", type=int)
+    include_staleness = request.args.get("include_staleness") == "1"
+    if _wants_msgpack():
+        try:
+            applicants = _applicant_svc.get_all(
+                session_id=session_id, include_staleness=include_staleness
+            )
+        except Exception as e:
+            return jsonify({"success": False, "message": str(e)})
+        body = msgpack.packb(
+            {"success": True, "applicants": applicants},
+            default=_msgpack_default,
+            use_bin_type=True,
+        )
+        return Response(body, mimetype=_MSGPACK_MIME)
+
+    rows = _applicant_svc.iter_all(
+        session_id=session_id, include_staleness=include_staleness
+    )
     try:
-        applicants = _applicant_svc.get_all(session_id=session_id)
-        return jsonify({"success": True, "applicants": applicants})
+        # Pull the first row eagerly so connection/query errors still
+        # produce a normal JSON error instead of a truncated stream.
+        first = next(rows, None)
     except Exception as e:
         return jsonify({"success": False, "message": str(e)})
 
+    dumps = current_app.json.dumps
+
+    def generate():
+        # Emit rows in batches so each WSGI write carries _STREAM_BATCH_ROWS
+        # rows instead of one; for gzip clients _gzip_chunks compresses and
+        # flushes per batch, so each batch is also one deflate block.
+        yield '{"success": true, "applicants": ['
+        if first is not None:
+            batch = [dumps(first)]
+            separator = ""
+            for row in rows:
+                batch.append(dumps(row))
+                if len(batch) >= _STREAM_BATCH_ROWS:
+                    yield separator + ",".join(batch)
+                    separator = ","
+                    batch = []
+            if batch:
+                yield separator + ",".join(batch)
+        yield "]}"
+
+    if request.accept_encodings["gzip"] <= 0:
+        return Response(stream_with_context(generate()), mimetype="application/json")
+
+    body = _gzip_chunks(generate(), current_app.config.get("COMPRESS_LEVEL", 6))
+    response = Response(stream_with_context(body), mimetype="application/json")
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
 
 @applicants_api.route("/applicant-info/<user_code>", methods=["GET"])
 def get_applicant_info(user_code):
@@ -107,14 +229,13 @@ def get_applicant_application_info(user_code):
 
 
 @applicants_api.route("/applicant-application-info/<user_code>/status", methods=["PUT"])
+@require_admin
 def update_applicant_status(user_code):
     """Update applicant status (Admin only)."""
-    if not current_user.is_authenticated or not current_user.is_admin:
-        return jsonify({"success": False, "message": "Access denied"}), 403
-    data = request.get_json() or {}
+    data = request.get_json(silent=True) or {}
     try:
-        message = _applicant_svc.update_status(user_code, data.get("status"))
-        return jsonify({"success": True, "message": message})
+        result = _applicant_svc.update_status(user_code, data.get("status"))
+        return jsonify({"success": True, **result})
     except ValueError as e:
         return jsonify({"success": False, "message": str(e)}), 400
     except Exception as e:
@@ -122,11 +243,10 @@ def update_applicant_status(user_code):
 
 
 @applicants_api.route("/applicant-application-info/<user_code>/prerequisites", methods=["PUT"])
+@require_faculty_or_admin
 def update_applicant_prerequisites(user_code):
     """Update prerequisite courses and GPA (Admin/Faculty only)."""
-    if not current_user.is_authenticated or current_user.is_viewer:
-        return jsonify({"success": False, "message": "Access denied"}), 403
-    data = request.get_json()
+    data = request.get_json(silent=True)
     if not data:
         return jsonify({"success": False, "message": "Invalid request data"}), 400
     if not user_code or not user_code.strip():
@@ -140,11 +260,14 @@ def update_applicant_prerequisites(user_code):
     gpa = str(gpa_raw).strip()[:50] if gpa_raw and gpa_raw != "" else None
 
     try:
-        message = _applicant_svc.update_prerequisites(
+        result = _applicant_svc.update_prerequisites(
             user_code, cs, stat, math, gpa, additional_comments,
             data.get("mds_v"), data.get("mds_cl"), data.get("mds_o"),
+            expected_version=_expected_version(data),
         )
-        return jsonify({"success": True, "message": message})
+        return jsonify({"success": True, **result})
+    except VersionConflictError as e:
+        return jsonify({"success": False, "conflict": True, "message": str(e)}), 409
     except ValueError as e:
         return jsonify({"success": False, "message": str(e)}), 400
     except Exception as e:
@@ -152,11 +275,10 @@ def update_applicant_prerequisites(user_code):
 
 
 @applicants_api.route("/applicant-application-info/<user_code>/english-comment", methods=["PUT"])
+@require_admin
 def update_english_comment(user_code):
     """Update English proficiency comment (Admin only)."""
-    if not current_user.is_authenticated or current_user.is_viewer or current_user.is_faculty:
-        return jsonify({"success": False, "message": "Access denied"}), 403
-    data = request.get_json()
+    data = request.get_json(silent=True)
     if not data:
         return jsonify({"success": False, "message": "Invalid request data"}), 400
     if not user_code or not user_code.strip():
@@ -164,8 +286,12 @@ def update_english_comment(user_code):
 
     comment = str(data.get("english_comment", "")).strip()[:2000]
     try:
-        message = _applicant_svc.update_english_comment(user_code, comment)
-        return jsonify({"success": True, "message": message})
+        result = _applicant_svc.update_english_comment(
+            user_code, comment, _expected_version(data)
+        )
+        return jsonify({"success": True, **result})
+    except VersionConflictError as e:
+        return jsonify({"success": False, "conflict": True, "message": str(e)}), 409
     except ValueError as e:
         return jsonify({"success": False, "message": str(e)}), 400
     except Exception as e:
@@ -173,14 +299,17 @@ def update_english_comment(user_code):
 
 
 @applicants_api.route("/applicant-application-info/<user_code>/english-status", methods=["PUT"])
+@require_admin
 def update_english_status(user_code):
     """Update English status (Admin only)."""
-    if not current_user.is_authenticated or current_user.is_viewer or current_user.is_faculty:
-        return jsonify({"success": False, "message": "Access denied"}), 403
-    data = request.get_json() or {}
+    data = request.get_json(silent=True) or {}
     try:
-        message = _applicant_svc.update_english_status(user_code, data.get("english_status"))
-        return jsonify({"success": True, "message": message})
+        result = _applicant_svc.update_english_status(
+            user_code, data.get("english_status"), _expected_version(data)
+        )
+        return jsonify({"success": True, **result})
+    except VersionConflictError as e:
+        return jsonify({"success": False, "conflict": True, "message": str(e)}), 409
     except ValueError as e:
         return jsonify({"success": False, "message": str(e)}), 400
     except Exception as e:
@@ -191,12 +320,12 @@ def update_english_status(user_code):
 @require_admin
 def update_applicant_scholarship_endpoint(user_code):
     """Update scholarship decision (Admin only)."""
-    data = request.get_json()
+    data = request.get_json(silent=True)
     if not data:
         return jsonify({"success": False, "message": "Invalid request data"}), 400
     try:
-        message = _applicant_svc.update_scholarship(user_code, data.get("scholarship", "Undecided"))
-        return jsonify({"success": True, "message": message})
+        result = _applicant_svc.update_scholarship(user_code, data.get("scholarship", "Undecided"))
+        return jsonify({"success": True, **result})
     except ValueError as e:
         return jsonify({"success": False, "message": str(e)}), 400
     except Exception as e:
@@ -204,12 +333,11 @@ def update_applicant_scholarship_endpoint(user_code):
 
 
 @applicants_api.route("/export/all", methods=["GET"])
+@require_faculty_or_admin
 def export_all_applicants():
     """Export all applicants as XLSX (Admin/Faculty only)."""
-    if not current_user.is_authenticated or current_user.is_viewer:
-        return jsonify({"success": False, "message": "Access denied"}), 403
     try:
-        output, filename = _export_svc.export_all(current_user.email)
+        output, filename = _export_svc.export_all(g.user.email)
         response = make_response(output.getvalue())
         response.headers["Content-Type"] = _XLSX_MIME
         response.headers["Content-Disposition"] = f"attachment; filename={filename}"
@@ -221,16 +349,15 @@ def export_all_applicants():
 
 
 @applicants_api.route("/export/selected", methods=["POST"])
+@require_faculty_or_admin
 def export_selected_applicants():
     """Export selected applicants as XLSX (Admin/Faculty only)."""
-    if not current_user.is_authenticated or current_user.is_viewer:
-        return jsonify({"success": False, "message": "Access denied"}), 403
-    data = request.get_json() or {}
+    data = request.get_json(silent=True) or {}
     try:
         output, filename = _export_svc.export_selected(
             data.get("user_codes", []),
             data.get("sections"),
-            current_user.email,
+            g.user.email,
         )
         response = make_response(output.getvalue())
         response.headers["Content-Type"] = _XLSX_MIME
@@ -243,13 +370,11 @@ def export_selected_applicants():
 
 
 @applicants_api.route("/clear-all-data", methods=["DELETE"])
-@login_required
+@require_admin
 def clear_all_data():
     """Clear all applicant data (Admin only)."""
-    if not current_user.is_authenticated or not current_user.is_admin:
-        return jsonify({"success": False, "message": "Access denied. Admin privileges required."}), 403
     try:
-        result = _applicant_svc.clear_all_data(current_user.email)
+        result = _applicant_svc.clear_all_data(g.user.email)
         return jsonify({"success": True, "message": result["message"], "tables_cleared": result["tables_cleared"]})
     except ValueError as e:
         return jsonify({"success": False, "message": str(e)}), 500
@@ -5,8 +5,8 @@ No SQL. No bcrypt. No business logic.
 """
 from flask import Blueprint, request, jsonify, url_for
 from flask_login import login_user, logout_user, login_required, current_user
-from utils.permissions import require_admin, require_super_admin
-from services.auth_service import AuthService
+from utils.permissions import require_admin
+from services.auth_service import AuthService, invalidate_user_cache
 
 auth_api = Blueprint("auth_api", __name__)
 _service = AuthService()
@@ -40,6 +40,7 @@ def login():
 @auth_api.route("/logout", methods=["POST"])
 @login_required
 def logout():
+    invalidate_user_cache(current_user.id)
     logout_user()
     return jsonify({"success": True, "message": "Logged out.", "redirect": url_for("login_page")})
 
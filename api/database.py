@@ -6,14 +6,16 @@ and importing SQL files back into the database. Admin-only!!!
 for all operations to maintain data integrity and security.
 """
 
-from flask import Blueprint, jsonify, request, send_file
-from flask_login import login_required, current_user
+from flask import Blueprint, current_app, jsonify, request, send_file
+from flask_login import login_required
 import os
 import subprocess
+import time
 from datetime import datetime
 from utils.database import DB_CONFIG
 from utils.db_helpers import db_connection
 from utils.activity_logger import log_activity
+from services.applicant_service import invalidate_applicant_cache
 from utils.permissions import require_admin
 
 database_api = Blueprint("database_api", __name__)
@@ -196,11 +198,10 @@ def import_database():
                 }), 500
 
         if result.stderr and result.stderr.strip():
-            print(f"Import warnings: {result.stderr.strip()}")
+            current_app.logger.warning("Import warnings: %s", result.stderr.strip())
 
         # Ensure transaction is committed by creating a new connection and verifying data
         try:
-            import time
             time.sleep(0.5)  # Brief pause to ensure transaction is fully committed
 
             # Verify import by checking if applicant_info has data
@@ -221,6 +222,8 @@ def import_database():
                 "message": f"Import verification failed: {str(verify_error)}"
             }), 500
 
+        invalidate_applicant_cache()
+
         # Log successful import
         log_activity(
             action_type="database_import",
@@ -6,7 +6,7 @@ CSV streaming stays here as an HTTP concern.
 
 from flask import Blueprint, jsonify, request
 from flask_login import login_required, current_user
-from utils.csv_helpers import create_csv_response, generate_export_filename
+from utils.csv_helpers import create_csv_stream_response, generate_export_filename
 from services.log_service import LogService
 
 logs_api = Blueprint("logs_api", __name__)
@@ -45,8 +45,9 @@ def export_status_changes():
     try:
         user_ids_param = request.args.get("user_ids", "")
         user_ids = [int(uid) for uid in user_ids_param.split(",") if uid.strip().isdigit()]
-        rows = _service.export_status_changes(user_ids or None)
-        filename = generate_export_filename("status_change_logs", len(rows))
-        return create_csv_response(rows, filename, _STATUS_CHANGE_FIELDNAMES)
+        count = _service.count_status_changes(user_ids or None)
+        filename = generate_export_filename("status_change_logs", count)
+        rows = _service.iter_status_changes(user_ids or None)
+        return create_csv_stream_response(rows, filename, _STATUS_CHANGE_FIELDNAMES)
     except Exception as e:
         return jsonify({"success": False, "message": str(e)}), 500
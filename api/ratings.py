@@ -36,7 +36,7 @@ def get_my_ratings(user_code):
 @require_faculty_or_admin
 def add_or_update_ratings(user_code):
     """Add or update a rating (Admin/Faculty only)."""
-    data = request.get_json() or {}
+    data = request.get_json(silent=True) or {}
     try:
         message = _service.upsert_rating(
             user_code,
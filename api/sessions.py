@@ -35,7 +35,7 @@ def get_sessions_route():
 @require_super_admin
 def create_session_route():
     """Create a new academic session (Super Admin only)."""
-    data = request.get_json()
+    data = request.get_json(silent=True)
     if not data:
         return jsonify({"success": False, "message": "No data provided"}), 400
     try:
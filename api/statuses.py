@@ -39,7 +39,7 @@ def create_status_route():
     """Create a new status (Admin only)."""
     if not current_user.is_admin:
         return jsonify({"success": False, "message": "Access denied. Admin privileges required."}), 403
-    data = request.get_json()
+    data = request.get_json(silent=True)
     if not data:
         return jsonify({"success": False, "message": "Invalid request data"}), 400
     try:
@@ -62,7 +62,7 @@ def update_status_route(status_id):
     """Update a status (Admin only)."""
     if not current_user.is_admin:
         return jsonify({"success": False, "message": "Access denied. Admin privileges required."}), 403
-    data = request.get_json()
+    data = request.get_json(silent=True)
     if not data:
         return jsonify({"success": False, "message": "Invalid request data"}), 400
     try:
@@ -102,7 +102,7 @@ def reorder_statuses_route():
     """Batch update display_order (Admin only)."""
     if not current_user.is_admin:
         return jsonify({"success": False, "message": "Access denied. Admin privileges required."}), 403
-    data = request.get_json() or {}
+    data = request.get_json(silent=True) or {}
     try:
         message = _service.reorder_statuses(data.get("statuses", []), current_user)
         return jsonify({"success": True, "message": message})
@@ -1,8 +1,8 @@
 from flask import Blueprint, request, jsonify
-from flask_login import login_required
 from utils.permissions import require_admin
 from models.test_scores import save_duolingo_score
-from datetime import datetime
+from services.applicant_service import invalidate_applicant_cache
+from datetime import date, datetime
 
 # Create a Blueprint for test scores API routes
 test_scores_api = Blueprint("test_scores_api", __name__)
@@ -20,7 +20,7 @@ def save_duolingo_score_route(user_code):
     @param description: Test description or notes (JSON body, optional)
     @param date_written: Test date in YYYY-MM-DD format (JSON body, optional)
     """
-    data = request.get_json()
+    data = request.get_json(silent=True)
     if not data:
         return jsonify({"success": False, "message": "Invalid request data"}), 400
 
@@ -41,14 +41,15 @@ def save_duolingo_score_route(user_code):
     parsed_date = None
     if date_written:
         try:
-            parsed_date = datetime.strptime(date_written, "%Y-%m-%d").date()
-            if parsed_date > datetime.now().date():
+            parsed_date = date.fromisoformat(date_written)
+            if parsed_date > date.today():
                 return jsonify({"success": False, "message": "Date cannot be in the future"}), 400
         except ValueError:
             return jsonify({"success": False, "message": "Invalid date format"}), 400
 
     try:
         save_duolingo_score(user_code, score, description, parsed_date, datetime.now())
+        invalidate_applicant_cache(user_code)
         return jsonify({"success": True, "message": "Duolingo score saved successfully"})
     except Exception as e:
         return jsonify({"success": False, "message": f"Database error: {str(e)}"}), 500
@@ -8,13 +8,24 @@ session management, and handles application startup including database
 initialization. This serves as the central hub for the entire web application.
 """
 
-from flask import Flask, render_template, redirect, url_for, session, request
+from functools import lru_cache
+from flask import Flask, render_template, redirect, request, send_from_directory
+from flask_compress import Compress
 from flask_cors import CORS
-from flask_login import LoginManager, login_required, current_user
+from flask_login import LoginManager, login_required
+from jinja2.utils import LRUCache
+from types import MappingProxyType
+import logging
 import os
+import re
 
 # Import database initialization
-from utils.database import init_database
+from utils.database import init_database, warm_db_pool
+from utils.json_provider import OrjsonProvider
+from utils.permissions import cached_url, require_admin_page, require_super_admin_page
+
+# Cached user lookup for Flask-Login
+from services.auth_service import load_session_user
 
 # Import API blueprints
 from api.applicants import applicants_api
@@ -27,28 +38,37 @@ from api.database import database_api
 from api.statuses import statuses_bp
 from api.documents import documents_bp
 
-# Import user model for Flask-Login
-from models.users import get_user_by_id
+API_BLUEPRINTS = (
+    applicants_api, auth_api, sessions_api, ratings_api, logs_api,
+    test_scores_api, database_api, statuses_bp, documents_bp,
+)
 
-app = Flask(__name__)
-CORS(app)
+# Session and security settings, read from the environment once per process
+SESSION_CONFIG = MappingProxyType({
+    "SECRET_KEY": os.getenv("SECRET_KEY", "your-secret-key-change-this-in-production"),
+    "PERMANENT_SESSION_LIFETIME": 86400 * 30,  # 30 days
+    "SESSION_COOKIE_SECURE": False,  # Set to True in production with HTTPS
+    "SESSION_COOKIE_HTTPONLY": True,
+    "SESSION_COOKIE_SAMESITE": "Lax",
+})
 
-# Configure session and security
-app.config["SECRET_KEY"] = os.getenv(
-    "SECRET_KEY", "your-secret-key-change-this-in-production"
-)
-app.config["PERMANENT_SESSION_LIFETIME"] = 86400 * 30  # 30 days
-app.config["SESSION_COOKIE_SECURE"] = False  # Set to True in production with HTTPS
-app.config["SESSION_COOKIE_HTTPONLY"] = True
-app.config["SESSION_COOKIE_SAMESITE"] = "Lax"
+# Static files are cached by browsers for 1 year; they are cache-busted by
+# changing the filename or adding query params when updated
+STATIC_MAX_AGE = 31536000
+
+
+class MDSFlask(Flask):
+    """Flask app whose static handler sets the long-lived Cache-Control itself."""
+
+    def send_static_file(self, filename):
+        # Only the static endpoint gets the long max_age (SEND_FILE_MAX_AGE_DEFAULT
+        # would also apply to document downloads and backups); conditional
+        # requests get 304s from send_from_directory
+        return send_from_directory(self.static_folder, filename, max_age=STATIC_MAX_AGE)
 
-# File upload configuration
-app.config["UPLOAD_FOLDER"] = os.path.join(os.path.dirname(os.path.abspath(__file__)), "uploads", "documents")
-app.config["MAX_CONTENT_LENGTH"] = 30 * 1024 * 1024  # 30MB max file size (documents)
 
-# Initialize Flask-Login
+# Flask-Login is configured once per process and attached in create_app()
 login_manager = LoginManager()
-login_manager.init_app(app)
 login_manager.login_view = "login_page"
 login_manager.login_message = "Please log in to access this page."
 login_manager.login_message_category = "info"
@@ -56,106 +76,188 @@ login_manager.login_message_category = "info"
 
 @login_manager.user_loader
 def load_user(user_id):
-    return get_user_by_id(int(user_id))
-
-
-# Register API blueprints
-app.register_blueprint(applicants_api, url_prefix="/api")
-app.register_blueprint(auth_api, url_prefix="/api/auth")
-app.register_blueprint(sessions_api, url_prefix="/api")
-app.register_blueprint(ratings_api, url_prefix="/api")
-app.register_blueprint(logs_api, url_prefix="/api")
-app.register_blueprint(test_scores_api, url_prefix="/api")
-app.register_blueprint(database_api, url_prefix="/api")
-app.register_blueprint(statuses_bp)
-app.register_blueprint(documents_bp)
-
-
-# Web routes (that render templates)
-@app.route("/")
-@login_required
-def index():
-    """Serve the main HTML page (protected)"""
-    return render_template("index.html")
-
-
-@app.route("/login")
-def login_page():
-    """Serve the login page"""
-    return render_template("login.html")
-
-@app.route ("/statistics")
-@login_required
-def statistics_page():
-    "Serve as the stats page for admin users"
-    return render_template("statistics.html")
-
-    
-@app.route("/dashboard")
-@login_required
-def dashboard():
-    """Dashboard page (same as index for now)"""
-    return redirect(url_for("index"))
-
-
-@app.route("/create-new-session")
-@login_required
-def create_new_session_page():
-    """Create new session page (Super Admin only)"""
-    if not current_user.is_authenticated or not current_user.is_super_admin:
-        return redirect(url_for("index"))
-    return render_template("create-session.html")
-
-
-@app.route("/logs")
-@login_required
-def logs_page():
-    """Activity logs page (Admin only)"""
-    if not current_user.is_authenticated or not current_user.is_admin:
-        return redirect(url_for("index"))  # Redirect non-admin users to main page
-    return render_template("logs.html")
-
-
-@app.route("/status-config")
-@login_required
-def status_config_page():
-    """Status configuration page (Admin only)"""
-    if not current_user.is_authenticated or not current_user.is_admin:
-        return redirect(url_for("index"))  # Redirect non-admin users to main page
-    return render_template("status-config.html")
-
-
-# Error handlers
-@app.errorhandler(401)
-def unauthorized(error):
-    return redirect(url_for("login_page"))
-
-
-# Cache headers for static files
-@app.after_request
-def add_cache_headers(response):
-    """Add cache headers for static files to improve performance"""
-    if request.path.startswith('/static/'):
-        # Cache static files for 1 year (browser will use cached version)
-        # Files are cache-busted by changing the filename or adding query params when updated
-        response.headers['Cache-Control'] = 'public, max-age=31536000'
-    return response
-
-@app.route('/account')
-@login_required
-def account():
-    return render_template('account.html')
-@app.route('/users')
-@login_required
-def users_page():
-    """Render the users management page (Admin only)"""
-    if not current_user.is_admin:
-        return "Access Denied - Admin Only", 403
-    return render_template('users.html')
+    return load_session_user(int(user_id))
+
+
+# Elements whose contents are left untouched by _minify_html
+_HTML_PRESERVE_RE = re.compile(r"<(pre|textarea|script)\b.*?</\1\s*>", re.S | re.I)
+_HTML_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+_HTML_LINE_SPACE_RE = re.compile(r"\s*\n\s*")
+
+
+def _squeeze_html(text):
+    return _HTML_LINE_SPACE_RE.sub("\n", _HTML_COMMENT_RE.sub("", text))
+
+
+def _minify_html(html):
+    """
+    Drop HTML comments and indentation from rendered page HTML.
+
+    Whitespace runs spanning a line break collapse to a single newline, which
+    renders the same; <pre>, <textarea> and <script> bodies are kept verbatim.
+
+    @param html: Rendered HTML string
+    @return: Minified HTML string
+    """
+    parts = []
+    pos = 0
+    for match in _HTML_PRESERVE_RE.finditer(html):
+        parts.append(_squeeze_html(html[pos:match.start()]))
+        parts.append(match.group(0))
+        pos = match.end()
+    parts.append(_squeeze_html(html[pos:]))
+    return "".join(parts)
+
+
+@lru_cache(maxsize=None)
+def create_app():
+    """
+    Build and configure the Flask application.
+
+    Memoized, so wsgi.py, scripts and any test session that call it more than
+    once share a single app instead of re-running setup and re-registering
+    every blueprint.
+
+    @return: Configured Flask application
+    @return_type: flask.Flask
+    """
+    app = MDSFlask(__name__)
+    app.json = OrjsonProvider(app)
+    app.logger.setLevel(logging.INFO)
+
+    # Configure session and security
+    app.config.update(SESSION_CONFIG)
+
+    # File upload configuration
+    app.config["UPLOAD_FOLDER"] = os.path.join(os.path.dirname(os.path.abspath(__file__)), "uploads", "documents")
+    app.config["MAX_CONTENT_LENGTH"] = 30 * 1024 * 1024  # 30MB max file size (documents)
+
+    # Templates are compiled once and kept; no per-render stat() of the source files
+    app.config["TEMPLATES_AUTO_RELOAD"] = False
+    app.jinja_env.auto_reload = False
+    template_count = len(os.listdir(os.path.join(app.root_path, app.template_folder)))
+    app.jinja_env.cache = LRUCache(max(template_count * 2, 16))
+
+    # Response compression (Brotli preferred, gzip fallback) for JSON payloads
+    # and pages. Page HTML is cached minified (render_page) but is still
+    # compressed on every response.
+    # Flask-Compress would buffer a streamed body whole before compressing it,
+    # so streams are left alone here and gzip themselves chunk by chunk
+    # (see api.applicants.get_applicants).
+    app.config["COMPRESS_STREAMS"] = False
+    app.config["COMPRESS_MIMETYPES"] = ["application/json", "text/html"]
+    app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+    app.config["COMPRESS_LEVEL"] = 5
+    app.config["COMPRESS_BR_LEVEL"] = 5
+    app.config["COMPRESS_MIN_SIZE"] = 512
+    Compress(app)
+
+    # CORS is scoped to the API blueprints; server-rendered pages and static
+    # files skip it. It must be attached before the blueprints are registered.
+    for blueprint in API_BLUEPRINTS:
+        CORS(blueprint)
+
+    # Register API blueprints
+    app.register_blueprint(applicants_api, url_prefix="/api")
+    app.register_blueprint(auth_api, url_prefix="/api/auth")
+    app.register_blueprint(sessions_api, url_prefix="/api")
+    app.register_blueprint(ratings_api, url_prefix="/api")
+    app.register_blueprint(logs_api, url_prefix="/api")
+    app.register_blueprint(test_scores_api, url_prefix="/api")
+    app.register_blueprint(database_api, url_prefix="/api")
+    app.register_blueprint(statuses_bp)
+    app.register_blueprint(documents_bp)
+
+    # Attach Flask-Login once the blueprints are in place
+    login_manager.init_app(app)
+
+    # Rendered page HTML keyed by (script_root, template). The page templates only
+    # use url_for('static', ...) and include header.html, so their output is the
+    # same for every request and can be rendered (and minified) once and served
+    # as bytes.
+    rendered_pages = {}
+
+    def render_page(template_name):
+        """Serve a page template, rendering and minifying it on first use and caching the bytes."""
+        key = (request.script_root, template_name)
+        body = rendered_pages.get(key)
+        if body is None:
+            html = _minify_html(render_template(template_name))
+            body = rendered_pages[key] = html.encode("utf-8")
+        return app.response_class(body, mimetype="text/html")
+
+    # Web routes (that render templates)
+    @app.route("/")
+    @login_required
+    def index():
+        """Serve the main HTML page (protected)"""
+        return render_page("index.html")
+
+    @app.route("/login")
+    def login_page():
+        """Serve the login page"""
+        return render_page("login.html")
+
+    @app.route("/statistics")
+    @login_required
+    def statistics_page():
+        "Serve as the stats page for admin users"
+        return render_page("statistics.html")
+
+    @app.route("/dashboard")
+    @login_required
+    def dashboard():
+        """Dashboard page (same as index for now)"""
+        return redirect(cached_url("index"))
+
+    @app.route("/create-new-session")
+    @login_required
+    @require_super_admin_page
+    def create_new_session_page():
+        """Create new session page (Super Admin only)"""
+        return render_page("create-session.html")
+
+    @app.route("/logs")
+    @login_required
+    @require_admin_page
+    def logs_page():
+        """Activity logs page (Admin only)"""
+        return render_page("logs.html")
+
+    @app.route("/status-config")
+    @login_required
+    @require_admin_page
+    def status_config_page():
+        """Status configuration page (Admin only)"""
+        return render_page("status-config.html")
+
+    @app.route('/account')
+    @login_required
+    def account():
+        return render_page("account.html")
+
+    @app.route('/users')
+    @login_required
+    @require_admin_page
+    def users_page():
+        """Render the users management page (Admin only)"""
+        return render_page("users.html")
+
+    # Error handlers
+    @app.errorhandler(401)
+    def unauthorized(error):
+        return redirect(cached_url("login_page"))
+
+    return app
+
+
+app = create_app()
 
 if __name__ == "__main__":
     # Only initialize database if not in reloader process
     if os.environ.get("WERKZEUG_RUN_MAIN") != "true":
-        init_database()
+        init_database(lazy=True)
 
+    # Open the pooled DB connections at startup rather than on the first requests
+    warm_db_pool()
     app.run(debug=False)
@@ -10,14 +10,17 @@ Usage:
 
 # Core CRUD operations
 from .core import (
+    VERSION_CONFLICT_MESSAGE,
     convert_id_to_string,
     get_all_applicant_status,
+    iter_all_applicant_status,
     get_all_sessions,
     get_applicant_info_by_code,
     get_applicant_test_scores_by_code,
     get_applicant_institutions_by_code,
     get_applicant_application_info_by_code,
     update_applicant_application_status,
+    bulk_update_application_status,
     update_applicant_prerequisites,
     update_applicant_scholarship,
     update_english_comment,
@@ -27,6 +30,7 @@ from .core import (
 
 # CSV processing
 from .csv_processing import (
+    CSV_CHUNK_ROWS,
     process_csv_data,
     calculate_age,
     create_or_get_sessions,
@@ -37,6 +41,7 @@ from .csv_processing import (
 # English status computation
 from .english_status import (
     compute_english_status,
+    compute_english_status_bulk,
     compute_english_status_for_all,
 )
 
@@ -48,20 +53,24 @@ from .export import (
 
 __all__ = [
     # Core
+    'VERSION_CONFLICT_MESSAGE',
     'convert_id_to_string',
     'get_all_applicant_status',
+    'iter_all_applicant_status',
     'get_all_sessions',
     'get_applicant_info_by_code',
     'get_applicant_test_scores_by_code',
     'get_applicant_institutions_by_code',
     'get_applicant_application_info_by_code',
     'update_applicant_application_status',
+    'bulk_update_application_status',
     'update_applicant_prerequisites',
     'update_applicant_scholarship',
     'update_english_comment',
     'update_english_status',
     'clear_all_applicant_data',
     # CSV processing
+    'CSV_CHUNK_ROWS',
     'process_csv_data',
     'calculate_age',
     'create_or_get_sessions',
@@ -69,6 +78,7 @@ __all__ = [
     'process_application_info',
     # English status
     'compute_english_status',
+    'compute_english_status_bulk',
     'compute_english_status_for_all',
     # Export
     'get_selected_applicants_for_export',
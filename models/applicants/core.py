@@ -5,7 +5,13 @@ This module contains the basic CRUD operations for applicants including
 retrieval of applicant data, status, test scores, and institutions.
 """
 
-from utils.db_helpers import db_connection, db_transaction
+import json
+from decimal import Decimal
+
+from psycopg2.errors import ForeignKeyViolation
+from psycopg2.extras import execute_values
+
+from utils.db_helpers import db_connection, db_transaction, fetchall_dicts, stream_rows
 
 
 def convert_id_to_string(value):
@@ -18,6 +24,59 @@ def convert_id_to_string(value):
     return str(value)
 
 
+def _build_applicant_status_query(session_id=None):
+    """Build the applicant list query and its parameters."""
+    query = """
+        SELECT
+            ss.user_code,
+            si.family_name,
+            si.given_name,
+            si.email,
+            ss.student_number,
+            ss.app_start,
+            ss.submit_date,
+            ss.status_code,
+            ss.status,
+            ss.detail_status,
+            ss.updated_at,
+            rt.overall_rating,
+            ai.sent as review_status,
+            latest_log.created_at as review_status_updated_at,
+            CASE WHEN ai.canadian = true THEN 'Yes' ELSE 'No' END as canadian,
+            si.gender,
+            si.country_citizenship as citizenship_country,
+            si.visa_type_code as visa,
+            si.session_id
+        FROM applicant_status ss
+        LEFT JOIN applicant_info si ON ss.user_code = si.user_code
+        LEFT JOIN application_info ai ON ss.user_code = ai.user_code
+        LEFT JOIN LATERAL(
+            SELECT ROUND(AVG(rating), 2) AS overall_rating
+            FROM ratings
+            WHERE user_code = ss.user_code
+        ) rt ON true
+        LEFT JOIN LATERAL(
+            SELECT created_at
+            FROM activity_log
+            WHERE action_type = 'status_change'
+            AND target_id = ss.user_code
+            ORDER BY created_at DESC
+            LIMIT 1
+        ) latest_log ON true
+    """
+
+    params = []
+    if session_id is not None:
+        query += " WHERE si.session_id = %s"
+        params.append(session_id)
+
+    query += """
+        ORDER BY ss.submit_date DESC, si.family_name
+    """
+
+    return query, tuple(params) if params else None
+
+
 def get_all_applicant_status(session_id=None):
     """
     Get all applicants with their status and basic information.
@@ -26,68 +85,34 @@ def get_all_applicant_status(session_id=None):
     @return: Tuple of (applicants_list, error_message)
     """
     try:
-        with db_connection() as (conn, cursor):
-            query = """
-                SELECT
-                    ss.user_code,
-                    si.family_name,
-                    si.given_name,
-                    si.email,
-                    ss.student_number,
-                    ss.app_start,
-                    ss.submit_date,
-                    ss.status_code,
-                    ss.status,
-                    ss.detail_status,
-                    ss.updated_at,
-                    EXTRACT(EPOCH FROM (NOW() - ss.updated_at)) as seconds_since_update,
-                    ROUND(AVG(r.rating), 2) as overall_rating,
-                    ai.sent as review_status,
-                    latest_log.created_at as review_status_updated_at,
-                    CASE WHEN ai.canadian = true THEN 'Yes' ELSE 'No' END as canadian,
-                    si.gender,
-                    si.country_citizenship as citizenship_country,
-                    si.visa_type_code as visa,
-                    si.session_id
-                FROM applicant_status ss
-                LEFT JOIN applicant_info si ON ss.user_code = si.user_code
-                LEFT JOIN ratings r ON ss.user_code = r.user_code
-                LEFT JOIN application_info ai ON ss.user_code = ai.user_code
-                LEFT JOIN LATERAL(
-                    SELECT created_at
-                    FROM activity_log
-                    WHERE action_type = 'status_change'
-                    AND target_id = ss.user_code
-                    ORDER BY created_at DESC
-                    LIMIT 1
-                ) latest_log ON true
-            """
-
-            params = []
-            if session_id is not None:
-                query += " WHERE si.session_id = %s"
-                params.append(session_id)
-
-            query += """
-                GROUP BY ss.user_code, si.family_name, si.given_name, si.email,
-                         ss.student_number, ss.app_start, ss.submit_date,
-                         ss.status_code, ss.status, ss.detail_status, ss.updated_at,
-                         ai.sent, ai.canadian, si.gender, si.country_citizenship, si.visa_type_code,
-                         latest_log.created_at, si.session_id
-                ORDER BY ss.submit_date DESC, si.family_name
-            """
-
-            if params:
-                cursor.execute(query, tuple(params))
-            else:
-                cursor.execute(query)
-
-            return cursor.fetchall(), None
+        with db_connection(cursor_factory=None) as (conn, cursor):
+            query, params = _build_applicant_status_query(session_id)
+            cursor.execute(query, params)
+            return fetchall_dicts(cursor), None
 
     except Exception as e:
         return None, f"Database error: {str(e)}"
 
 
+# Rows pulled per round-trip when streaming the applicant list; the rows are
+# narrow, so larger batches cut round-trips at little memory cost
+APPLICANT_STREAM_ITERSIZE = 2000
+
+
+def iter_all_applicant_status(session_id=None):
+    """
+    Lazily yield applicants with their status and basic information.
+
+    Same rows as get_all_applicant_status(), read through a server-side
+    cursor so the full result set is never held in memory.
+
+    @param session_id: Optional session ID to filter applicants by session
+    @yields: One applicant dict per row
+    """
+    query, params = _build_applicant_status_query(session_id)
+    yield from stream_rows(query, params, itersize=APPLICANT_STREAM_ITERSIZE)
+
+
 def get_all_sessions():
     """Get all academic sessions with applicant counts."""
     try:
@@ -140,43 +165,44 @@ def get_applicant_info_by_code(user_code):
         return None, f"Database error: {str(e)}"
 
 
+# Tables read by get_applicant_test_scores_by_code; TOEFL and IELTS can hold
+# several attempts per applicant, the others at most one row
+_MULTI_ROW_TESTS = {"toefl": "toefl_number", "ielts": "ielts_number"}
+_SINGLE_ROW_TESTS = ("melab", "pte", "cael", "celpip", "duolingo", "alt_elpp", "gre", "gmat")
+
+# Every test table for one applicant in a single round-trip, as (test, num, data)
+# rows. data is the row as JSON text, decoded with Decimal numbers so scores
+# serialize as before; dates come back as ISO strings.
+_APPLICANT_TESTS_QUERY = "\nUNION ALL\n".join(
+    [
+        f"SELECT '{test}' AS test, t.{num} AS num, row_to_json(t)::text AS data "
+        f"FROM {test} t WHERE t.user_code = %(user_code)s"
+        for test, num in _MULTI_ROW_TESTS.items()
+    ]
+    + [
+        f"SELECT '{test}', 0, row_to_json(t)::text FROM {test} t WHERE t.user_code = %(user_code)s"
+        for test in _SINGLE_ROW_TESTS
+    ]
+) + "\nORDER BY test, num"
+
+
 def get_applicant_test_scores_by_code(user_code):
     """Get all test scores for an applicant by user code."""
     try:
         with db_connection() as (conn, cursor):
-            test_scores = {}
-
-            cursor.execute("SELECT * FROM toefl WHERE user_code = %s ORDER BY toefl_number", (user_code,))
-            test_scores["toefl"] = cursor.fetchall()
-
-            cursor.execute("SELECT * FROM ielts WHERE user_code = %s ORDER BY ielts_number", (user_code,))
-            test_scores["ielts"] = cursor.fetchall()
-
-            cursor.execute("SELECT * FROM melab WHERE user_code = %s", (user_code,))
-            test_scores["melab"] = cursor.fetchone()
-
-            cursor.execute("SELECT * FROM pte WHERE user_code = %s", (user_code,))
-            test_scores["pte"] = cursor.fetchone()
-
-            cursor.execute("SELECT * FROM cael WHERE user_code = %s", (user_code,))
-            test_scores["cael"] = cursor.fetchone()
-
-            cursor.execute("SELECT * FROM celpip WHERE user_code = %s", (user_code,))
-            test_scores["celpip"] = cursor.fetchone()
-
-            cursor.execute("SELECT * FROM duolingo WHERE user_code = %s", (user_code,))
-            test_scores["duolingo"] = cursor.fetchone()
-
-            cursor.execute("SELECT * FROM alt_elpp WHERE user_code = %s", (user_code,))
-            test_scores["alt_elpp"] = cursor.fetchone()
-
-            cursor.execute("SELECT * FROM gre WHERE user_code = %s", (user_code,))
-            test_scores["gre"] = cursor.fetchone()
-
-            cursor.execute("SELECT * FROM gmat WHERE user_code = %s", (user_code,))
-            test_scores["gmat"] = cursor.fetchone()
+            cursor.execute(_APPLICANT_TESTS_QUERY, {"user_code": user_code})
+            rows = cursor.fetchall()
+
+        test_scores = {test: [] for test in _MULTI_ROW_TESTS}
+        test_scores.update(dict.fromkeys(_SINGLE_ROW_TESTS))
+        for row in rows:
+            data = json.loads(row["data"], parse_float=Decimal)
+            if row["test"] in _MULTI_ROW_TESTS:
+                test_scores[row["test"]].append(data)
+            else:
+                test_scores[row["test"]] = data
 
-            return test_scores, None
+        return test_scores, None
 
     except Exception as e:
         return None, f"Database error: {str(e)}"
@@ -212,7 +238,7 @@ def get_applicant_application_info_by_code(user_code):
                     user_code, sent, full_name, canadian, english,
                     cs, stat, math, additional_comments, gpa, highest_degree, degree_area,
                     mds_v, mds_cl, mds_o, scholarship,
-                    english_status, english_description, english_comment
+                    english_status, english_description, english_comment, version
                 FROM application_info
                 WHERE user_code = %s
             """, (user_code,))
@@ -223,130 +249,199 @@ def get_applicant_application_info_by_code(user_code):
 
 
 def update_applicant_application_status(user_code, status):
-    """Update applicant status in application_info table."""
+    """
+    Update applicant status in application_info table.
+
+    @return: Tuple of (success, message, version) — version is the row's new
+             application_info.version, None on failure
+    """
     try:
         with db_transaction() as (conn, cursor):
-            cursor.execute(
-                "UPDATE application_info SET sent = %s WHERE user_code = %s",
-                (status, user_code),
-            )
-
-            if cursor.rowcount == 0:
-                cursor.execute(
-                    "INSERT INTO application_info (user_code, sent) VALUES (%s, %s)",
-                    (user_code, status),
-                )
+            cursor.execute("""
+                INSERT INTO application_info (user_code, sent) VALUES (%s, %s)
+                ON CONFLICT (user_code) DO UPDATE
+                SET sent = EXCLUDED.sent, version = application_info.version + 1
+                RETURNING version
+            """, (user_code, status))
+            version = cursor.fetchone()["version"]
 
-        return True, "Status updated successfully"
+        return True, "Status updated successfully", version
 
     except Exception as e:
-        return False, f"Database error: {str(e)}"
+        return False, f"Database error: {str(e)}", None
 
 
-def update_applicant_prerequisites(user_code, cs, stat, math, gpa=None, additional_comments=None, mds_v=None, mds_cl=None, mds_o=None):
-    """Update applicant prerequisites in application_info table."""
-    try:
-        with db_transaction() as (conn, cursor):
-            # Validate user_code exists
-            cursor.execute("SELECT user_code FROM applicant_info WHERE user_code = %s", (user_code,))
-            if not cursor.fetchone():
-                return False, "Applicant not found"
+def bulk_update_application_status(items):
+    """
+    Set application_info.sent for many applicants with batched upserts.
 
-            cursor.execute("""
-                UPDATE application_info
-                SET cs = %s, stat = %s, math = %s, gpa = %s, additional_comments = %s,
-                    mds_v = %s, mds_cl = %s, mds_o = %s
-                WHERE user_code = %s
-            """, (cs, stat, math, gpa, additional_comments, mds_v, mds_cl, mds_o, user_code))
+    Same effect as calling update_applicant_application_status for each pair
+    (applicants without an application_info row get one), but in a single
+    transaction sending 500 applicants per statement.
 
-            if cursor.rowcount == 0:
-                cursor.execute("""
-                    INSERT INTO application_info (user_code, cs, stat, math, gpa, additional_comments, mds_v, mds_cl, mds_o)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (user_code, cs, stat, math, gpa, additional_comments,
-                      mds_v or 'No', mds_cl or 'No', mds_o or 'Yes'))
+    @param items: List of (user_code, status) tuples
+    @return: Tuple of (success, message)
+    """
+    # A repeated applicant keeps its last status; ON CONFLICT can't see a key twice
+    rows = list(dict(items).items())
+    if not rows:
+        return True, "No statuses to update"
 
-        return True, "Prerequisites updated successfully"
+    try:
+        with db_transaction() as (conn, cursor):
+            execute_values(
+                cursor,
+                """
+                INSERT INTO application_info (user_code, sent) VALUES %s
+                ON CONFLICT (user_code) DO UPDATE
+                SET sent = EXCLUDED.sent, version = application_info.version + 1
+                """,
+                rows,
+                page_size=500,
+            )
+
+        return True, f"Updated status for {len(rows)} applicants"
 
     except Exception as e:
         return False, f"Database error: {str(e)}"
 
 
-def update_applicant_scholarship(user_code, scholarship):
-    """Update scholarship decision for an applicant."""
-    try:
-        with db_transaction() as (conn, cursor):
-            cursor.execute("SELECT user_code FROM applicant_info WHERE user_code = %s", (user_code,))
-            if not cursor.fetchone():
-                return False, "Applicant not found"
+# Reply when an edit carried an expected_version that is no longer current
+VERSION_CONFLICT_MESSAGE = "Conflict: this applicant was changed by someone else, refresh and retry"
 
-            cursor.execute(
-                "UPDATE application_info SET scholarship = %s WHERE user_code = %s",
-                (scholarship, user_code),
-            )
+# Appended to the reviewer-edit upserts: bumps application_info.version and,
+# when an expected version is given, only updates a row still at that version.
+# No row comes back on a mismatch.
+_VERSIONED_UPDATE = """
+    , version = application_info.version + 1
+    WHERE %(expected_version)s::int IS NULL OR application_info.version = %(expected_version)s
+    RETURNING version
+"""
 
-            if cursor.rowcount == 0:
-                cursor.execute(
-                    "INSERT INTO application_info (user_code, scholarship) VALUES (%s, %s)",
-                    (user_code, scholarship),
-                )
 
-        return True, "Scholarship decision updated successfully"
+def update_applicant_prerequisites(user_code, cs, stat, math, gpa=None, additional_comments=None,
+                                   mds_v=None, mds_cl=None, mds_o=None, expected_version=None):
+    """
+    Update applicant prerequisites in application_info table.
 
+    @param expected_version: application_info.version the edit was based on;
+                             None skips the concurrent-edit check
+    @return: Tuple of (success, message, version) — version is the row's new
+             application_info.version, None on failure or conflict
+    """
+    try:
+        with db_transaction() as (conn, cursor):
+            # New rows default the MDS flags; existing rows take them as given
+            cursor.execute("""
+                INSERT INTO application_info (user_code, cs, stat, math, gpa, additional_comments, mds_v, mds_cl, mds_o)
+                VALUES (%(user_code)s, %(cs)s, %(stat)s, %(math)s, %(gpa)s, %(additional_comments)s,
+                        %(new_mds_v)s, %(new_mds_cl)s, %(new_mds_o)s)
+                ON CONFLICT (user_code) DO UPDATE
+                SET cs = EXCLUDED.cs, stat = EXCLUDED.stat, math = EXCLUDED.math, gpa = EXCLUDED.gpa,
+                    additional_comments = EXCLUDED.additional_comments,
+                    mds_v = %(mds_v)s, mds_cl = %(mds_cl)s, mds_o = %(mds_o)s
+            """ + _VERSIONED_UPDATE, {
+                "user_code": user_code, "cs": cs, "stat": stat, "math": math, "gpa": gpa,
+                "additional_comments": additional_comments,
+                "new_mds_v": mds_v or 'No', "new_mds_cl": mds_cl or 'No', "new_mds_o": mds_o or 'Yes',
+                "mds_v": mds_v, "mds_cl": mds_cl, "mds_o": mds_o,
+                "expected_version": expected_version,
+            })
+            row = cursor.fetchone()
+            if row is None:
+                return False, VERSION_CONFLICT_MESSAGE, None
+
+        return True, "Prerequisites updated successfully", row["version"]
+
+    except ForeignKeyViolation:
+        return False, "Applicant not found", None
     except Exception as e:
-        return False, f"Database error: {str(e)}"
+        return False, f"Database error: {str(e)}", None
 
 
-def update_english_comment(user_code, english_comment):
-    """Update English comment for applicant in application_info table."""
+def update_applicant_scholarship(user_code, scholarship):
+    """
+    Update scholarship decision for an applicant.
+
+    @return: See update_applicant_application_status
+    """
     try:
         with db_transaction() as (conn, cursor):
-            cursor.execute("SELECT user_code FROM applicant_info WHERE user_code = %s", (user_code,))
-            if not cursor.fetchone():
-                return False, "Applicant not found"
-
-            cursor.execute(
-                "UPDATE application_info SET english_comment = %s WHERE user_code = %s",
-                (english_comment, user_code),
-            )
-
-            if cursor.rowcount == 0:
-                cursor.execute(
-                    "INSERT INTO application_info (user_code, english_comment) VALUES (%s, %s)",
-                    (user_code, english_comment),
-                )
+            cursor.execute("""
+                INSERT INTO application_info (user_code, scholarship) VALUES (%s, %s)
+                ON CONFLICT (user_code) DO UPDATE
+                SET scholarship = EXCLUDED.scholarship, version = application_info.version + 1
+                RETURNING version
+            """, (user_code, scholarship))
+            version = cursor.fetchone()["version"]
 
-        return True, "English comment updated successfully"
+        return True, "Scholarship decision updated successfully", version
 
+    except ForeignKeyViolation:
+        return False, "Applicant not found", None
     except Exception as e:
-        return False, f"Database error: {str(e)}"
+        return False, f"Database error: {str(e)}", None
+
 
+def update_english_comment(user_code, english_comment, expected_version=None):
+    """
+    Update English comment for applicant in application_info table.
 
-def update_english_status(user_code, english_status):
-    """Update English status for applicant in application_info table."""
+    @param expected_version: See update_applicant_prerequisites
+    @return: See update_applicant_prerequisites
+    """
     try:
         with db_transaction() as (conn, cursor):
-            cursor.execute("SELECT user_code FROM applicant_info WHERE user_code = %s", (user_code,))
-            if not cursor.fetchone():
-                return False, "Applicant not found"
-
-            english_boolean = english_status in ["Passed", "Not Required"]
+            cursor.execute("""
+                INSERT INTO application_info (user_code, english_comment)
+                VALUES (%(user_code)s, %(english_comment)s)
+                ON CONFLICT (user_code) DO UPDATE SET english_comment = EXCLUDED.english_comment
+            """ + _VERSIONED_UPDATE, {
+                "user_code": user_code, "english_comment": english_comment,
+                "expected_version": expected_version,
+            })
+            row = cursor.fetchone()
+            if row is None:
+                return False, VERSION_CONFLICT_MESSAGE, None
+
+        return True, "English comment updated successfully", row["version"]
+
+    except ForeignKeyViolation:
+        return False, "Applicant not found", None
+    except Exception as e:
+        return False, f"Database error: {str(e)}", None
 
-            cursor.execute(
-                "UPDATE application_info SET english_status = %s, english = %s WHERE user_code = %s",
-                (english_status, english_boolean, user_code),
-            )
 
-            if cursor.rowcount == 0:
-                cursor.execute(
-                    "INSERT INTO application_info (user_code, english_status, english) VALUES (%s, %s, %s)",
-                    (user_code, english_status, english_boolean),
-                )
+def update_english_status(user_code, english_status, expected_version=None):
+    """
+    Update English status for applicant in application_info table.
 
-        return True, "English status updated successfully"
+    @param expected_version: See update_applicant_prerequisites
+    @return: See update_applicant_prerequisites
+    """
+    try:
+        with db_transaction() as (conn, cursor):
+            english_boolean = english_status in ["Passed", "Not Required"]
 
+            cursor.execute("""
+                INSERT INTO application_info (user_code, english_status, english)
+                VALUES (%(user_code)s, %(english_status)s, %(english)s)
+                ON CONFLICT (user_code) DO UPDATE
+                SET english_status = EXCLUDED.english_status, english = EXCLUDED.english
+            """ + _VERSIONED_UPDATE, {
+                "user_code": user_code, "english_status": english_status,
+                "english": english_boolean, "expected_version": expected_version,
+            })
+            row = cursor.fetchone()
+            if row is None:
+                return False, VERSION_CONFLICT_MESSAGE, None
+
+        return True, "English status updated successfully", row["version"]
+
+    except ForeignKeyViolation:
+        return False, "Applicant not found", None
     except Exception as e:
-        return False, f"Database error: {str(e)}"
+        return False, f"Database error: {str(e)}", None
 
 
 def clear_all_applicant_data():
@@ -5,25 +5,45 @@ This module handles processing of uploaded CSV data and inserting
 applicant records into the database.
 """
 
+import hashlib
+import io
+import logging
+import math
+import re
+import struct
 import pandas as pd
 from datetime import datetime, date
-from models.test_scores import (
-    process_toefl_scores,
-    process_ielts_scores,
-    process_other_test_scores,
-)
+from psycopg2.extras import execute_values
 from utils.db_helpers import db_transaction
-from models.institutions import process_institution_info
-from .english_status import compute_english_status
+from utils.test_score_helpers import (
+    IELTS_CONFIG,
+    TEST_SCORE_CONFIGS,
+    TEST_SCORE_DATE_COLUMNS,
+    TOEFL_CONFIG,
+    build_stage_upsert_query,
+    build_test_score_rows,
+    build_values_upsert_query,
+    test_score_columns,
+)
+from models.institutions import (
+    INSTITUTION_COLUMNS,
+    INSTITUTION_DATE_COLUMNS,
+    INSTITUTION_STAGE_UPSERT,
+    build_institution_rows,
+)
+from .english_status import compute_english_status_bulk
 from .core import convert_id_to_string
 
+logger = logging.getLogger(__name__)
 
-def calculate_age(birth_date):
-    """Calculate age from birth date."""
+
+def calculate_age(birth_date, today=None):
+    """Calculate age from birth date, as of today (or the given reference date)."""
     if not birth_date:
         return None
 
-    today = date.today()
+    if today is None:
+        today = date.today()
     age = today.year - birth_date.year
 
     if today.month < birth_date.month or (
@@ -56,29 +76,24 @@ def create_or_get_sessions(cursor, program_code, program, session_abbrev, campus
         campus_short = campus.split('-')[1] if '-' in campus else 'V'
         name = f"{program_code}-{campus_short} {session_abbrev}"[:30]
 
-        cursor.execute(
-            """
-            SELECT id FROM sessions
-            WHERE program_code = %s AND year = %s AND session_abbrev = %s AND campus = %s
-            """,
-            (program_code, year, session_abbrev, campus),
-        )
-
-        existing_session = cursor.fetchone()
-        if existing_session:
-            return existing_session["id"], f"Found existing session: {name}"
-
+        # One idempotent upsert instead of SELECT-then-INSERT; the no-op update
+        # lets RETURNING hand back the existing id, and xmax = 0 marks a new row
+        now = datetime.now()
         cursor.execute(
             """
             INSERT INTO sessions (program_code, program, session_abbrev, year, name, description, campus, created_at, updated_at)
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-            RETURNING id
+            ON CONFLICT ON CONSTRAINT sessions_unique_session
+                DO UPDATE SET program_code = EXCLUDED.program_code
+            RETURNING id, (xmax = 0) AS inserted
             """,
-            (program_code, program, session_abbrev, year, name, "", campus, datetime.now(), datetime.now()),
+            (program_code, program, session_abbrev, year, name, "", campus, now, now),
         )
 
-        session_id = cursor.fetchone()["id"]
-        return session_id, f"Created new session: {name} (ID: {session_id})"
+        session = cursor.fetchone()
+        if not session["inserted"]:
+            return session["id"], f"Found existing session: {name}"
+        return session["id"], f"Created new session: {name} (ID: {session['id']})"
 
     except ValueError as e:
         return None, f"Error parsing year from session_abbrev '{session_abbrev}': {e}"
@@ -86,417 +101,801 @@ def create_or_get_sessions(cursor, program_code, program, session_abbrev, campus
         return None, f"Database error creating session: {e}"
 
 
+# Credential keywords → degree level, used to pick an applicant's highest degree
+DEGREE_HIERARCHY = {
+    "phd": 4, "doctorate": 4, "doctoral": 4, "ph.d": 4, "ph.d.": 4,
+    "master": 3, "master's": 3, "masters": 3, "msc": 3, "ma": 3, "mba": 3, "med": 3,
+    "bachelor": 2, "bachelor's": 2, "bachelors": 2, "bsc": 2, "ba": 2, "beng": 2,
+    "associate": 1, "diploma": 1, "certificate": 1,
+}
+
+def _degree_level_sql(column):
+    """SQL CASE giving the DEGREE_HIERARCHY level of a credential column (0 if no keyword matches)."""
+    whens = []
+    for level in sorted(set(DEGREE_HIERARCHY.values()), reverse=True):
+        # One case-insensitive regex per level: the keywords are matched as
+        # substrings in a single scan instead of one LIKE per keyword
+        pattern = "|".join(
+            re.escape(key) for key, key_level in DEGREE_HIERARCHY.items() if key_level == level
+        ).replace("'", "''")
+        whens.append(f"WHEN {column} ~* '{pattern}' THEN {level}")
+    return "CASE " + " ".join(whens) + " ELSE 0 END"
+
+
+def _highest_degree_sql(user_filter):
+    """
+    SELECT of each applicant's institution with the highest credential, for
+    the applicants matched by user_filter: the latest conferral wins ties,
+    then the lowest institution_number.
+    """
+    return f"""
+SELECT DISTINCT ON (user_code) user_code, credential_receive, program_study, gpa
+FROM (
+    SELECT user_code, institution_number, credential_receive, date_confer, program_study, gpa,
+           {_degree_level_sql("credential_receive")} AS degree_level
+    FROM institution_info
+    WHERE {user_filter} AND credential_receive IS NOT NULL AND credential_receive != ''
+) AS credentialed
+WHERE degree_level > 0
+ORDER BY user_code, degree_level DESC, date_confer DESC NULLS LAST, institution_number
+"""
+
+
+_HIGHEST_DEGREE_QUERY = _highest_degree_sql("user_code = ANY(%s)")
+
+
+def _highest_degrees(cursor, user_codes):
+    """
+    Return {user_code: (credential_receive, program_study, gpa)} for the
+    applicants' highest credentials, in one query.
+    """
+    cursor.execute(_HIGHEST_DEGREE_QUERY, (list(user_codes),))
+    return {
+        r["user_code"]: (r["credential_receive"], r["program_study"], r["gpa"])
+        for r in cursor.fetchall()
+    }
+
+
 def calculate_application_info_fields(user_code, cursor):
     """Calculate highest_degree, degree_area, and gpa based on institution data."""
     try:
-        degree_hierarchy = {
-            "phd": 4, "doctorate": 4, "doctoral": 4, "ph.d": 4, "ph.d.": 4,
-            "master": 3, "master's": 3, "masters": 3, "msc": 3, "ma": 3, "mba": 3, "med": 3,
-            "bachelor": 2, "bachelor's": 2, "bachelors": 2, "bsc": 2, "ba": 2, "beng": 2,
-            "associate": 1, "diploma": 1, "certificate": 1,
-        }
+        return _highest_degrees(cursor, [user_code]).get(user_code, (None, None, None))
 
-        cursor.execute(
-            """
-            SELECT institution_number, credential_receive, date_confer, program_study, gpa
-            FROM institution_info
-            WHERE user_code = %s AND credential_receive IS NOT NULL AND credential_receive != ''
-            ORDER BY institution_number
-            """,
-            (user_code,),
-        )
+    except Exception as e:
+        logger.warning("Error calculating application_info fields for user %s: %s", user_code, e)
+        return None, None, None
 
-        institutions = cursor.fetchall()
-        if not institutions:
-            return None, None, None
-
-        highest_degree_level = 0
-        selected_institution = None
-
-        for institution in institutions:
-            credential_receive = institution["credential_receive"]
-            date_confer = institution["date_confer"]
-            program_study = institution["program_study"]
-            gpa = institution["gpa"]
-
-            if not credential_receive:
-                continue
-
-            credential = str(credential_receive).lower().strip()
-            current_degree_level = 0
-            for degree_key, level in degree_hierarchy.items():
-                if degree_key in credential:
-                    current_degree_level = max(current_degree_level, level)
-
-            if current_degree_level > highest_degree_level:
-                highest_degree_level = current_degree_level
-                selected_institution = {
-                    "credential_receive": credential_receive,
-                    "date_confer": date_confer,
-                    "program_study": program_study,
-                    "gpa": gpa,
-                }
-            elif current_degree_level == highest_degree_level and selected_institution:
-                current_date = date_confer
-                selected_date = selected_institution["date_confer"]
-                if current_date and selected_date and current_date > selected_date:
-                    selected_institution = {
-                        "credential_receive": credential_receive,
-                        "date_confer": date_confer,
-                        "program_study": program_study,
-                        "gpa": gpa,
-                    }
-                elif current_date and not selected_date:
-                    selected_institution = {
-                        "credential_receive": credential_receive,
-                        "date_confer": date_confer,
-                        "program_study": program_study,
-                        "gpa": gpa,
-                    }
-
-        if selected_institution:
-            return (selected_institution["credential_receive"],
-                    selected_institution["program_study"],
-                    selected_institution["gpa"])
 
-        return None, None, None
+def _application_info_params(user_code, row):
+    """Build the application_info parameter tuple for APPLICATION_INFO_UPSERT."""
+    country_citizenship = str(row.get("Country of Current Citizenship") or "").strip()
+    dual_citizenship = str(row.get("Dual Citizenship") or "").strip()
+
+    is_canadian = (
+        country_citizenship.lower() == "canada"
+        or dual_citizenship.lower() == "canada"
+    )
+
+    given_name = str(row.get("Given Name") or "").strip()
+    family_name = str(row.get("Family Name") or "").strip()
+    full_name = f"{given_name} {family_name}".strip()
+
+    return (user_code, full_name, is_canadian, "Not Reviewed", "No", "No", "Yes")
 
-    except Exception as e:
-        print(f"Error calculating application_info fields for user {user_code}: {str(e)}")
-        return None, None, None
+
+# highest_degree/degree_area are joined in from the applicants' institution_info
+# rows by the statement itself, so those must be written first
+APPLICATION_INFO_UPSERT = f"""
+WITH v (user_code, full_name, canadian, sent, mds_v, mds_cl, mds_o) AS (VALUES %s),
+degrees AS ({_highest_degree_sql("user_code IN (SELECT user_code FROM v)")})
+INSERT INTO application_info (
+    user_code, full_name, canadian, sent, highest_degree, degree_area,
+    mds_v, mds_cl, mds_o
+)
+SELECT v.user_code, v.full_name, v.canadian, v.sent,
+       degrees.credential_receive, degrees.program_study,
+       v.mds_v, v.mds_cl, v.mds_o
+FROM v LEFT JOIN degrees ON degrees.user_code = v.user_code
+ON CONFLICT (user_code) DO UPDATE SET
+    full_name = EXCLUDED.full_name,
+    canadian = EXCLUDED.canadian,
+    highest_degree = EXCLUDED.highest_degree,
+    degree_area = EXCLUDED.degree_area,
+    mds_v = EXCLUDED.mds_v,
+    mds_cl = EXCLUDED.mds_cl,
+    mds_o = EXCLUDED.mds_o
+"""
 
 
 def process_application_info(user_code, row, cursor, current_time):
     """Process and insert application_info data."""
     try:
-        country_citizenship = str(row.get("Country of Current Citizenship", "")).strip()
-        dual_citizenship = str(row.get("Dual Citizenship", "")).strip()
+        execute_values(cursor, APPLICATION_INFO_UPSERT, [_application_info_params(user_code, row)])
 
-        is_canadian = (
-            country_citizenship.lower() == "canada"
-            or dual_citizenship.lower() == "canada"
-        )
+    except Exception as e:
+        logger.warning("Error processing application_info for user %s: %s", user_code, e)
 
-        given_name = str(row.get("Given Name", "")).strip()
-        family_name = str(row.get("Family Name", "")).strip()
-        full_name = f"{given_name} {family_name}".strip()
-
-        highest_degree, degree_area, _ = calculate_application_info_fields(user_code, cursor)
-
-        application_info_query = """
-        INSERT INTO application_info (
-            user_code, full_name, canadian, sent, highest_degree, degree_area,
-            mds_v, mds_cl, mds_o
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (user_code) DO UPDATE SET
-            full_name = EXCLUDED.full_name,
-            canadian = EXCLUDED.canadian,
-            highest_degree = EXCLUDED.highest_degree,
-            degree_area = EXCLUDED.degree_area,
-            mds_v = EXCLUDED.mds_v,
-            mds_cl = EXCLUDED.mds_cl,
-            mds_o = EXCLUDED.mds_o
-        """
 
-        cursor.execute(
-            application_info_query,
-            (user_code, full_name, is_canadian, "Not Reviewed", highest_degree, degree_area,
-             "No", "No", "Yes"),
-        )
+def _upsert_institutions(cursor, pending):
+    """
+    Stage and upsert institution_info rows for a batch of applicants.
 
-    except Exception as e:
-        print(f"Error processing application_info for user {user_code}: {str(e)}")
+    @param cursor: Database cursor
+    @param pending: List of (user_code, row, current_time) from pass 1
+    @return: Set of user codes with an institution row inserted or changed
+    """
+    # Keyed by (user_code, institution_number): a repeated applicant keeps its
+    # last row, and ON CONFLICT never sees the same key twice in one statement
+    staged = {}
+    for user_code, row, current_time in pending:
+        for params in build_institution_rows(user_code, row, current_time):
+            staged[(params[0], params[1])] = params
+    if not staged:
+        return set()
+
+    stage = _copy_to_stage(cursor, "institution_info", INSTITUTION_COLUMNS, list(staged.values()))
+    cursor.execute(INSTITUTION_STAGE_UPSERT.format(stage=stage))
+
+    # updated_at is only set to the staged timestamp on insert or real change
+    return {
+        r["user_code"] for r in cursor.fetchall()
+        if r["updated_at"] == staged[(r["user_code"], r["institution_number"])][-1]
+    }
+
+
+# Up to three attempts per applicant: staged with binary COPY. The other
+# (single-entry) tests go through execute_values.
+_STAGED_TEST_CONFIGS = (TOEFL_CONFIG, IELTS_CONFIG)
+_VALUES_TEST_CONFIGS = tuple(
+    config for config in TEST_SCORE_CONFIGS.values() if config not in _STAGED_TEST_CONFIGS
+)
+
+
+def _test_score_rows(pending, config):
+    """
+    Build one test table's parameter tuples for a batch of applicants, keyed by
+    (user_code[, entry number]) so a repeated applicant keeps its last row and
+    ON CONFLICT never sees the same key twice in one statement.
+    """
+    key_length = 1 if config.has_single_entry else 2
+    staged = {}
+    for user_code, row, current_time in pending:
+        for params in build_test_score_rows(user_code, row, current_time, config):
+            staged[params[:key_length]] = params
+    return staged
+
+
+def _changed_test_user_codes(returned, staged):
+    """User codes whose returned updated_at equals the staged timestamp (inserted or changed)."""
+    current_times = {params[0]: params[-1] for params in staged.values()}
+    return {r["user_code"] for r in returned if r["updated_at"] == current_times[r["user_code"]]}
+
+
+def _upsert_test_scores(cursor, pending, config):
+    """
+    Stage (binary COPY) and upsert one multi-entry test table for a batch of applicants.
+
+    @param cursor: Database cursor
+    @param pending: List of (user_code, row, current_time) from pass 1
+    @param config: TestScoreConfig of the table (TOEFL_CONFIG, IELTS_CONFIG)
+    @return: Set of user codes with a test row inserted or changed
+    """
+    staged = _test_score_rows(pending, config)
+    if not staged:
+        return set()
+
+    stage = _copy_to_stage_binary(
+        cursor, config.table_name, test_score_columns(config), list(staged.values())
+    )
+    cursor.execute(build_stage_upsert_query(config).format(stage=stage))
+    return _changed_test_user_codes(cursor.fetchall(), staged)
+
+
+def _upsert_test_scores_values(cursor, pending, config):
+    """
+    Upsert one single-entry test table for a batch of applicants with execute_values.
+
+    @param cursor: Database cursor
+    @param pending: List of (user_code, row, current_time) from pass 1
+    @param config: TestScoreConfig of the table (MELAB_CONFIG, PTE_CONFIG, ...)
+    @return: Set of user codes with a test row inserted or changed
+    """
+    staged = _test_score_rows(pending, config)
+    if not staged:
+        return set()
+
+    returned = execute_values(
+        cursor, build_values_upsert_query(config), list(staged.values()),
+        page_size=CSV_CHUNK_ROWS, fetch=True,
+    )
+    return _changed_test_user_codes(returned, staged)
+
+
+def _upsert_application_info(cursor, rows_by_user):
+    """
+    Upsert application_info for a batch of applicants in one statement.
 
+    Highest degrees are picked inside the same statement, so this must run
+    after their institution_info rows have been written.
 
-def process_csv_data(df, session_id_map: dict):
+    @param cursor: Database cursor
+    @param rows_by_user: Mapping of user_code → CSV row dict (one row per applicant)
+    """
+    if not rows_by_user:
+        return
+
+    params = [_application_info_params(user_code, row) for user_code, row in rows_by_user.items()]
+    execute_values(cursor, APPLICATION_INFO_UPSERT, params, page_size=CSV_CHUNK_ROWS)
+
+
+# Rows handled per batch; bounds the parameter lists built per pass
+CSV_CHUNK_ROWS = 1000
+
+# pg_advisory_xact_lock key held for the whole import transaction, so imports
+# from any worker process (sync uploads and background jobs) run one at a time
+CSV_IMPORT_LOCK_KEY = 0x6D647331
+
+
+def process_csv_data(data, session_id_map: dict):
     """
     Process uploaded CSV data and insert into database tables.
 
-    @param df: Pandas DataFrame containing CSV data
+    Rows are handled in chunks (CSV_CHUNK_ROWS for a DataFrame) within a single
+    transaction, which holds the CSV_IMPORT_LOCK_KEY advisory lock so
+    concurrent imports wait for each other instead of contending row by row.
+    Per chunk, applicant_info, applicant_status and institution_info are COPYed
+    into staging tables and upserted from there in one statement each, and
+    application_info is upserted with one batched execute_values. TOEFL and
+    IELTS scores are staged with binary COPY and the other test scores are
+    upserted with execute_values, one statement per table.
+
+    @param data: Pandas DataFrame containing CSV data, or an iterable of DataFrame
+                 chunks (e.g. pd.read_csv(..., chunksize=CSV_CHUNK_ROWS)) so the
+                 whole file is never held as one frame
     @param session_id_map: Mapping of (program_code_upper, session_abbrev_upper) → session_id,
                            pre-validated by CSVImportService before calling this function.
     @return: Tuple of (success, message, records_processed)
     """
-    if df.empty:
-        return False, "CSV file is empty", 0
+    if isinstance(data, pd.DataFrame):
+        if data.empty:
+            return False, "CSV file is empty", 0
+        chunks = (
+            data.iloc[start:start + CSV_CHUNK_ROWS]
+            for start in range(0, len(data), CSV_CHUNK_ROWS)
+        )
+    else:
+        chunks = data
 
     touched_user_codes = set()
 
     try:
         with db_transaction() as (conn, cursor):
+            # The import is idempotent and can simply be re-run, so its commit
+            # doesn't wait for the WAL flush. Staging tables are TEMP and
+            # therefore unlogged already.
+            cursor.execute("SET LOCAL synchronous_commit = off")
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", (CSV_IMPORT_LOCK_KEY,))
+
             records_processed = 0
+            # One timestamp for the whole import: every row's created_at/updated_at
+            # and the reference date for ages
+            current_time = datetime.now()
 
-            for _, row in df.iterrows():
-                user_code = str(row.get("User Code", "")).strip()
-                if not user_code or user_code == "nan":
+            for chunk in chunks:
+                if chunk.empty:
                     continue
+                chunk_records, chunk_user_codes = _process_chunk(
+                    cursor, chunk, session_id_map, current_time
+                )
+                records_processed += chunk_records
+                touched_user_codes |= chunk_user_codes
+
+        # Recompute English status after transaction commits, for all touched
+        # applicants at once (five bulk reads and one batched UPDATE)
+        compute_english_status_bulk(touched_user_codes)
 
-                program_code = str(row.get("Program CODE", "")).strip().upper()
-                session_abbrev = str(row.get("Session", "")).strip().upper()
-                session_id = session_id_map.get((program_code, session_abbrev))
+        return True, "Data processed successfully", records_processed
 
-                data_changed = False
+    except Exception as e:
+        return False, f"Database error: {str(e)}", 0
 
-                date_birth = None
-                if pd.notna(row.get("Date of Birth")):
-                    try:
-                        date_birth = pd.to_datetime(row.get("Date of Birth")).date()
-                    except:
-                        pass
 
-                age = calculate_age(date_birth)
-                current_time = datetime.now()
+def _process_chunk(cursor, chunk, session_id_map, current_time):
+    """
+    Upsert one slice of the CSV inside the caller's transaction.
 
-                ubc_academic_history = row.get(
-                    "{ UBC Academic History List - eVision Record #; Start Date; End Date; Category; Program of Study; Degree Conferred?; Date Conferred; Credential Received; Withdrawal Reasons; Honours }",
-                    "",
-                )
+    @param cursor: Database cursor
+    @param chunk: DataFrame slice of at most CSV_CHUNK_ROWS rows
+    @param session_id_map: See process_csv_data
+    @param current_time: Import timestamp for created_at/updated_at
+    @return: Tuple of (records_processed, set of user codes touched)
+    """
+    records_processed = 0
+
+    # Pass 1: build applicant_info / applicant_status rows.
+    # Keyed by user_code so a repeated applicant keeps its last row,
+    # matching the previous row-by-row upsert behaviour.
+    info_rows = {}
+    status_rows = {}
+    unchanged_user_codes = set()
+    pending = []
+
+    # Date columns, ages and the key/cleaned string columns are computed once
+    # per chunk, column-wise
+    born = _to_datetimes(chunk, "Date of Birth")
+    birth_dates = _to_dates(born)
+    ages = _ages_from_birth_dates(born, current_time.date())
+    app_starts = _parse_date_column(chunk, "Application Started")
+    submit_dates = _parse_date_column(chunk, "Submitted Date")
+    user_code_col = _str_column(chunk, "User Code", missing="")
+    program_codes = _str_column(chunk, "Program CODE", upper=True)
+    session_abbrevs = _str_column(chunk, "Session", upper=True)
+    ubc_histories = _str_column(chunk, UBC_ACADEMIC_HISTORY_COLUMN, missing="")
+    racialized_values = _str_column(chunk, "Racialized", missing=None)
+
+    # Plain dicts instead of iterrows(): no per-row Series construction, and
+    # values come back as native Python scalars ready for psycopg2. Missing
+    # cells are turned into None for the whole chunk in one pass, so they are
+    # written as NULL and the row helpers never see NaN floats; the
+    # institution and test score date cells are parsed column-wise into dates,
+    # which the row helpers pass through as-is.
+    cleaned = chunk.astype(object).where(chunk.notna(), None)
+    for column in _ROW_DATE_COLUMNS:
+        if column in cleaned.columns:
+            cleaned[column] = _parse_date_column(chunk, column)
+    records = cleaned.to_dict("records")
+    stored_hashes = _stored_content_hashes(cursor, user_code_col)
+    for (row, user_code, program_code, session_abbrev, date_birth, age,
+         app_start, submit_date, ubc_academic_history, racialized_value) in zip(
+        records, user_code_col, program_codes, session_abbrevs,
+        birth_dates, ages, app_starts, submit_dates, ubc_histories, racialized_values,
+    ):
+        if not user_code:
+            continue
 
-                if pd.isna(ubc_academic_history) or str(ubc_academic_history).strip() == "nan":
-                    ubc_academic_history = ""
-                else:
-                    ubc_academic_history = str(ubc_academic_history).strip()
+        session_id = session_id_map.get((program_code, session_abbrev))
 
-                racialized_value = row.get("Racialized")
-                if pd.isna(racialized_value):
-                    racialized_value = None
-                else:
-                    racialized_value = str(racialized_value).strip()
+        info_params = _applicant_info_params(
+            user_code, session_id, row, date_birth, age,
+            ubc_academic_history, racialized_value, current_time,
+        )
+        status_params = _applicant_status_params(
+            user_code, row, app_start, submit_date, current_time
+        )
+        status_rows[user_code] = status_params
+
+        # Applicants whose info/status input is unchanged since their last
+        # import skip both upserts
+        content_hash = _content_hash(info_params, status_params)
+        if stored_hashes.get(user_code) == content_hash:
+            info_rows.pop(user_code, None)
+            unchanged_user_codes.add(user_code)
+        else:
+            info_rows[user_code] = info_params + (content_hash,)
+            unchanged_user_codes.discard(user_code)
+
+        pending.append((user_code, row, current_time))
+
+    # Bulk upserts (COPY + one INSERT ... SELECT instead of one INSERT per row)
+    changed_user_codes = _upsert_batch(
+        cursor, "applicant_info", APPLICANT_INFO_COLUMNS, APPLICANT_INFO_UPSERT,
+        list(info_rows.values()), current_time,
+    )
 
-                cursor.execute("SELECT updated_at FROM applicant_info WHERE user_code = %s", (user_code,))
-                old_info_updated = cursor.fetchone()
+    # Institutions for the whole chunk through one COPY + INSERT ... SELECT
+    changed_user_codes |= _upsert_institutions(cursor, pending)
+
+    # Test scores for the whole chunk: one statement (or execute_values page) per table
+    for config in _STAGED_TEST_CONFIGS:
+        changed_user_codes |= _upsert_test_scores(cursor, pending, config)
+    for config in _VALUES_TEST_CONFIGS:
+        changed_user_codes |= _upsert_test_scores_values(cursor, pending, config)
+
+    # applicant_status goes last: applicants whose other rows changed have
+    # updated_at bumped by the upsert itself rather than a follow-up UPDATE
+    _upsert_batch(
+        cursor, "applicant_status", APPLICANT_STATUS_COLUMNS, APPLICANT_STATUS_UPSERT,
+        [
+            params for user_code, params in status_rows.items()
+            if user_code not in unchanged_user_codes or user_code in changed_user_codes
+        ],
+        current_time,
+        params={"touched": list(changed_user_codes)},
+    )
 
-                # Insert applicant_info
-                _insert_applicant_info(cursor, user_code, session_id, row, date_birth, age,
-                                       ubc_academic_history, racialized_value, current_time)
+    records_processed += len(pending)
 
-                cursor.execute("SELECT updated_at FROM applicant_info WHERE user_code = %s", (user_code,))
-                new_info_updated = cursor.fetchone()
+    # application_info for the whole chunk (needs the institutions written above);
+    # keyed by user_code so a repeated applicant keeps its last row
+    _upsert_application_info(cursor, {user_code: row for user_code, row, _ in pending})
 
-                if old_info_updated is None or (old_info_updated and new_info_updated and
-                        old_info_updated["updated_at"] != new_info_updated["updated_at"]):
-                    data_changed = True
+    return records_processed, {user_code for user_code, _, _ in pending}
 
-                # Parse dates for applicant_status
-                app_start = None
-                submit_date = None
-                if pd.notna(row.get("Application Started")):
-                    try:
-                        app_start = pd.to_datetime(row.get("Application Started")).date()
-                    except:
-                        pass
-                if pd.notna(row.get("Submitted Date")):
-                    try:
-                        submit_date = pd.to_datetime(row.get("Submitted Date")).date()
-                    except:
-                        pass
 
-                cursor.execute("SELECT updated_at FROM applicant_status WHERE user_code = %s", (user_code,))
-                old_status_updated = cursor.fetchone()
+# Date cells read per row by build_institution_rows / build_test_score_rows
+_ROW_DATE_COLUMNS = INSTITUTION_DATE_COLUMNS + TEST_SCORE_DATE_COLUMNS
 
-                _insert_applicant_status(cursor, user_code, row, app_start, submit_date, current_time)
+UBC_ACADEMIC_HISTORY_COLUMN = (
+    "{ UBC Academic History List - eVision Record #; Start Date; End Date; Category; "
+    "Program of Study; Degree Conferred?; Date Conferred; Credential Received; "
+    "Withdrawal Reasons; Honours }"
+)
 
-                cursor.execute("SELECT updated_at FROM applicant_status WHERE user_code = %s", (user_code,))
-                new_status_updated = cursor.fetchone()
 
-                if old_status_updated is None or (old_status_updated and new_status_updated and
-                        old_status_updated["updated_at"] != new_status_updated["updated_at"]):
-                    data_changed = True
+def _str_column(chunk, column, upper=False, missing=...):
+    """
+    Return a column as a list of stripped strings.
 
-                # Process test scores
-                toefl_changed = process_toefl_scores(user_code, row, cursor, current_time)
-                ielts_changed = process_ielts_scores(user_code, row, cursor, current_time)
-                other_tests_changed = process_other_test_scores(user_code, row, cursor, current_time)
+    @param upper: Upper-case the values as well
+    @param missing: Replacement for NaN/absent cells (and literal "nan" text);
+                    by default they become the string "nan", like str(value)
+    """
+    if column not in chunk.columns:
+        value = "" if missing is ... else missing
+        return [value] * len(chunk)
+    values = chunk[column].astype(str).str.strip()
+    if upper:
+        values = values.str.upper()
+    if missing is not ...:
+        values = values.astype(object)
+        blank = chunk[column].isna()
+        if missing == "":
+            blank |= values == "nan"
+        values[blank] = missing
+    return values.tolist()
+
+
+def _stored_content_hashes(cursor, user_codes):
+    """Return {user_code: content_hash} for the chunk's applicants already in applicant_info."""
+    cursor.execute(
+        "SELECT user_code, content_hash FROM applicant_info WHERE user_code = ANY(%s)",
+        (list(user_codes),),
+    )
+    return {r["user_code"]: bytes(r["content_hash"]) for r in cursor.fetchall() if r["content_hash"]}
 
-                touched_user_codes.add(user_code)
 
-                # Process institution information
-                institution_changed = process_institution_info(user_code, row, cursor, current_time)
+def _content_hash(info_params, status_params):
+    """
+    Digest of an applicant's applicant_info/applicant_status input, without
+    the created_at/updated_at timestamps, stored as applicant_info.content_hash.
+    """
+    payload = repr((info_params[:-2], status_params[:-2])).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).digest()
 
-                # Process application_info
-                process_application_info(user_code, row, cursor, current_time)
 
-                if data_changed or institution_changed or toefl_changed or ielts_changed or other_tests_changed:
-                    cursor.execute(
-                        "UPDATE applicant_status SET updated_at = %s WHERE user_code = %s",
-                        (current_time, user_code)
-                    )
+def _to_datetimes(chunk, column):
+    """Parse a column to datetime64, unparseable or missing values as NaT."""
+    if column not in chunk.columns:
+        return pd.Series(pd.NaT, index=chunk.index, dtype="datetime64[ns]")
+    return pd.to_datetime(chunk[column], errors="coerce", format="mixed")
 
-                records_processed += 1
 
-        # Recompute English status after transaction commits
-        for uc in touched_user_codes:
-            compute_english_status(uc)
+def _to_dates(parsed):
+    """Convert a datetime64 Series to a list of date objects (None for NaT)."""
+    return parsed.dt.date.to_numpy(dtype=object, na_value=None).tolist()
 
-        return True, "Data processed successfully", records_processed
 
-    except Exception as e:
-        return False, f"Database error: {str(e)}", 0
+def _parse_date_column(chunk, column):
+    """Return a column as a list of date objects (None where missing/invalid)."""
+    return _to_dates(_to_datetimes(chunk, column))
 
 
-def _insert_applicant_info(cursor, user_code, session_id, row, date_birth, age,
-                           ubc_academic_history, racialized_value, current_time):
-    """Insert or update applicant_info record."""
-    applicant_info_query = """
-    INSERT INTO applicant_info (
-        user_code, session_id, title, family_name, given_name, middle_name, preferred_name,
-        former_family_name, gender_code, gender, date_birth, age, country_birth_code,
-        country_citizenship_code, country_citizenship, dual_citizenship_code,
-        dual_citizenship, primary_spoken_lang_code, primary_spoken_lang,
-        other_spoken_lang_code, other_spoken_lang, visa_type_code, visa_type,
-        country_code, country, address_line1, address_line2, city,
-        province_state_region, postal_code, primary_telephone, secondary_telephone,
-        email, aboriginal, first_nation, inuit, metis, aboriginal_not_specified,
-        aboriginal_info, racialized, academic_history_code, academic_history, ubc_academic_history, interest_code, interest,
-        created_at, updated_at
-    ) VALUES (
-        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-        %s, %s, %s, %s)
-    ON CONFLICT (user_code) DO UPDATE SET
-        session_id = EXCLUDED.session_id,
-        title = EXCLUDED.title,
-        family_name = EXCLUDED.family_name,
-        given_name = EXCLUDED.given_name,
-        middle_name = EXCLUDED.middle_name,
-        preferred_name = EXCLUDED.preferred_name,
-        former_family_name = EXCLUDED.former_family_name,
-        gender_code = EXCLUDED.gender_code,
-        gender = EXCLUDED.gender,
-        date_birth = EXCLUDED.date_birth,
-        age = EXCLUDED.age,
-        country_birth_code = EXCLUDED.country_birth_code,
-        country_citizenship_code = EXCLUDED.country_citizenship_code,
-        country_citizenship = EXCLUDED.country_citizenship,
-        dual_citizenship_code = EXCLUDED.dual_citizenship_code,
-        dual_citizenship = EXCLUDED.dual_citizenship,
-        primary_spoken_lang_code = EXCLUDED.primary_spoken_lang_code,
-        primary_spoken_lang = EXCLUDED.primary_spoken_lang,
-        other_spoken_lang_code = EXCLUDED.other_spoken_lang_code,
-        other_spoken_lang = EXCLUDED.other_spoken_lang,
-        visa_type_code = EXCLUDED.visa_type_code,
-        visa_type = EXCLUDED.visa_type,
-        country_code = EXCLUDED.country_code,
-        country = EXCLUDED.country,
-        address_line1 = EXCLUDED.address_line1,
-        address_line2 = EXCLUDED.address_line2,
-        city = EXCLUDED.city,
-        province_state_region = EXCLUDED.province_state_region,
-        postal_code = EXCLUDED.postal_code,
-        primary_telephone = EXCLUDED.primary_telephone,
-        secondary_telephone = EXCLUDED.secondary_telephone,
-        email = EXCLUDED.email,
-        aboriginal = EXCLUDED.aboriginal,
-        first_nation = EXCLUDED.first_nation,
-        inuit = EXCLUDED.inuit,
-        metis = EXCLUDED.metis,
-        aboriginal_not_specified = EXCLUDED.aboriginal_not_specified,
-        aboriginal_info = EXCLUDED.aboriginal_info,
-        racialized = EXCLUDED.racialized,
-        academic_history_code = EXCLUDED.academic_history_code,
-        academic_history = EXCLUDED.academic_history,
-        ubc_academic_history = EXCLUDED.ubc_academic_history,
-        interest_code = EXCLUDED.interest_code,
-        interest = EXCLUDED.interest,
-        updated_at = CASE
-            WHEN applicant_info.session_id IS DISTINCT FROM EXCLUDED.session_id
-              OR applicant_info.family_name IS DISTINCT FROM EXCLUDED.family_name
-              OR applicant_info.given_name IS DISTINCT FROM EXCLUDED.given_name
-              OR applicant_info.email IS DISTINCT FROM EXCLUDED.email
-            THEN EXCLUDED.updated_at
-            ELSE applicant_info.updated_at
-        END
+def _ages_from_birth_dates(born, today):
     """
+    Vectorized calculate_age over parsed birth dates.
 
+    @param born: datetime64 Series from _to_datetimes
+    @param today: Reference date the ages are computed at
+    @return: List of ints (None where the birth date is missing/invalid)
+    """
+    before_birthday = (born.dt.month > today.month) | (
+        (born.dt.month == today.month) & (born.dt.day > today.day)
+    )
+    ages = (today.year - born.dt.year - before_birthday.astype(int)).astype("Int64")
+    return ages.to_numpy(dtype=object, na_value=None).tolist()
+
+
+def _copy_field(value):
+    """Render one value for COPY ... WITH (FORMAT csv); unquoted empty is NULL."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return '"' + value.replace('"', '""') + '"'
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, bytes):
+        return "\\x" + value.hex()
+    if isinstance(value, float) and math.isnan(value):
+        return "NaN"
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+def _create_stage(cursor, table):
+    """Create (or empty) the transaction-scoped staging copy of table and return its name."""
+    stage = f"_stage_{table}"
     cursor.execute(
-        applicant_info_query,
-        (
-            user_code,
-            session_id,
-            row.get("Title"),
-            row.get("Family Name"),
-            row.get("Given Name"),
-            row.get("Middle Name"),
-            row.get("Preferred Name"),
-            row.get("Former Family Name"),
-            row.get("Gender CODE"),
-            row.get("Gender"),
-            date_birth,
-            age,
-            row.get("Country of Birth CODE"),
-            row.get("Country of Current Citizenship CODE"),
-            row.get("Country of Current Citizenship"),
-            row.get("Dual Citizenship CODE"),
-            row.get("Dual Citizenship"),
-            row.get("Primary Spoken Language CODE"),
-            row.get("Primary Spoken Language"),
-            row.get("Other Spoken Language CODE"),
-            row.get("Other Spoken Language"),
-            row.get("Visa Type CODE"),
-            row.get("Visa Type"),
-            row.get("Country CODE"),
-            row.get("Country"),
-            row.get("Address Line 1"),
-            row.get("Address Line 2"),
-            row.get("City"),
-            row.get("Province, State or Region"),
-            row.get("Postal Code"),
-            convert_id_to_string(row.get("Primary Telephone")),
-            convert_id_to_string(row.get("Secondary Telephone")),
-            row.get("Email"),
-            row.get("Aboriginal"),
-            row.get("Aboriginal Type First Nations"),
-            row.get("Aboriginal Type Inuit"),
-            row.get("Aboriginal Type Metis"),
-            row.get("Aboriginal Type Not Specified"),
-            row.get("Aboriginal Info"),
-            racialized_value,
-            row.get("Academic History Source CODE"),
-            row.get("IAcademic History Source Value"),
-            ubc_academic_history,
-            row.get("Source of Interest in UBC CODE"),
-            row.get("Source of Interest in UBC"),
-            current_time,
-            current_time,
-        ),
+        f"CREATE TEMP TABLE IF NOT EXISTS {stage} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
     )
+    cursor.execute(f"TRUNCATE {stage}")
+    return stage
 
 
-def _insert_applicant_status(cursor, user_code, row, app_start, submit_date, current_time):
-    """Insert or update applicant_status record."""
-    status_query = """
-    INSERT INTO applicant_status (
-        user_code, student_number, app_start, submit_date,
-        status_code, status, detail_status, created_at, updated_at
-    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-     ON CONFLICT (user_code) DO UPDATE SET
-        student_number = EXCLUDED.student_number,
-        app_start = EXCLUDED.app_start,
-        submit_date = EXCLUDED.submit_date,
-        status_code = EXCLUDED.status_code,
-        status = EXCLUDED.status,
-        detail_status = EXCLUDED.detail_status,
-        updated_at = CASE
-            WHEN applicant_status.student_number IS DISTINCT FROM EXCLUDED.student_number
-              OR applicant_status.app_start IS DISTINCT FROM EXCLUDED.app_start
-              OR applicant_status.submit_date IS DISTINCT FROM EXCLUDED.submit_date
-              OR applicant_status.status IS DISTINCT FROM EXCLUDED.status
-            THEN EXCLUDED.updated_at
-            ELSE applicant_status.updated_at
-        END
+def _copy_to_stage(cursor, table, columns, rows):
     """
+    COPY rows into a transaction-scoped staging copy of table.
 
-    cursor.execute(
-        status_query,
-        (
-            user_code,
-            convert_id_to_string(row.get("Student Number")),
-            app_start,
-            submit_date,
-            row.get("Status CODE"),
-            row.get("Status"),
-            row.get("Detailed Status"),
-            current_time,
-            current_time,
-        ),
+    @param cursor: Database cursor
+    @param table: Target table the staging table is modelled on
+    @param columns: Column names, in the order of each row tuple
+    @param rows: List of parameter tuples
+    @return: Name of the staging table
+    """
+    stage = _create_stage(cursor, table)
+
+    buf = io.StringIO()
+    for row in rows:
+        buf.write(",".join(_copy_field(v) for v in row))
+        buf.write("\n")
+    buf.seek(0)
+    cursor.copy_expert(
+        f"COPY {stage} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buf
+    )
+    return stage
+
+
+# COPY BINARY framing: signature, flags and header-extension length up front,
+# a -1 field count as trailer
+_PGCOPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+_PGCOPY_TRAILER = struct.pack("!h", -1)
+_PG_EPOCH = datetime(2000, 1, 1)
+_PG_EPOCH_ORDINAL = _PG_EPOCH.toordinal()
+
+
+def _binary_field(value):
+    """
+    Encode one value for COPY ... WITH (FORMAT binary), length prefix included.
+
+    Python types map to the column types the staged test-score tables use:
+    str -> VARCHAR/TEXT, int -> INT (int4), date -> DATE,
+    datetime -> TIMESTAMP (without time zone); None is NULL.
+    """
+    if value is None:
+        return b"\xff\xff\xff\xff"
+    if isinstance(value, str):
+        data = value.encode("utf-8")
+        return struct.pack("!i", len(data)) + data
+    if isinstance(value, datetime):
+        delta = value - _PG_EPOCH
+        micros = (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+        return struct.pack("!iq", 8, micros)
+    if isinstance(value, date):
+        return struct.pack("!ii", 4, value.toordinal() - _PG_EPOCH_ORDINAL)
+    if isinstance(value, int):
+        return struct.pack("!ii", 4, value)
+    raise TypeError(f"No binary COPY encoding for {type(value).__name__}")
+
+
+def _copy_to_stage_binary(cursor, table, columns, rows):
+    """
+    _copy_to_stage using the binary COPY format, so the server stores the
+    values without parsing text. Values must be of the types _binary_field handles.
+
+    @return: Name of the staging table
+    """
+    stage = _create_stage(cursor, table)
+
+    field_count = struct.pack("!h", len(columns))
+    buf = io.BytesIO()
+    buf.write(_PGCOPY_HEADER)
+    for row in rows:
+        buf.write(field_count)
+        buf.write(b"".join(_binary_field(v) for v in row))
+    buf.write(_PGCOPY_TRAILER)
+    buf.seek(0)
+    cursor.copy_expert(
+        f"COPY {stage} ({', '.join(columns)}) FROM STDIN WITH (FORMAT binary)", buf
+    )
+    return stage
+
+
+def _upsert_batch(cursor, table, columns, query, rows, current_time, params=None):
+    """
+    Run a bulk upsert and report which applicants were inserted or changed.
+
+    The upsert RETURNs each row's updated_at: it equals current_time exactly
+    when the row was inserted or its tracked columns changed, so no
+    before/after probe of the table is needed.
+
+    @param cursor: Database cursor
+    @param table: Target table the staging table is modelled on
+    @param columns: Column names matching each row tuple
+    @param query: INSERT ... SELECT ... FROM {stage} ON CONFLICT ... RETURNING user_code, updated_at
+    @param rows: List of parameter tuples
+    @param current_time: Timestamp staged as updated_at in rows
+    @param params: Optional named parameters for query
+    @return: Set of user codes whose row was inserted or had updated_at bumped
+    """
+    if not rows:
+        return set()
+
+    stage = _copy_to_stage(cursor, table, columns, rows)
+    cursor.execute(query.format(stage=stage), params)
+    return {r["user_code"] for r in cursor.fetchall() if r["updated_at"] == current_time}
+
+
+APPLICANT_INFO_COLUMNS = (
+    "user_code", "session_id", "title", "family_name", "given_name", "middle_name", "preferred_name",
+    "former_family_name", "gender_code", "gender", "date_birth", "age", "country_birth_code",
+    "country_citizenship_code", "country_citizenship", "dual_citizenship_code",
+    "dual_citizenship", "primary_spoken_lang_code", "primary_spoken_lang",
+    "other_spoken_lang_code", "other_spoken_lang", "visa_type_code", "visa_type",
+    "country_code", "country", "address_line1", "address_line2", "city",
+    "province_state_region", "postal_code", "primary_telephone", "secondary_telephone",
+    "email", "aboriginal", "first_nation", "inuit", "metis", "aboriginal_not_specified",
+    "aboriginal_info", "racialized", "academic_history_code", "academic_history",
+    "ubc_academic_history", "interest_code", "interest",
+    "created_at", "updated_at", "content_hash",
+)
+
+# {stage} is filled in with the staging table name by _upsert_batch; the
+# RETURNING clause feeds its change detection
+APPLICANT_INFO_UPSERT = f"""
+INSERT INTO applicant_info ({", ".join(APPLICANT_INFO_COLUMNS)})
+SELECT {", ".join(APPLICANT_INFO_COLUMNS)} FROM {{stage}}
+ON CONFLICT (user_code) DO UPDATE SET
+    session_id = EXCLUDED.session_id,
+    title = EXCLUDED.title,
+    family_name = EXCLUDED.family_name,
+    given_name = EXCLUDED.given_name,
+    middle_name = EXCLUDED.middle_name,
+    preferred_name = EXCLUDED.preferred_name,
+    former_family_name = EXCLUDED.former_family_name,
+    gender_code = EXCLUDED.gender_code,
+    gender = EXCLUDED.gender,
+    date_birth = EXCLUDED.date_birth,
+    age = EXCLUDED.age,
+    country_birth_code = EXCLUDED.country_birth_code,
+    country_citizenship_code = EXCLUDED.country_citizenship_code,
+    country_citizenship = EXCLUDED.country_citizenship,
+    dual_citizenship_code = EXCLUDED.dual_citizenship_code,
+    dual_citizenship = EXCLUDED.dual_citizenship,
+    primary_spoken_lang_code = EXCLUDED.primary_spoken_lang_code,
+    primary_spoken_lang = EXCLUDED.primary_spoken_lang,
+    other_spoken_lang_code = EXCLUDED.other_spoken_lang_code,
+    other_spoken_lang = EXCLUDED.other_spoken_lang,
+    visa_type_code = EXCLUDED.visa_type_code,
+    visa_type = EXCLUDED.visa_type,
+    country_code = EXCLUDED.country_code,
+    country = EXCLUDED.country,
+    address_line1 = EXCLUDED.address_line1,
+    address_line2 = EXCLUDED.address_line2,
+    city = EXCLUDED.city,
+    province_state_region = EXCLUDED.province_state_region,
+    postal_code = EXCLUDED.postal_code,
+    primary_telephone = EXCLUDED.primary_telephone,
+    secondary_telephone = EXCLUDED.secondary_telephone,
+    email = EXCLUDED.email,
+    aboriginal = EXCLUDED.aboriginal,
+    first_nation = EXCLUDED.first_nation,
+    inuit = EXCLUDED.inuit,
+    metis = EXCLUDED.metis,
+    aboriginal_not_specified = EXCLUDED.aboriginal_not_specified,
+    aboriginal_info = EXCLUDED.aboriginal_info,
+    racialized = EXCLUDED.racialized,
+    academic_history_code = EXCLUDED.academic_history_code,
+    academic_history = EXCLUDED.academic_history,
+    ubc_academic_history = EXCLUDED.ubc_academic_history,
+    interest_code = EXCLUDED.interest_code,
+    interest = EXCLUDED.interest,
+    content_hash = EXCLUDED.content_hash,
+    updated_at = CASE
+        WHEN (applicant_info.session_id, applicant_info.family_name,
+              applicant_info.given_name, applicant_info.email)
+             IS DISTINCT FROM
+             (EXCLUDED.session_id, EXCLUDED.family_name, EXCLUDED.given_name, EXCLUDED.email)
+        THEN EXCLUDED.updated_at
+        ELSE applicant_info.updated_at
+    END
+RETURNING user_code, updated_at
+"""
+
+
+APPLICANT_STATUS_COLUMNS = (
+    "user_code", "student_number", "app_start", "submit_date",
+    "status_code", "status", "detail_status", "created_at", "updated_at",
+)
+
+# %(touched)s lists applicants whose applicant_info, institution or test
+# score rows changed in this chunk; their updated_at is bumped regardless
+APPLICANT_STATUS_UPSERT = f"""
+INSERT INTO applicant_status ({", ".join(APPLICANT_STATUS_COLUMNS)})
+SELECT {", ".join(APPLICANT_STATUS_COLUMNS)} FROM {{stage}}
+ON CONFLICT (user_code) DO UPDATE SET
+    student_number = EXCLUDED.student_number,
+    app_start = EXCLUDED.app_start,
+    submit_date = EXCLUDED.submit_date,
+    status_code = EXCLUDED.status_code,
+    status = EXCLUDED.status,
+    detail_status = EXCLUDED.detail_status,
+    updated_at = CASE
+        WHEN applicant_status.user_code = ANY(%(touched)s)
+          OR (applicant_status.student_number, applicant_status.app_start,
+              applicant_status.submit_date, applicant_status.status)
+             IS DISTINCT FROM
+             (EXCLUDED.student_number, EXCLUDED.app_start, EXCLUDED.submit_date, EXCLUDED.status)
+        THEN EXCLUDED.updated_at
+        ELSE applicant_status.updated_at
+    END
+RETURNING user_code, updated_at
+"""
+
+
+def _applicant_info_params(user_code, session_id, row, date_birth, age,
+                           ubc_academic_history, racialized_value, current_time):
+    """Build the applicant_info parameter tuple for APPLICANT_INFO_UPSERT, up to updated_at (content_hash is appended by the caller)."""
+    return (
+        user_code,
+        session_id,
+        row.get("Title"),
+        row.get("Family Name"),
+        row.get("Given Name"),
+        row.get("Middle Name"),
+        row.get("Preferred Name"),
+        row.get("Former Family Name"),
+        row.get("Gender CODE"),
+        row.get("Gender"),
+        date_birth,
+        age,
+        row.get("Country of Birth CODE"),
+        row.get("Country of Current Citizenship CODE"),
+        row.get("Country of Current Citizenship"),
+        row.get("Dual Citizenship CODE"),
+        row.get("Dual Citizenship"),
+        row.get("Primary Spoken Language CODE"),
+        row.get("Primary Spoken Language"),
+        row.get("Other Spoken Language CODE"),
+        row.get("Other Spoken Language"),
+        row.get("Visa Type CODE"),
+        row.get("Visa Type"),
+        row.get("Country CODE"),
+        row.get("Country"),
+        row.get("Address Line 1"),
+        row.get("Address Line 2"),
+        row.get("City"),
+        row.get("Province, State or Region"),
+        row.get("Postal Code"),
+        convert_id_to_string(row.get("Primary Telephone")),
+        convert_id_to_string(row.get("Secondary Telephone")),
+        row.get("Email"),
+        row.get("Aboriginal"),
+        row.get("Aboriginal Type First Nations"),
+        row.get("Aboriginal Type Inuit"),
+        row.get("Aboriginal Type Metis"),
+        row.get("Aboriginal Type Not Specified"),
+        row.get("Aboriginal Info"),
+        racialized_value,
+        row.get("Academic History Source CODE"),
+        row.get("IAcademic History Source Value"),
+        ubc_academic_history,
+        row.get("Source of Interest in UBC CODE"),
+        row.get("Source of Interest in UBC"),
+        current_time,
+        current_time,
+    )
+
+
+def _applicant_status_params(user_code, row, app_start, submit_date, current_time):
+    """Build the applicant_status parameter tuple for APPLICANT_STATUS_UPSERT."""
+    return (
+        user_code,
+        convert_id_to_string(row.get("Student Number")),
+        app_start,
+        submit_date,
+        row.get("Status CODE"),
+        row.get("Status"),
+        row.get("Detailed Status"),
+        current_time,
+        current_time,
     )
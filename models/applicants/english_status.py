@@ -5,6 +5,10 @@ This module handles computation and update of English language proficiency
 status for applicants based on their test scores (TOEFL, IELTS, MELAB, PTE, CAEL).
 """
 
+import numpy as np
+import pandas as pd
+from itertools import islice
+from psycopg2.extras import execute_values
 from utils.db_helpers import db_connection, db_transaction
 
 # Test score thresholds
@@ -40,62 +44,82 @@ def safe_float(value):
         return None
 
 
-def check_toefl_pass(row):
+# TOEFL score columns in threshold order (listening, reading, writing, speaking, total)
+_TOEFL_REGULAR_KEYS = ("listening", "reading", "structure_written", "speaking", "total_score")
+_TOEFL_MYBEST_KEYS = ("mybest_listening", "mybest_reading", "mybest_writing", "mybest_speaking", "mybest_total")
+_TOEFL_SECTION_NAMES = ("Listening", "Reading", "Writing", "Speaking")
+_TOEFL_MINIMUMS = np.array([TOEFL_LR_MIN, TOEFL_LR_MIN, TOEFL_WS_MIN, TOEFL_WS_MIN, TOEFL_TOTAL_MIN])
+
+
+# What int() accepts from a stripped score string: digits with an optional sign
+_INT_SCORE_PATTERN = r"[+-]?\d+"
+
+
+def _int_score_matrix(rows, keys):
     """
-    Check if TOEFL scores meet the requirements.
+    Parse integer score columns into a float matrix (one row per attempt).
 
-    @return: Tuple of (passed, description, failed_sections)
+    Vectorized safe_int: the columns are matched against _INT_SCORE_PATTERN and
+    converted with pd.to_numeric in one pass each; anything safe_int would map
+    to None (missing, blank, "22.5") becomes NaN.
     """
-    L = safe_int(row["listening"])
-    W = safe_int(row["structure_written"])
-    R = safe_int(row["reading"])
-    S = safe_int(row["speaking"])
-    T = safe_int(row["total_score"])
+    frame = pd.DataFrame.from_records(rows, columns=keys).astype("string")
+    for key in keys:
+        column = frame[key].str.strip()
+        column = column.where(column.str.fullmatch(_INT_SCORE_PATTERN).fillna(False))
+        frame[key] = pd.to_numeric(column, errors="coerce")
+    return frame.to_numpy(dtype=float, na_value=np.nan)
 
-    mL = safe_int(row["mybest_listening"])
-    mW = safe_int(row["mybest_writing"])
-    mR = safe_int(row["mybest_reading"])
-    mS = safe_int(row["mybest_speaking"])
-    mT = safe_int(row["mybest_total"])
 
-    num = row["toefl_number"] or 1
+def check_toefl_rows(rows):
+    """
+    Check many TOEFL rows (from any number of applicants) against the requirements.
 
-    # Regular attempt
-    if all(v is not None for v in (L, W, R, S, T)):
-        if (L >= TOEFL_LR_MIN and R >= TOEFL_LR_MIN and
-            W >= TOEFL_WS_MIN and S >= TOEFL_WS_MIN and T >= TOEFL_TOTAL_MIN):
-            return True, f"TOEFL{num}, score is above the minimum requirement (90)", []
+    Scores are parsed column-wise into matrices and every threshold comparison runs
+    as a NumPy array operation over all rows; a missing or non-numeric score
+    is NaN and never meets a minimum.
 
-    # MyBest composite
-    if all(v is not None for v in (mL, mW, mR, mS, mT)):
-        if (mL >= TOEFL_LR_MIN and mR >= TOEFL_LR_MIN and
-            mW >= TOEFL_WS_MIN and mS >= TOEFL_WS_MIN and mT >= TOEFL_TOTAL_MIN):
-            return True, f"TOEFL{num} (MyBest), score is above the minimum requirement (90)", []
+    @param rows: TOEFL rows
+    @return: List of (passed, description, failed_sections), one per row
+    """
+    if not rows:
+        return []
+
+    regular = _int_score_matrix(rows, _TOEFL_REGULAR_KEYS)
+    mybest = _int_score_matrix(rows, _TOEFL_MYBEST_KEYS)
+
+    regular_met = regular >= _TOEFL_MINIMUMS
+    passed_regular = regular_met.all(axis=1)
+    passed_mybest = (mybest >= _TOEFL_MINIMUMS).all(axis=1)
+    # Failures are only tracked for complete regular attempts
+    below = ~np.isnan(regular).any(axis=1)[:, None] & ~regular_met
+
+    results = []
+    for row, regular_ok, mybest_ok, row_below in zip(rows, passed_regular, passed_mybest, below):
+        num = row["toefl_number"] or 1
+        if regular_ok:
+            results.append((True, f"TOEFL{num}, score is above the minimum requirement (90)", []))
+        elif mybest_ok:
+            results.append((True, f"TOEFL{num} (MyBest), score is above the minimum requirement (90)", []))
+        elif row_below[4]:
+            results.append((False, None, [f"TOEFL{num} (Total)"]))
+        elif row_below[:4].any():
+            failed_sections = [
+                name for name, failed in zip(_TOEFL_SECTION_NAMES, row_below[:4]) if failed
+            ]
+            results.append((False, None, [f"TOEFL{num} ({', '.join(failed_sections)})"]))
+        else:
+            results.append((False, None, [f"TOEFL{num}"]))
+    return results
 
-    # Track failures
-    failed_sections = []
-    total_failed = False
 
-    if all(v is not None for v in (L, W, R, S, T)):
-        if L < TOEFL_LR_MIN:
-            failed_sections.append("Listening")
-        if R < TOEFL_LR_MIN:
-            failed_sections.append("Reading")
-        if W < TOEFL_WS_MIN:
-            failed_sections.append("Writing")
-        if S < TOEFL_WS_MIN:
-            failed_sections.append("Speaking")
-        if T < TOEFL_TOTAL_MIN:
-            total_failed = True
+def check_toefl_pass(row):
+    """
+    Check if TOEFL scores meet the requirements.
 
-    if total_failed and failed_sections:
-        return False, None, [f"TOEFL{num} (Total)"]
-    elif failed_sections:
-        return False, None, [f"TOEFL{num} ({', '.join(failed_sections)})"]
-    elif total_failed:
-        return False, None, [f"TOEFL{num} (Total)"]
-    else:
-        return False, None, [f"TOEFL{num}"]
+    @return: Tuple of (passed, description, failed_sections)
+    """
+    return check_toefl_rows([row])[0]
 
 
 def check_ielts_pass(row):
@@ -137,197 +161,258 @@ def check_ielts_pass(row):
         return False, None, [f"IELTS{num}"]
 
 
-def compute_english_status(user_code: str, not_required_rule=None):
+def check_cael_pass(row):
+    """Check if CAEL scores meet the requirements."""
+    R = safe_int(row["reading"])
+    L = safe_int(row["listening"])
+    W = safe_int(row["writing"])
+    S = safe_int(row["speaking"])
+    if all(v is not None for v in (R, L, W, S)) and min(R, L, W, S) >= CAEL_EACH_MIN:
+        return True, "CAEL, all sections >= 60", []
+
+    failed_sections = []
+    if all(v is not None for v in (R, L, W, S)):
+        if R < CAEL_EACH_MIN:
+            failed_sections.append("Reading")
+        if L < CAEL_EACH_MIN:
+            failed_sections.append("Listening")
+        if W < CAEL_EACH_MIN:
+            failed_sections.append("Writing")
+        if S < CAEL_EACH_MIN:
+            failed_sections.append("Speaking")
+    if failed_sections:
+        return False, None, [f"CAEL ({', '.join(failed_sections)})"]
+    return False, None, ["CAEL"]
+
+
+def evaluate_english_status(toefl_rows, ielts_rows, melab=None, pte=None, cael=None,
+                            toefl_checked=None):
+    """
+    Decide an applicant's English status from their test rows, using the
+    first test that meets the minimum requirements.
+
+    Order: TOEFL -> IELTS -> MELAB -> PTE -> CAEL
+
+    @param toefl_rows: TOEFL rows in toefl_number order
+    @param ielts_rows: IELTS rows in ielts_number order
+    @param melab: MELAB row or None
+    @param pte: PTE row or None
+    @param cael: CAEL row or None
+    @param toefl_checked: Optional check_toefl_rows(toefl_rows), already computed
+    @return: Tuple of (english_status, english_description, english)
+    """
+    failed_tests = []
+
+    # 1) TOEFL
+    if toefl_checked is None:
+        toefl_checked = check_toefl_rows(toefl_rows)
+    for passed, description, failures in toefl_checked:
+        if passed:
+            return "Passed", description, True
+        failed_tests.extend(failures)
+
+    # 2) IELTS
+    for row in ielts_rows:
+        passed, description, failures = check_ielts_pass(row)
+        if passed:
+            return "Passed", description, True
+        failed_tests.extend(failures)
+
+    # 3) MELAB
+    if melab is not None:
+        total = safe_int(melab["total"])
+        if total is not None and total >= MELAB_TOTAL_MIN:
+            return "Passed", "MELAB, score is above the minimum requirement (64)", True
+        failed_tests.append("MELAB")
+
+    # 4) PTE
+    if pte is not None:
+        total = safe_int(pte["total"])
+        if total is not None and total >= PTE_TOTAL_MIN:
+            return "Passed", "PTE, score is above the minimum requirement (65)", True
+        failed_tests.append("PTE")
+
+    # 5) CAEL
+    if cael is not None:
+        passed, description, failures = check_cael_pass(cael)
+        if passed:
+            return "Passed", description, True
+        failed_tests.extend(failures)
+
+    # Finalize result
+    if not failed_tests:
+        return "Not Met", "No English tests submitted", False
+    if len(failed_tests) == 1:
+        return "Not Met", f"{failed_tests[0]} is below the minimum requirement", False
+    return "Not Met", f"{', '.join(failed_tests)} are below the minimum requirement", False
+
+
+# Score columns read for each test
+_TOEFL_COLUMNS = """toefl_number, listening, structure_written, reading, speaking,
+                   total_score, mybest_listening, mybest_writing,
+                   mybest_reading, mybest_speaking, mybest_total"""
+_IELTS_COLUMNS = "ielts_number, listening, reading, writing, speaking, total_band_score"
+_MELAB_COLUMNS = "total"
+_PTE_COLUMNS = "total"
+_CAEL_COLUMNS = "reading, listening, writing, speaking"
+
+# Every test table for a set of applicants in one round-trip, as
+# (user_code, test, num, data) rows; num orders TOEFL/IELTS attempts and
+# data is the row's score columns as JSON
+_ALL_TESTS_QUERY = f"""
+SELECT t.user_code, 'toefl' AS test, t.toefl_number AS num, row_to_json(t) AS data
+  FROM (SELECT user_code, {_TOEFL_COLUMNS} FROM toefl WHERE user_code = ANY(%(user_codes)s)) t
+UNION ALL
+SELECT t.user_code, 'ielts', t.ielts_number, row_to_json(t)
+  FROM (SELECT user_code, {_IELTS_COLUMNS} FROM ielts WHERE user_code = ANY(%(user_codes)s)) t
+UNION ALL
+SELECT t.user_code, 'melab', 0, row_to_json(t)
+  FROM (SELECT user_code, {_MELAB_COLUMNS} FROM melab WHERE user_code = ANY(%(user_codes)s)) t
+UNION ALL
+SELECT t.user_code, 'pte', 0, row_to_json(t)
+  FROM (SELECT user_code, {_PTE_COLUMNS} FROM pte WHERE user_code = ANY(%(user_codes)s)) t
+UNION ALL
+SELECT t.user_code, 'cael', 0, row_to_json(t)
+  FROM (SELECT user_code, {_CAEL_COLUMNS} FROM cael WHERE user_code = ANY(%(user_codes)s)) t
+ORDER BY user_code, num
+"""
+
+_UPDATE_ENGLISH_QUERY = """
+UPDATE application_info AS a
+   SET english_status = v.status,
+       english_description = v.description,
+       english = v.english
+  FROM (VALUES %s) AS v (user_code, status, description, english)
+ WHERE a.user_code = v.user_code
+"""
+
+
+# Applicants in the batch with no row in any test table, marked in one statement
+_UPDATE_NO_TESTS_QUERY = """
+UPDATE application_info AS a
+   SET english_status = 'Not Met',
+       english_description = 'No English tests submitted',
+       english = FALSE
+ WHERE a.user_code = ANY(%(user_codes)s)
+   AND NOT EXISTS (SELECT 1 FROM toefl t WHERE t.user_code = a.user_code)
+   AND NOT EXISTS (SELECT 1 FROM ielts t WHERE t.user_code = a.user_code)
+   AND NOT EXISTS (SELECT 1 FROM melab t WHERE t.user_code = a.user_code)
+   AND NOT EXISTS (SELECT 1 FROM pte t WHERE t.user_code = a.user_code)
+   AND NOT EXISTS (SELECT 1 FROM cael t WHERE t.user_code = a.user_code)
+"""
+
+
+def compute_english_status(user_code: str, not_required_rule=None, cursor=None):
     """
     Compute english_status/english_description/english for a single applicant,
     using the first test that meets the minimum requirements.
 
     Order: TOEFL -> IELTS -> MELAB -> PTE -> CAEL
+
+    @param user_code: Applicant user code
+    @param not_required_rule: Optional hook (cursor, user_code) -> (exempt, reason)
+    @param cursor: Optional cursor to run on; the caller owns its transaction.
+                   When omitted, a pooled connection and transaction are used.
     """
-    status = None
-    desc = None
-    failed_tests = []
+    if cursor is None:
+        with db_transaction() as (conn, cursor):
+            _compute_english_statuses(cursor, [user_code], not_required_rule)
+    else:
+        _compute_english_statuses(cursor, [user_code], not_required_rule)
+
+
+def compute_english_status_bulk(user_codes, not_required_rule=None):
+    """
+    Recompute English status for many applicants in one transaction.
+
+    Reads every test table for the whole batch with one query, marks applicants
+    with no tests at all in one UPDATE, evaluates the rest in memory and writes
+    their results with a single UPDATE ... FROM (VALUES ...).
+
+    @param user_codes: Iterable of applicant user codes
+    @param not_required_rule: Optional hook (cursor, user_code) -> (exempt, reason)
+    """
+    user_codes = list(user_codes)
+    if not user_codes:
+        return
 
     with db_transaction() as (conn, cursor):
+        _compute_english_statuses(cursor, user_codes, not_required_rule)
+
 
+def _compute_english_statuses(cursor, user_codes, not_required_rule):
+    """Evaluate and store English status for user_codes on the given cursor."""
+    tests_by_user = {}
+    cursor.execute(_ALL_TESTS_QUERY, {"user_codes": user_codes})
+    for row in cursor.fetchall():
+        tests = tests_by_user.setdefault(
+            row["user_code"], {"toefl": [], "ielts": [], "melab": [], "pte": [], "cael": []}
+        )
+        tests[row["test"]].append(row["data"])
+
+    # TOEFL thresholds for the whole batch in one vectorized pass
+    toefl_checked = iter(check_toefl_rows(
+        [row for tests in tests_by_user.values() for row in tests["toefl"]]
+    ))
+    for tests in tests_by_user.values():
+        tests["toefl_checked"] = list(islice(toefl_checked, len(tests["toefl"])))
+
+    # Without a "Not Required" hook to consult, applicants with no tests at all
+    # are settled by one set-based UPDATE and skipped below
+    if not callable(not_required_rule):
+        cursor.execute(_UPDATE_NO_TESTS_QUERY, {"user_codes": user_codes})
+        user_codes = [user_code for user_code in user_codes if user_code in tests_by_user]
+
+    results = []
+    for user_code in user_codes:
         # Optional "Not Required" rule hook
         if callable(not_required_rule):
             nr_ok, nr_reason = not_required_rule(cursor, user_code)
             if nr_ok:
-                status = "Not Required"
-                desc = nr_reason or "Exempt from English requirement"
-                cursor.execute(
-                    """
-                    UPDATE application_info
-                       SET english_status = %s,
-                           english_description = %s,
-                           english = TRUE
-                     WHERE user_code = %s
-                    """,
-                    (status, desc, user_code),
-                )
-                return
-
-        # 1) TOEFL
-        cursor.execute(
-            """
-            SELECT toefl_number, listening, structure_written, reading, speaking,
-                   total_score, mybest_listening, mybest_writing,
-                   mybest_reading, mybest_speaking, mybest_total
-              FROM toefl
-             WHERE user_code = %s
-             ORDER BY toefl_number
-            """,
-            (user_code,),
-        )
-        for row in cursor.fetchall():
-            passed, description, failures = check_toefl_pass(row)
-            if passed:
-                status = "Passed"
-                desc = description
-                break
-            failed_tests.extend(failures)
-
-        if status == "Passed":
-            _update_english_passed(cursor, user_code, status, desc)
-            return
-
-        # 2) IELTS
-        cursor.execute(
-            """
-            SELECT ielts_number, listening, reading, writing, speaking, total_band_score
-              FROM ielts
-             WHERE user_code = %s
-             ORDER BY ielts_number
-            """,
-            (user_code,),
-        )
-        for row in cursor.fetchall():
-            passed, description, failures = check_ielts_pass(row)
-            if passed:
-                status = "Passed"
-                desc = description
-                break
-            failed_tests.extend(failures)
-
-        if status == "Passed":
-            _update_english_passed(cursor, user_code, status, desc)
-            return
-
-        # 3) MELAB
-        cursor.execute("SELECT total FROM melab WHERE user_code = %s", (user_code,))
-        melab = cursor.fetchone()
-        if melab is not None:
-            total = safe_int(melab["total"])
-            if total is not None and total >= MELAB_TOTAL_MIN:
-                status = "Passed"
-                desc = "MELAB, score is above the minimum requirement (64)"
-            else:
-                failed_tests.append("MELAB")
-
-        if status == "Passed":
-            _update_english_passed(cursor, user_code, status, desc)
-            return
-
-        # 4) PTE
-        cursor.execute("SELECT total FROM pte WHERE user_code = %s", (user_code,))
-        pte = cursor.fetchone()
-        if pte is not None:
-            total = safe_int(pte["total"])
-            if total is not None and total >= PTE_TOTAL_MIN:
-                status = "Passed"
-                desc = "PTE, score is above the minimum requirement (65)"
-            else:
-                failed_tests.append("PTE")
-
-        if status == "Passed":
-            _update_english_passed(cursor, user_code, status, desc)
-            return
-
-        # 5) CAEL
-        cursor.execute(
-            "SELECT reading, listening, writing, speaking FROM cael WHERE user_code = %s",
-            (user_code,),
-        )
-        cael = cursor.fetchone()
-        if cael is not None:
-            R = safe_int(cael["reading"])
-            L = safe_int(cael["listening"])
-            W = safe_int(cael["writing"])
-            S = safe_int(cael["speaking"])
-            if all(v is not None for v in (R, L, W, S)) and min(R, L, W, S) >= CAEL_EACH_MIN:
-                status = "Passed"
-                desc = "CAEL, all sections >= 60"
-            else:
-                failed_sections = []
-                if all(v is not None for v in (R, L, W, S)):
-                    if R < CAEL_EACH_MIN:
-                        failed_sections.append("Reading")
-                    if L < CAEL_EACH_MIN:
-                        failed_sections.append("Listening")
-                    if W < CAEL_EACH_MIN:
-                        failed_sections.append("Writing")
-                    if S < CAEL_EACH_MIN:
-                        failed_sections.append("Speaking")
-                if failed_sections:
-                    failed_tests.append(f"CAEL ({', '.join(failed_sections)})")
-                else:
-                    failed_tests.append("CAEL")
-
-        # Finalize result
-        if status == "Passed":
-            _update_english_passed(cursor, user_code, status, desc)
+                results.append((
+                    user_code, "Not Required",
+                    nr_reason or "Exempt from English requirement", True,
+                ))
+                continue
+
+        tests = tests_by_user.get(user_code)
+        if tests is None:
+            status, desc, english = evaluate_english_status((), ())
         else:
-            if not failed_tests:
-                cursor.execute(
-                    """
-                    UPDATE application_info
-                       SET english_status = 'Not Met',
-                           english_description = 'No English tests submitted',
-                           english = FALSE
-                     WHERE user_code = %s
-                    """,
-                    (user_code,),
-                )
-            else:
-                if len(failed_tests) == 1:
-                    desc_text = f"{failed_tests[0]} is below the minimum requirement"
-                else:
-                    desc_text = f"{', '.join(failed_tests)} are below the minimum requirement"
-
-                cursor.execute(
-                    """
-                    UPDATE application_info
-                    SET english_status = 'Not Met',
-                        english_description = %s,
-                        english = FALSE
-                    WHERE user_code = %s
-                    """,
-                    (desc_text, user_code),
-                )
-
-
-def _update_english_passed(cursor, user_code, status, desc):
-    """Helper to update application_info with passed English status."""
-    cursor.execute(
-        """
-        UPDATE application_info
-           SET english_status = %s,
-               english_description = %s,
-               english = TRUE
-         WHERE user_code = %s
-        """,
-        (status, desc, user_code),
-    )
+            status, desc, english = evaluate_english_status(
+                tests["toefl"],
+                tests["ielts"],
+                tests["melab"][0] if tests["melab"] else None,
+                tests["pte"][0] if tests["pte"] else None,
+                tests["cael"][0] if tests["cael"] else None,
+                toefl_checked=tests["toefl_checked"],
+            )
+        results.append((user_code, status, desc, english))
+
+    if results:
+        # One page, so the whole batch is written by a single UPDATE statement
+        execute_values(cursor, _UPDATE_ENGLISH_QUERY, results, page_size=len(results))
+
+
+# Applicants recomputed per transaction by compute_english_status_for_all
+ENGLISH_STATUS_BATCH = 2000
 
 
 def compute_english_status_for_all(not_required_rule=None):
     """
     Recompute english_status for every row in application_info.
+
+    Runs the bulk path over batches of ENGLISH_STATUS_BATCH applicants, each
+    committed in its own transaction, so the fetched test rows and the row
+    locks held stay bounded however many applicants there are.
+
+    @param not_required_rule: Optional hook (cursor, user_code) -> (exempt, reason)
     """
     with db_connection() as (conn, cursor):
         cursor.execute("SELECT user_code FROM application_info ORDER BY user_code")
         codes = [r["user_code"] for r in cursor.fetchall()]
 
-    for code in codes:
-        compute_english_status(code, not_required_rule=not_required_rule)
+    for start in range(0, len(codes), ENGLISH_STATUS_BATCH):
+        compute_english_status_bulk(
+            codes[start:start + ENGLISH_STATUS_BATCH], not_required_rule=not_required_rule
+        )
@@ -5,8 +5,11 @@ This module handles export operations for applicant data, including
 selected applicant exports and complete database exports.
 """
 
+import logging
 from utils.db_helpers import db_connection
 
+logger = logging.getLogger(__name__)
+
 
 def get_selected_applicants_for_export(user_codes, sections=None):
     """
@@ -120,8 +123,6 @@ def get_selected_applicants_for_export(user_codes, sections=None):
             if not select_parts:
                 select_parts = ["ai.user_code as \"User Code\""]
 
-            placeholders = ','.join(['%s'] * len(user_codes))
-
             query = f"""
                 SELECT {', '.join(select_parts)}
                 FROM applicant_info ai
@@ -129,17 +130,16 @@ def get_selected_applicants_for_export(user_codes, sections=None):
                 LEFT JOIN application_info app ON ai.user_code = app.user_code
                 LEFT JOIN sessions s ON ai.session_id = s.id
                 LEFT JOIN program_info pi ON ai.user_code = pi.user_code
-                WHERE ai.user_code IN ({placeholders})
+                WHERE ai.user_code = ANY(%s)
                 ORDER BY ai.family_name, ai.given_name
             """
 
-            cursor.execute(query, tuple(user_codes))
+            # One array parameter however many applicants are selected
+            cursor.execute(query, (list(user_codes),))
             return cursor.fetchall(), None
 
     except Exception as e:
-        print(f"Error in get_selected_applicants_for_export: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in get_selected_applicants_for_export")
         return None, f"Database error: {str(e)}"
 
 
@@ -326,24 +326,9 @@ def get_all_applicants_complete_export():
                         '[]'::json
                     ) AS "Institution History",
 
-                    -- Ratings & Comments (Aggregated as JSON)
-                    COALESCE(
-                        (SELECT JSON_AGG(
-                            JSON_BUILD_OBJECT(
-                                'rating', r.rating,
-                                'comment', r.user_comment,
-                                'reviewer_name', u.first_name || ' ' || u.last_name
-                            ) ORDER BY r.created_at DESC
-                        ) FROM ratings r
-                        JOIN "user" u ON r.user_id = u.id
-                        WHERE r.user_code = ai.user_code),
-                        '[]'::json
-                    ) AS "Ratings and Comments",
-
-                    -- Average Rating
-                    (SELECT ROUND(AVG(r.rating), 2)
-                     FROM ratings r
-                     WHERE r.user_code = ai.user_code AND r.rating IS NOT NULL) AS "Average Rating",
+                    -- Ratings & Comments (Aggregated as JSON) and Average Rating
+                    COALESCE(rt.ratings_and_comments, '[]'::json) AS "Ratings and Comments",
+                    rt.average_rating AS "Average Rating",
 
                     -- Timestamps
                     TO_CHAR(ai.created_at, 'MM/DD/YYYY HH24:MI:SS') AS "Created At",
@@ -359,6 +344,21 @@ def get_all_applicants_complete_export():
                 LEFT JOIN gre ON ai.user_code = gre.user_code
                 LEFT JOIN gmat ON ai.user_code = gmat.user_code
                 LEFT JOIN duolingo ON ai.user_code = duolingo.user_code
+                -- One pass over each applicant's ratings for both the JSON and the average
+                LEFT JOIN LATERAL (
+                    SELECT
+                        JSON_AGG(
+                            JSON_BUILD_OBJECT(
+                                'rating', r.rating,
+                                'comment', r.user_comment,
+                                'reviewer_name', u.first_name || ' ' || u.last_name
+                            ) ORDER BY r.created_at DESC
+                        ) FILTER (WHERE u.id IS NOT NULL) AS ratings_and_comments,
+                        ROUND(AVG(r.rating), 2) AS average_rating
+                    FROM ratings r
+                    LEFT JOIN "user" u ON r.user_id = u.id
+                    WHERE r.user_code = ai.user_code
+                ) rt ON true
                 ORDER BY ai.family_name, ai.given_name
             """
 
@@ -366,7 +366,5 @@ def get_all_applicants_complete_export():
             return cursor.fetchall(), None
 
     except Exception as e:
-        print(f"Error in get_all_applicants_complete_export: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in get_all_applicants_complete_export")
         return None, f"Database error: {str(e)}"
@@ -98,7 +98,6 @@ def save_document(user_code, document_type, filename, original_filename,
                   current_time, current_time))
 
             document_id = cursor.fetchone()['id']
-            #print(document_id)
             return document_id, None
 
     except Exception as e:
@@ -0,0 +1,132 @@
+"""
+Import Jobs Model
+
+Database operations for background CSV import jobs. Job state lives in the
+import_jobs table so that any worker process can answer a status poll.
+"""
+
+from psycopg2.extras import Json
+from utils.db_helpers import db_connection, db_transaction
+
+# Finished/failed jobs are kept this long for status polls, then purged
+IMPORT_JOB_RETENTION = "1 day"
+
+# Columns reported to clients polling a job
+_PUBLIC_COLUMNS = "job_id, status, message, result, unmatched_sessions"
+
+
+def create_import_job(job_id, file_path, user_id, admin_email, host, pid):
+    """
+    Record a queued import job, purging old finished/failed jobs.
+
+    @param job_id: Unique job identifier
+    @param file_path: Path of the uploaded CSV on disk
+    @param user_id: Id of the uploading user (re-loaded if the job is resumed)
+    @param admin_email: Email of the uploading user
+    @param host: Hostname of the worker process that queued the job
+    @param pid: Process id of that worker
+    @return: Tuple of (success, error_message)
+    """
+    try:
+        with db_transaction() as (conn, cursor):
+            cursor.execute(
+                f"""
+                DELETE FROM import_jobs
+                WHERE status IN ('finished', 'failed')
+                  AND updated_at < NOW() - INTERVAL '{IMPORT_JOB_RETENTION}'
+                """
+            )
+            cursor.execute(
+                """
+                INSERT INTO import_jobs (job_id, status, file_path, user_id, admin_email, host, pid)
+                VALUES (%s, 'queued', %s, %s, %s, %s, %s)
+                """,
+                (job_id, file_path, user_id, admin_email, host, pid),
+            )
+        return True, None
+
+    except Exception as e:
+        return False, f"Database error: {str(e)}"
+
+
+def update_import_job(job_id, status, message=None, result=None, unmatched_sessions=None):
+    """
+    Set a job's status and outcome.
+
+    @param job_id: Job identifier
+    @param status: One of queued, started, finished, failed
+    @param message: Optional failure message
+    @param result: Optional result dict for a finished job
+    @param unmatched_sessions: Optional list of sessions missing for a failed job
+    @return: Tuple of (success, error_message)
+    """
+    try:
+        with db_transaction() as (conn, cursor):
+            cursor.execute(
+                """
+                UPDATE import_jobs
+                SET status = %s, message = %s, result = %s, unmatched_sessions = %s,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE job_id = %s
+                """,
+                (
+                    status, message,
+                    Json(result) if result is not None else None,
+                    Json(unmatched_sessions) if unmatched_sessions is not None else None,
+                    job_id,
+                ),
+            )
+        return True, None
+
+    except Exception as e:
+        return False, f"Database error: {str(e)}"
+
+
+def get_import_job(job_id):
+    """
+    Get a job's public status record.
+
+    @param job_id: Job identifier
+    @return: Tuple of (job_dict or None, error_message)
+    """
+    try:
+        with db_connection() as (conn, cursor):
+            cursor.execute(
+                f"SELECT {_PUBLIC_COLUMNS}, host, pid FROM import_jobs WHERE job_id = %s",
+                (job_id,),
+            )
+            return cursor.fetchone(), None
+
+    except Exception as e:
+        return None, f"Database error: {str(e)}"
+
+
+def claim_import_job(job_id, old_pid, host, pid):
+    """
+    Hand a queued/started job over from a dead worker to this one.
+
+    The UPDATE only matches while the job still names old_pid, so when several
+    workers notice the same orphan only one of them claims it.
+
+    @param job_id: Job identifier
+    @param old_pid: Process id recorded for the dead worker
+    @param host: Hostname of the claiming worker
+    @param pid: Process id of the claiming worker
+    @return: Tuple of (job_dict with file_path/user_id/admin_email or None, error_message)
+    """
+    try:
+        with db_transaction() as (conn, cursor):
+            cursor.execute(
+                """
+                UPDATE import_jobs
+                SET pid = %s, status = 'queued', updated_at = CURRENT_TIMESTAMP
+                WHERE job_id = %s AND host = %s AND pid = %s
+                  AND status IN ('queued', 'started')
+                RETURNING job_id, file_path, user_id, admin_email
+                """,
+                (pid, job_id, host, old_pid),
+            )
+            return cursor.fetchone(), None
+
+    except Exception as e:
+        return None, f"Database error: {str(e)}"
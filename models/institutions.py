@@ -1,206 +1,180 @@
+import logging
 import pandas as pd
-from datetime import datetime
+from datetime import date
+
+logger = logging.getLogger(__name__)
+
+
+# Columns of one institution_info row, in the order build_institution_rows emits them
+INSTITUTION_COLUMNS = (
+    "user_code", "institution_number", "institution_code", "full_name", "country",
+    "start_date", "end_date", "program_study", "degree_confer_code", "degree_confer",
+    "date_confer", "credential_receive_code", "credential_receive", "expected_confer_date",
+    "expected_credential_code", "expected_credential", "honours", "fail_withdraw", "reason", "gpa",
+    "created_at", "updated_at",
+)
+
+_INSTITUTION_UPDATE_COLUMNS = INSTITUTION_COLUMNS[2:-2]
+
+# ON CONFLICT clause shared by the per-row and staged (bulk) upserts
+_INSTITUTION_ON_CONFLICT = """
+ON CONFLICT (user_code, institution_number) DO UPDATE SET
+    {set_list},
+    updated_at = CASE
+        WHEN ({existing}) IS DISTINCT FROM ({excluded})
+        THEN EXCLUDED.updated_at
+        ELSE institution_info.updated_at
+    END
+""".format(
+    set_list=",\n    ".join(f"{col} = EXCLUDED.{col}" for col in _INSTITUTION_UPDATE_COLUMNS),
+    existing=", ".join(f"institution_info.{col}" for col in _INSTITUTION_UPDATE_COLUMNS),
+    excluded=", ".join(f"EXCLUDED.{col}" for col in _INSTITUTION_UPDATE_COLUMNS),
+)
+
+INSTITUTION_UPSERT = f"""
+INSERT INTO institution_info ({", ".join(INSTITUTION_COLUMNS)})
+VALUES ({", ".join(["%s"] * len(INSTITUTION_COLUMNS))})
+{_INSTITUTION_ON_CONFLICT}
+"""
+
+# {stage} is filled in with a staging table holding INSTITUTION_COLUMNS.
+# Returns each written row's key and updated_at; a row was inserted or
+# changed when updated_at equals the staged timestamp.
+INSTITUTION_STAGE_UPSERT = f"""
+INSERT INTO institution_info ({", ".join(INSTITUTION_COLUMNS)})
+SELECT {", ".join(INSTITUTION_COLUMNS)} FROM {{stage}}
+{_INSTITUTION_ON_CONFLICT}
+RETURNING user_code, institution_number, updated_at
+"""
+
+
+# Date cells read by build_institution_rows; CSV imports parse these column-wise
+INSTITUTION_DATE_COLUMNS = tuple(
+    f"I{i} {suffix}"
+    for i in range(1, 7)
+    for suffix in (
+        "Start Date", "End Date or Expected End Date",
+        "If Yes, Date Conferred", "Expected Conferred Date",
+    )
+)
+
+
+def _parse_date(value):
+    """Parse a CSV date cell, returning None when missing or invalid."""
+    if type(value) is date:  # already parsed column-wise
+        return value
+    if pd.isna(value):
+        return None
+    try:
+        return pd.to_datetime(value).date()
+    except Exception:
+        return None
+
+
+def _safe_str(value):
+    """Convert a CSV cell to a stripped string, None when missing or blank."""
+    if pd.isna(value):
+        return None
+    return str(value).strip() if str(value).strip() else None
+
+
+def build_institution_rows(user_code, row, current_time):
+    """
+    Build institution_info parameter tuples (INSTITUTION_COLUMNS order) for a CSV row.
+
+    @param user_code: Unique identifier for the applicant
+    @param row: CSV row as a dict of column name → value
+    @param current_time: Timestamp for created_at/updated_at
+    @return: List of tuples, one per institution entry (I1-I6) with data
+    """
+    rows = []
+
+    # Process up to 6 institutions (I1 through I6)
+    for i in range(1, 7):
+        prefix = f"I{i}"
+
+        # Check if this institution entry has data
+        institution_code = row.get(f"{prefix} Institution CODE")
+        if pd.isna(institution_code):
+            continue
+
+        # Convert withdrawal/failure to string (VARCHAR(3))
+        fail_withdraw = None
+        withdraw_field = row.get(
+            f"{prefix} Were you required to withdraw or did you have a failed year from this institution?"
+        )
+        if pd.isna(withdraw_field):
+            # For I4-I6, check the "Withdrawal?" field instead
+            withdraw_field = row.get(f"{prefix} Withdrawal?")
+
+        if pd.notna(withdraw_field):
+            # Convert to string limited to 3 characters for VARCHAR(3)
+            withdraw_str = str(withdraw_field).strip()[:3]
+            fail_withdraw = withdraw_str if withdraw_str else None
+
+        rows.append((
+            user_code,
+            i,  # institution_number (1-6)
+            _safe_str(institution_code),
+            _safe_str(row.get(f"{prefix} Full Institution Name")),
+            _safe_str(row.get(f"{prefix} Institution Country")),
+            _parse_date(row.get(f"{prefix} Start Date")),
+            _parse_date(row.get(f"{prefix} End Date or Expected End Date")),
+            _safe_str(row.get(f"{prefix} Program of Study")),
+            _safe_str(row.get(f"{prefix} Degree Conferred? CODE")),
+            _safe_str(row.get(f"{prefix} Degree Conferred?")),
+            _parse_date(row.get(f"{prefix} If Yes, Date Conferred")),
+            _safe_str(row.get(f"{prefix} Credential Received CODE")),
+            _safe_str(row.get(f"{prefix} Credential Received")),
+            _parse_date(row.get(f"{prefix} Expected Conferred Date")),
+            _safe_str(row.get(f"{prefix} Expected Credential CODE")),
+            _safe_str(row.get(f"{prefix} Expected Credential")),
+            _safe_str(row.get(f"{prefix} Honours")),
+            fail_withdraw,
+            _safe_str(row.get(f"{prefix} Provide Details/Reason")),
+            _safe_str(row.get(f"{prefix} Self Reported GPA")),
+            current_time,  # created_at
+            current_time,  # updated_at
+        ))
+
+    return rows
 
 
 def process_institution_info(user_code, row, cursor, current_time):
     """
     Process and insert institutional/academic history from CSV data.
-    
+
     Processes academic history information from CSV rows and inserts
     into the institution_info table. Handles multiple institutions
-    and academic credentials per applicant.
-    
+    and academic credentials per applicant. CSV imports use the batched
+    staging path in models.applicants.csv_processing instead.
+
     @param cursor: Database cursor for executing queries
     @param_type cursor: psycopg2.cursor
     @param user_code: Unique identifier for the applicant
     @param_type user_code: str
-    @param df_row: Pandas DataFrame row containing CSV data
-    @param_type df_row: pandas.Series
-    
-    @return: None (inserts directly into database)
-    @return_type: None
-    
+    @param row: CSV row as a dict of column name → value
+    @param_type row: dict
+
+    @return: True if any institution row was inserted or changed
+    @return_type: bool
+
     @db_tables: institution_info
     @csv_columns: Processes various institution-related columns from CSV
     @validation: Handles missing data and format conversion
-    
+
     @example:
-        process_institution_info(cursor, "12345", df_row)
+        process_institution_info("12345", row, cursor, datetime.now())
         # Processes and inserts institutional history from CSV row
     """
-
-    """Process institution information for a student (up to 6 institutions)"""
     data_changed = False
     try:
-         # Check existing institution data before processing
-        cursor.execute("SELECT institution_number, updated_at FROM institution_info WHERE user_code = %s ORDER BY institution_number", (user_code,))
-        old_institution_records = cursor.fetchall()
-        old_institution_dict = {record["institution_number"]: record["updated_at"] for record in old_institution_records} if old_institution_records else {}
-
-        # Process up to 6 institutions (I1 through I6)
-        for i in range(1, 7):
-            prefix = f"I{i}"
-
-            # Check if this institution entry has data
-            institution_code = row.get(f"{prefix} Institution CODE")
-            if pd.isna(institution_code):
-                continue
-
-            # Parse start date
-            start_date = None
-            if pd.notna(row.get(f"{prefix} Start Date")):
-                try:
-                    start_date = pd.to_datetime(row.get(f"{prefix} Start Date")).date()
-                except:
-                    start_date = None
-
-            # Parse end date
-            end_date = None
-            if pd.notna(row.get(f"{prefix} End Date or Expected End Date")):
-                try:
-                    end_date = pd.to_datetime(
-                        row.get(f"{prefix} End Date or Expected End Date")
-                    ).date()
-                except:
-                    end_date = None
-
-            # Parse date conferred
-            date_confer = None
-            if pd.notna(row.get(f"{prefix} If Yes, Date Conferred")):
-                try:
-                    date_confer = pd.to_datetime(
-                        row.get(f"{prefix} If Yes, Date Conferred")
-                    ).date()
-                except:
-                    date_confer = None
-
-            # Parse expected conferred date
-            expected_confer_date = None
-            if pd.notna(row.get(f"{prefix} Expected Conferred Date")):
-                try:
-                    expected_confer_date = pd.to_datetime(
-                        row.get(f"{prefix} Expected Conferred Date")
-                    ).date()
-                except:
-                    expected_confer_date = None
-
-            # Convert withdrawal/failure to string (VARCHAR(3))
-            fail_withdraw = None
-            withdraw_field = row.get(
-                f"{prefix} Were you required to withdraw or did you have a failed year from this institution?"
-            )
-            if pd.isna(withdraw_field):
-                # For I4-I6, check the "Withdrawal?" field instead
-                withdraw_field = row.get(f"{prefix} Withdrawal?")
-
-            if pd.notna(withdraw_field):
-                # Convert to string limited to 3 characters for VARCHAR(3)
-                withdraw_str = str(withdraw_field).strip()[:3]
-                fail_withdraw = withdraw_str if withdraw_str else None
-
-            # Helper function to safely convert values to strings
-            def safe_str(value):
-                if pd.isna(value):
-                    return None
-                return str(value).strip() if str(value).strip() else None
-
-            institution_query = """
-            INSERT INTO institution_info (
-                user_code, institution_number, institution_code, full_name, country,
-                start_date, end_date, program_study, degree_confer_code, degree_confer,
-                date_confer, credential_receive_code, credential_receive, expected_confer_date,
-                expected_credential_code, expected_credential, honours, fail_withdraw, reason, gpa,
-                created_at, updated_at
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            )
-            ON CONFLICT (user_code, institution_number) DO UPDATE SET
-                institution_code = EXCLUDED.institution_code,
-                full_name = EXCLUDED.full_name,
-                country = EXCLUDED.country,
-                start_date = EXCLUDED.start_date,
-                end_date = EXCLUDED.end_date,
-                program_study = EXCLUDED.program_study,
-                degree_confer_code = EXCLUDED.degree_confer_code,
-                degree_confer = EXCLUDED.degree_confer,
-                date_confer = EXCLUDED.date_confer,
-                credential_receive_code = EXCLUDED.credential_receive_code,
-                credential_receive = EXCLUDED.credential_receive,
-                expected_confer_date = EXCLUDED.expected_confer_date,
-                expected_credential_code = EXCLUDED.expected_credential_code,
-                expected_credential = EXCLUDED.expected_credential,
-                honours = EXCLUDED.honours,
-                fail_withdraw = EXCLUDED.fail_withdraw,
-                reason = EXCLUDED.reason,
-                gpa = EXCLUDED.gpa,
-                updated_at = CASE 
-                    WHEN institution_info.institution_code IS DISTINCT FROM EXCLUDED.institution_code
-                      OR institution_info.full_name IS DISTINCT FROM EXCLUDED.full_name
-                      OR institution_info.country IS DISTINCT FROM EXCLUDED.country
-                      OR institution_info.start_date IS DISTINCT FROM EXCLUDED.start_date
-                      OR institution_info.end_date IS DISTINCT FROM EXCLUDED.end_date
-                      OR institution_info.program_study IS DISTINCT FROM EXCLUDED.program_study
-                      OR institution_info.degree_confer_code IS DISTINCT FROM EXCLUDED.degree_confer_code
-                      OR institution_info.degree_confer IS DISTINCT FROM EXCLUDED.degree_confer
-                      OR institution_info.date_confer IS DISTINCT FROM EXCLUDED.date_confer
-                      OR institution_info.credential_receive_code IS DISTINCT FROM EXCLUDED.credential_receive_code
-                      OR institution_info.credential_receive IS DISTINCT FROM EXCLUDED.credential_receive
-                      OR institution_info.expected_confer_date IS DISTINCT FROM EXCLUDED.expected_confer_date
-                      OR institution_info.expected_credential_code IS DISTINCT FROM EXCLUDED.expected_credential_code
-                      OR institution_info.expected_credential IS DISTINCT FROM EXCLUDED.expected_credential
-                      OR institution_info.honours IS DISTINCT FROM EXCLUDED.honours
-                      OR institution_info.fail_withdraw IS DISTINCT FROM EXCLUDED.fail_withdraw
-                      OR institution_info.reason IS DISTINCT FROM EXCLUDED.reason
-                      OR institution_info.gpa IS DISTINCT FROM EXCLUDED.gpa
-                    THEN EXCLUDED.updated_at 
-                    ELSE institution_info.updated_at 
-                END
-            """
-
-            cursor.execute(
-                institution_query,
-                (
-                    user_code,
-                    i,  # institution_number (1-6)
-                    safe_str(institution_code),
-                    safe_str(row.get(f"{prefix} Full Institution Name")),
-                    safe_str(row.get(f"{prefix} Institution Country")),
-                    start_date,
-                    end_date,
-                    safe_str(row.get(f"{prefix} Program of Study")),
-                    safe_str(row.get(f"{prefix} Degree Conferred? CODE")),
-                    safe_str(row.get(f"{prefix} Degree Conferred?")),
-                    date_confer,
-                    safe_str(row.get(f"{prefix} Credential Received CODE")),
-                    safe_str(row.get(f"{prefix} Credential Received")),
-                    expected_confer_date,
-                    safe_str(row.get(f"{prefix} Expected Credential CODE")),
-                    safe_str(row.get(f"{prefix} Expected Credential")),
-                    safe_str(row.get(f"{prefix} Honours")),
-                    fail_withdraw,
-                    safe_str(row.get(f"{prefix} Provide Details/Reason")),
-                    safe_str(row.get(f"{prefix} Self Reported GPA")),
-                    current_time,  # created_at
-                    current_time,  # updated_at
-                ),
-            )
-
-        # Check if data changed after processing
-        cursor.execute("SELECT institution_number, updated_at FROM institution_info WHERE user_code = %s ORDER BY institution_number", (user_code,))
-        new_institution_records = cursor.fetchall()
-        new_institution_dict = {record["institution_number"]: record["updated_at"] for record in new_institution_records} if new_institution_records else {}
-        
-        # Detect changes
-        if len(old_institution_dict) != len(new_institution_dict):
-            data_changed = True
-        else:
-            for inst_num, new_timestamp in new_institution_dict.items():
-                old_timestamp = old_institution_dict.get(inst_num)
-                if old_timestamp != new_timestamp:
-                    data_changed = True
-                    break
+        for params in build_institution_rows(user_code, row, current_time):
+            cursor.execute(INSTITUTION_UPSERT + " RETURNING updated_at", params)
+            if cursor.fetchone()["updated_at"] == current_time:
+                data_changed = True
 
     except Exception as e:
-        print(f"Error processing institution info for {user_code}: {e}")
-    
-    return data_changed
\ No newline at end of file
+        logger.warning("Error processing institution info for %s: %s", user_code, e)
+
+    return data_changed
@@ -6,7 +6,7 @@ session archival, and applicant count aggregation. Supports multi-campus deploym
 (UBC Vancouver and UBC Okanagan) with proper session isolation.
 """
 
-from utils.db_helpers import db_connection, db_transaction
+from utils.db_helpers import db_connection, db_transaction, fetchall_dicts
 
 
 def find_session_by_abbrev(program_code: str, session_abbrev: str, campus: str | None = None):
@@ -82,7 +82,7 @@ def get_all_sessions(include_archived=False):
     @order: campus ASC, year DESC
     """
     try:
-        with db_connection() as (conn, cursor):
+        with db_connection(cursor_factory=None) as (conn, cursor):
             query = """
             SELECT
                 s.id,
@@ -110,11 +110,10 @@ def get_all_sessions(include_archived=False):
                 ORDER BY s.campus ASC, s.year DESC, s.session_abbrev DESC
             """
             cursor.execute(query)
-            result = cursor.fetchall()
+            result = fetchall_dicts(cursor)
 
         sessions_by_campus = {}
-        for session in result:
-            session_dict = dict(session)
+        for session_dict in result:
             campus = session_dict.get("campus", "")
             if campus not in sessions_by_campus:
                 sessions_by_campus[campus] = []
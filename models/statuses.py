@@ -5,9 +5,38 @@ Handles CRUD operations for the dynamic review status configuration system.
 Statuses are stored in the status_configuration table and used for application review workflow.
 """
 
+from dataclasses import dataclass
+from datetime import datetime
+
 from utils.db_helpers import db_connection, db_transaction
 
 
+@dataclass(slots=True)
+class Status:
+    """A status_configuration row. Field order matches _STATUS_COLUMNS."""
+
+    id: int
+    status_name: str
+    display_order: int
+    badge_color: str
+    is_active: bool
+    is_default: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+_STATUS_COLUMNS = """
+    id,
+    status_name,
+    display_order,
+    badge_color,
+    is_active,
+    is_default,
+    created_at,
+    updated_at
+"""
+
+
 def get_all_statuses():
     """
     Get all active review statuses for use in dropdowns.
@@ -16,31 +45,23 @@ def get_all_statuses():
     ordered by display_order for consistent dropdown rendering across the application.
 
     @return: Tuple of (statuses list, error message)
-    @return_type: tuple[list[dict] | None, str | None]
+    @return_type: tuple[list[Status] | None, str | None]
 
     @db_tables: status_configuration
     @filters: WHERE is_active = TRUE
     @order: display_order ASC
     """
     try:
-        with db_connection() as (conn, cursor):
+        with db_connection(cursor_factory=None) as (conn, cursor):
             cursor.execute(
-                """
-                SELECT
-                    s.id,
-                    s.status_name,
-                    s.display_order,
-                    s.badge_color,
-                    s.is_active,
-                    s.is_default,
-                    s.created_at,
-                    s.updated_at
-                FROM status_configuration AS s
-                WHERE s.is_active = TRUE
-                ORDER BY s.display_order ASC
+                f"""
+                SELECT {_STATUS_COLUMNS}
+                FROM status_configuration
+                WHERE is_active = TRUE
+                ORDER BY display_order ASC
                 """
             )
-            return cursor.fetchall(), None
+            return [Status(*row) for row in cursor.fetchall()], None
     except Exception as e:
         return None, f"Database error: {str(e)}"
 
@@ -53,30 +74,22 @@ def get_all_statuses_admin():
     used by admin interface for status configuration management.
 
     @return: Tuple of (statuses list, error message)
-    @return_type: tuple[list[dict] | None, str | None]
+    @return_type: tuple[list[Status] | None, str | None]
 
     @db_tables: status_configuration
     @filters: None (returns all)
     @order: display_order ASC
     """
     try:
-        with db_connection() as (conn, cursor):
+        with db_connection(cursor_factory=None) as (conn, cursor):
             cursor.execute(
-                """
-                SELECT
-                    id,
-                    status_name,
-                    display_order,
-                    badge_color,
-                    is_active,
-                    is_default,
-                    created_at,
-                    updated_at
+                f"""
+                SELECT {_STATUS_COLUMNS}
                 FROM status_configuration
                 ORDER BY display_order ASC
                 """
             )
-            return cursor.fetchall(), None
+            return [Status(*row) for row in cursor.fetchall()], None
     except Exception as e:
         return None, f"Database error: {str(e)}"
 
@@ -203,52 +216,61 @@ def delete_status(status_id):
     @return_type: tuple[bool, str]
 
     @process:
-        1. Check if status is the default (cannot delete)
-        2. Get the default status name in the same transaction
-        3. Count and reassign applicants with this status
-        4. Delete the status record
+        Single round-trip CTE that, in one statement snapshot:
+        1. Looks up the target status and the default status name
+        2. Reassigns applicants with the target status to the default
+        3. Deletes the status record (skipped for the default status)
 
     @db_tables: status_configuration, application_info
     """
     try:
-        affected_count = 0
         with db_transaction() as (conn, cursor):
             cursor.execute(
-                "SELECT is_default, status_name FROM status_configuration WHERE id = %s",
-                (status_id,),
+                """
+                WITH target AS (
+                    SELECT status_name, is_default
+                    FROM status_configuration
+                    WHERE id = %(status_id)s
+                ),
+                default_status AS (
+                    SELECT status_name
+                    FROM status_configuration
+                    WHERE is_default = TRUE
+                    LIMIT 1
+                ),
+                reassigned AS (
+                    UPDATE application_info
+                    SET sent = (SELECT status_name FROM default_status)
+                    WHERE sent = (SELECT status_name FROM target WHERE NOT is_default)
+                      AND EXISTS (SELECT 1 FROM default_status)
+                    RETURNING 1
+                ),
+                deleted AS (
+                    DELETE FROM status_configuration
+                    WHERE id = %(status_id)s
+                      AND NOT is_default
+                      AND EXISTS (SELECT 1 FROM default_status)
+                    RETURNING 1
+                )
+                SELECT
+                    EXISTS (SELECT 1 FROM target) AS found,
+                    COALESCE((SELECT is_default FROM target), FALSE) AS is_default,
+                    EXISTS (SELECT 1 FROM default_status) AS has_default,
+                    (SELECT COUNT(*) FROM reassigned) AS affected_count,
+                    (SELECT COUNT(*) FROM deleted) AS deleted_count
+                """,
+                {"status_id": status_id},
             )
             result = cursor.fetchone()
 
-            if not result:
-                return False, f"Status with ID {status_id} not found"
-            if result["is_default"]:
-                return False, "Cannot delete the default status"
-
-            status_name = result["status_name"]
-
-            cursor.execute(
-                "SELECT status_name FROM status_configuration WHERE is_default = TRUE LIMIT 1"
-            )
-            default_row = cursor.fetchone()
-            if not default_row:
-                return False, "Default status not found in system"
-
-            default_name = default_row["status_name"]
-
-            cursor.execute(
-                "SELECT COUNT(*) AS cnt FROM application_info WHERE sent = %s",
-                (status_name,),
-            )
-            affected_count = cursor.fetchone()["cnt"]
-
-            if affected_count > 0:
-                cursor.execute(
-                    "UPDATE application_info SET sent = %s WHERE sent = %s",
-                    (default_name, status_name),
-                )
-
-            cursor.execute("DELETE FROM status_configuration WHERE id = %s", (status_id,))
+        if not result["found"]:
+            return False, f"Status with ID {status_id} not found"
+        if result["is_default"]:
+            return False, "Cannot delete the default status"
+        if not result["has_default"]:
+            return False, "Default status not found in system"
 
+        affected_count = result["affected_count"]
         if affected_count > 0:
             return True, f"Status deleted and {affected_count} applicants reassigned to default"
         return True, "Status deleted successfully"
@@ -260,31 +282,24 @@ def get_default_status():
     """
     Get the default review status for reassignment operations.
 
-    @return: Default status dict or None if not found
-    @return_type: dict | None
+    @return: Default Status or None if not found
+    @return_type: Status | None
 
     @db_tables: status_configuration
     @filters: WHERE is_default = TRUE
     """
     try:
-        with db_connection() as (conn, cursor):
+        with db_connection(cursor_factory=None) as (conn, cursor):
             cursor.execute(
-                """
-                SELECT
-                    id,
-                    status_name,
-                    display_order,
-                    badge_color,
-                    is_active,
-                    is_default,
-                    created_at,
-                    updated_at
+                f"""
+                SELECT {_STATUS_COLUMNS}
                 FROM status_configuration
                 WHERE is_default = TRUE
                 LIMIT 1
                 """
             )
-            return cursor.fetchone()
+            row = cursor.fetchone()
+            return Status(*row) if row else None
     except Exception:
         return None
 
@@ -27,7 +27,7 @@ def process_toefl_scores(user_code, row, cursor, current_time):
     Process TOEFL test scores from CSV data.
 
     @param user_code: Unique identifier for the applicant
-    @param row: Pandas DataFrame row containing CSV data
+    @param row: CSV row as a dict of column name → value
     @param cursor: Database cursor for executing queries
     @param current_time: Timestamp for created_at/updated_at
     @return: True if data changed, False otherwise
@@ -40,7 +40,7 @@ def process_ielts_scores(user_code, row, cursor, current_time):
     Process IELTS test scores from CSV data.
 
     @param user_code: Unique identifier for the applicant
-    @param row: Pandas DataFrame row containing CSV data
+    @param row: CSV row as a dict of column name → value
     @param cursor: Database cursor for executing queries
     @param current_time: Timestamp for created_at/updated_at
     @return: True if data changed, False otherwise
@@ -53,7 +53,7 @@ def process_other_test_scores(user_code, row, cursor, current_time):
     Process other test scores (MELAB, PTE, CAEL, CELPIP, ALT ELPP, GRE, GMAT).
 
     @param user_code: Unique identifier for the applicant
-    @param row: Pandas DataFrame row containing CSV data
+    @param row: CSV row as a dict of column name → value
     @param cursor: Database cursor for executing queries
     @param current_time: Timestamp for created_at/updated_at
     @return: True if any data changed, False otherwise
@@ -80,7 +80,9 @@ def process_other_test_scores(user_code, row, cursor, current_time):
 
 def save_duolingo_score(user_code, score, description, date_written, current_time):
     """
-    Upsert a Duolingo score record.
+    Upsert a Duolingo score record in a single statement.
+
+    Re-saving identical values is a no-op (no row rewrite, updated_at kept).
 
     @param user_code: Unique identifier for the applicant
     @param score: Duolingo test score (int, 0-160, or None)
@@ -98,6 +100,8 @@ def save_duolingo_score(user_code, score, description, date_written, current_tim
                 description = EXCLUDED.description,
                 date_written = EXCLUDED.date_written,
                 updated_at = EXCLUDED.updated_at
+            WHERE (duolingo.score, duolingo.description, duolingo.date_written)
+                IS DISTINCT FROM (EXCLUDED.score, EXCLUDED.description, EXCLUDED.date_written)
             """,
             (user_code, score, description, date_written, current_time, current_time),
         )
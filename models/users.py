@@ -2,6 +2,19 @@ from utils.db_helpers import db_connection, db_transaction
 import bcrypt
 from flask_login import UserMixin
 
+# Role permission bits, resolved once per User instead of on every check
+PERM_SUPER_ADMIN = 0b0001
+PERM_ADMIN = 0b0010
+PERM_FACULTY = 0b0100
+PERM_VIEWER = 0b1000
+
+_ROLE_PERMS = {
+    "Super Admin": PERM_SUPER_ADMIN | PERM_ADMIN,
+    "Admin": PERM_ADMIN,
+    "Faculty": PERM_FACULTY,
+    "Viewer": PERM_VIEWER,
+}
+
 
 class User(UserMixin):
     """Flask-Login user model. Keep this class — required by Flask-Login."""
@@ -14,6 +27,7 @@ class User(UserMixin):
         self.password_hash = password_hash
         self.role_user_id = role_user_id
         self.role_name = role_name
+        self.perms = _ROLE_PERMS.get(role_name, 0)
         self.campus = campus
         self.program = program
 
@@ -23,19 +37,19 @@ class User(UserMixin):
 
     @property
     def is_super_admin(self):
-        return self.role_name == "Super Admin"
+        return bool(self.perms & PERM_SUPER_ADMIN)
 
     @property
     def is_admin(self):
-        return self.role_name in ("Admin", "Super Admin")
+        return bool(self.perms & PERM_ADMIN)
 
     @property
     def is_faculty(self):
-        return self.role_name == "Faculty"
+        return bool(self.perms & PERM_FACULTY)
 
     @property
     def is_viewer(self):
-        return self.role_name == "Viewer"
+        return bool(self.perms & PERM_VIEWER)
 
 
 # ---------------------------------------------------------------------------
@@ -133,6 +147,20 @@ def get_user_by_id(user_id):
         return None
 
 
+def get_user_stamp(user_id):
+    """
+    Return (found, updated_at) for a user — a cheap check of whether a cached
+    User is still current. found is False if the user is gone or on error.
+    """
+    try:
+        with db_connection() as (conn, cursor):
+            cursor.execute('SELECT updated_at FROM "user" WHERE id = %s', (user_id,))
+            row = cursor.fetchone()
+        return (True, row["updated_at"]) if row else (False, None)
+    except Exception:
+        return False, None
+
+
 def get_user_by_id_dict(user_id):
     """Return user as dict for API responses."""
     try:
@@ -87,7 +87,8 @@ CREATE TABLE IF NOT EXISTS applicant_info(
     academic_history VARCHAR(1000), 
     ubc_academic_history TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    content_hash BYTEA
 );
 
 -- Create program_info table (new table)
@@ -143,7 +144,8 @@ CREATE TABLE IF NOT EXISTS application_info (
     mds_v VARCHAR(10),
     mds_cl VARCHAR(10),
     mds_o VARCHAR(10),
-    scholarship VARCHAR(20) DEFAULT 'Undecided' CHECK (scholarship IN ('Yes', 'No', 'Undecided'))
+    scholarship VARCHAR(20) DEFAULT 'Undecided' CHECK (scholarship IN ('Yes', 'No', 'Undecided')),
+    version INTEGER NOT NULL DEFAULT 0
 );
 
 CREATE TABLE IF NOT EXISTS ratings(
@@ -347,6 +349,34 @@ CREATE TABLE IF NOT EXISTS applicant_documents (
 CREATE INDEX IF NOT EXISTS idx_applicant_documents_user_code ON applicant_documents(user_code);
 CREATE INDEX IF NOT EXISTS idx_applicant_documents_type ON applicant_documents(document_type);
 
+-- Background CSV imports (?async=1). The uploaded file lives on disk at
+-- file_path until the job ends; host/pid name the worker process running it so
+-- another process can pick the job up again if that worker died.
+CREATE TABLE IF NOT EXISTS import_jobs (
+    job_id VARCHAR(32) PRIMARY KEY,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued'
+        CHECK (status IN ('queued', 'started', 'finished', 'failed')),
+    file_path VARCHAR(500),
+    user_id INTEGER REFERENCES "user"(id) ON DELETE SET NULL,
+    admin_email VARCHAR(100),
+    host VARCHAR(255),
+    pid INTEGER,
+    message TEXT,
+    result JSONB,
+    unmatched_sessions JSONB,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Fingerprint of the last schema.sql applied to this database; init_database(lazy=True)
+-- skips the schema run while it matches. Kept in the database itself so a
+-- recreated or restored database is initialized again. Single row.
+CREATE TABLE IF NOT EXISTS schema_meta (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    fingerprint VARCHAR(64) NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 -- Add foreign key constraint with CASCADE DELETE (check if exists first)
 DO $$ 
 BEGIN
@@ -600,13 +630,20 @@ CREATE INDEX IF NOT EXISTS idx_user_email ON "user"(email);
 CREATE INDEX IF NOT EXISTS idx_user_role ON "user"(role_user_id);
 CREATE INDEX IF NOT EXISTS idx_applicant_info_sessions ON applicant_info(session_id);
 CREATE INDEX IF NOT EXISTS idx_program_info_user_code ON program_info(user_code);
-CREATE INDEX IF NOT EXISTS idx_institution_info_user_code ON institution_info(user_code);
-CREATE INDEX IF NOT EXISTS idx_toefl_user_code ON toefl(user_code);
-CREATE INDEX IF NOT EXISTS idx_ielts_user_code ON ielts(user_code);
-CREATE INDEX IF NOT EXISTS idx_duolingo_user_code ON duolingo(user_code);
+-- Test score and institution lookups by user_code are served by the primary
+-- keys, which all lead with user_code; separate user_code indexes on those
+-- tables only add write cost to the CSV import upserts
+DROP INDEX IF EXISTS idx_institution_info_user_code;
+DROP INDEX IF EXISTS idx_toefl_user_code;
+DROP INDEX IF EXISTS idx_ielts_user_code;
+DROP INDEX IF EXISTS idx_duolingo_user_code;
 CREATE INDEX IF NOT EXISTS idx_sessions_campus ON sessions(campus);
 CREATE INDEX IF NOT EXISTS idx_sessions_is_archived ON sessions(is_archived);
 CREATE INDEX IF NOT EXISTS idx_sessions_campus_year ON sessions(campus, year DESC);
+CREATE INDEX IF NOT EXISTS idx_ratings_user_code ON ratings(user_code);
+CREATE INDEX IF NOT EXISTS idx_applicant_status_submit_date ON applicant_status(submit_date DESC);
+CREATE INDEX IF NOT EXISTS idx_activity_log_action_target ON activity_log(action_type, target_id, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_activity_log_created_at ON activity_log(created_at DESC);
 
 -- Add campus and program columns to user table (idempotent)
 DO $$
@@ -626,6 +663,30 @@ BEGIN
     END IF;
 END $$;
 
+-- Add content_hash to applicant_info (idempotent); CSV imports skip applicants
+-- whose applicant_info/applicant_status input hashes to the stored value
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'applicant_info' AND column_name = 'content_hash'
+    ) THEN
+        ALTER TABLE applicant_info ADD COLUMN content_hash BYTEA;
+    END IF;
+END $$;
+
+-- Add version to application_info (idempotent); bumped by every reviewer edit
+-- so concurrent edits can be detected
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'application_info' AND column_name = 'version'
+    ) THEN
+        ALTER TABLE application_info ADD COLUMN version INTEGER NOT NULL DEFAULT 0;
+    END IF;
+END $$;
+
 -- Migrate sessions.campus: drop old CHECK constraint and widen column to VARCHAR(20)
 DO $$
 BEGIN
@@ -3,8 +3,13 @@ Applicant Service — business logic for applicant data management.
 No Flask, no SQL. Calls models.applicants, logs activity.
 """
 
+import threading
+from datetime import datetime
+from cachetools import TTLCache
 from models.applicants import (
+    VERSION_CONFLICT_MESSAGE,
     get_all_applicant_status,
+    iter_all_applicant_status,
     get_applicant_info_by_code,
     get_applicant_application_info_by_code,
     get_applicant_test_scores_by_code,
@@ -19,65 +24,177 @@ from models.applicants import (
 from models.statuses import get_all_statuses
 from utils.activity_logger import log_activity
 
-_VALID_ENGLISH_STATUSES = {"Not Met", "Not Required", "Passed"}
+_VALID_ENGLISH_STATUSES = frozenset({"Not Met", "Not Required", "Passed"})
+
+
+class VersionConflictError(ValueError):
+    """Raised when an edit's expected_version no longer matches application_info.version."""
+
+    def __init__(self):
+        super().__init__(VERSION_CONFLICT_MESSAGE)
+
+
+def _raise_on_failure(success: bool, message: str) -> None:
+    if success:
+        return
+    if message == VERSION_CONFLICT_MESSAGE:
+        raise VersionConflictError()
+    raise ValueError(message)
+
+# Per-applicant read caches (user_code → result). Entries expire after the TTL
+# and are dropped explicitly whenever the underlying rows are written.
+_CACHE_TTL_SECONDS = 60
+_CACHE_MAX_ENTRIES = 4096
+
+_info_cache = TTLCache(maxsize=_CACHE_MAX_ENTRIES, ttl=_CACHE_TTL_SECONDS)
+_test_scores_cache = TTLCache(maxsize=_CACHE_MAX_ENTRIES, ttl=_CACHE_TTL_SECONDS)
+_institutions_cache = TTLCache(maxsize=_CACHE_MAX_ENTRIES, ttl=_CACHE_TTL_SECONDS)
+_ALL_CACHES = (_info_cache, _test_scores_cache, _institutions_cache)
+_cache_lock = threading.Lock()
+
+# Active status names (ordered tuple, frozenset) used to validate review
+# status updates; dropped by StatusService whenever a status is written.
+_status_names_cache = TTLCache(maxsize=1, ttl=_CACHE_TTL_SECONDS)
+
+
+def _cached(cache: TTLCache, user_code: str, loader):
+    """Return cache[user_code], calling loader(user_code) on a miss."""
+    with _cache_lock:
+        if user_code in cache:
+            return cache[user_code]
+    value = loader(user_code)
+    with _cache_lock:
+        cache[user_code] = value
+    return value
+
+
+def invalidate_applicant_cache(user_code: str | None = None) -> None:
+    """Drop cached reads for one applicant, or for all applicants if user_code is None."""
+    with _cache_lock:
+        for cache in _ALL_CACHES:
+            if user_code is None:
+                cache.clear()
+            else:
+                cache.pop(user_code, None)
+
+
+def invalidate_status_names_cache() -> None:
+    """Drop the cached set of valid status names (after a status is created/edited/deleted)."""
+    with _cache_lock:
+        _status_names_cache.clear()
+
+
+def _valid_status_names() -> tuple[tuple, frozenset]:
+    """Return the active status names as (display-ordered tuple, frozenset)."""
+    with _cache_lock:
+        cached = _status_names_cache.get("names")
+    if cached is not None:
+        return cached
+
+    statuses, error = get_all_statuses()
+    if error or not statuses:
+        raise ValueError("Failed to validate status")
+    names = tuple(s.status_name for s in statuses)
+    cached = (names, frozenset(names))
+    with _cache_lock:
+        _status_names_cache["names"] = cached
+    return cached
+
+
+def _add_staleness(applicant: dict, now: datetime) -> dict:
+    """Set seconds_since_update on an applicant row from its updated_at."""
+    updated_at = applicant.get("updated_at")
+    applicant["seconds_since_update"] = (
+        (now - updated_at).total_seconds() if updated_at else None
+    )
+    return applicant
 
 
 class ApplicantService:
 
-    def get_all(self, session_id=None) -> list:
+    def get_all(self, session_id=None, include_staleness=False) -> list:
         """Return all applicants, optionally filtered by session."""
         applicants, error = get_all_applicant_status(session_id=session_id)
         if error:
             raise ValueError(error)
-        return applicants or []
+        applicants = applicants or []
+        if include_staleness:
+            now = datetime.now()
+            for applicant in applicants:
+                _add_staleness(applicant, now)
+        return applicants
+
+    def iter_all(self, session_id=None, include_staleness=False):
+        """Yield all applicants one at a time, optionally filtered by session."""
+        rows = iter_all_applicant_status(session_id=session_id)
+        if not include_staleness:
+            return rows
+        now = datetime.now()
+        return (_add_staleness(row, now) for row in rows)
 
     def get_info(self, user_code: str) -> dict | None:
         """Return applicant personal info or None."""
+        return _cached(_info_cache, user_code, self._load_info)
+
+    def get_application_info(self, user_code: str) -> dict | None:
+        """
+        Return application info or None. Not cached: the row's version is the
+        expected_version for the reviewer's next edit, so it must be current.
+        """
+        return self._load_application_info(user_code)
+
+    def get_test_scores(self, user_code: str) -> dict:
+        """Return test scores dict."""
+        return _cached(_test_scores_cache, user_code, self._load_test_scores)
+
+    def get_institutions(self, user_code: str) -> list:
+        """Return institution history list."""
+        return _cached(_institutions_cache, user_code, self._load_institutions)
+
+    @staticmethod
+    def _load_info(user_code: str) -> dict | None:
         info, error = get_applicant_info_by_code(user_code)
         if error:
             raise ValueError(error)
         return info
 
-    def get_application_info(self, user_code: str) -> dict | None:
-        """Return application info or None."""
+    @staticmethod
+    def _load_application_info(user_code: str) -> dict | None:
         info, error = get_applicant_application_info_by_code(user_code)
         if error:
             raise ValueError(error)
         return info
 
-    def get_test_scores(self, user_code: str) -> dict:
-        """Return test scores dict."""
+    @staticmethod
+    def _load_test_scores(user_code: str) -> dict:
         scores, error = get_applicant_test_scores_by_code(user_code)
         if error:
             raise ValueError(error)
         return scores or {}
 
-    def get_institutions(self, user_code: str) -> list:
-        """Return institution history list."""
+    @staticmethod
+    def _load_institutions(user_code: str) -> list:
         institutions, error = get_applicant_institutions_by_code(user_code)
         if error:
             raise ValueError(error)
         return institutions or []
 
-    def update_status(self, user_code: str, status: str) -> str:
-        """Validate status and update. Returns success message."""
+    def update_status(self, user_code: str, status: str) -> dict:
+        """Validate status and update. Returns {message, version}."""
         if not status:
             raise ValueError("Status is required")
 
-        valid_statuses, error = get_all_statuses()
-        if error or not valid_statuses:
-            raise ValueError("Failed to validate status")
-
-        valid_names = [s["status_name"] for s in valid_statuses]
+        ordered_names, valid_names = _valid_status_names()
         if status not in valid_names:
-            raise ValueError(f"Invalid status. Must be one of: {', '.join(valid_names)}")
+            raise ValueError(f"Invalid status. Must be one of: {', '.join(ordered_names)}")
 
         old_info, _ = get_applicant_application_info_by_code(user_code)
         old_status = old_info.get("sent", "Not Reviewed") if old_info else "Not Reviewed"
 
-        success, message = update_applicant_application_status(user_code, status)
+        success, message, version = update_applicant_application_status(user_code, status)
         if not success:
             raise ValueError(message)
+        invalidate_applicant_cache(user_code)
 
         if old_status != status:
             log_activity(
@@ -89,7 +206,7 @@ class ApplicantService:
                 additional_metadata={"user_code": user_code},
             )
 
-        return message
+        return {"message": message, "version": version}
 
     def update_prerequisites(
         self,
@@ -102,49 +219,62 @@ class ApplicantService:
         mds_v=None,
         mds_cl=None,
         mds_o=None,
-    ) -> str:
-        """Update prerequisite courses and GPA. Returns success message."""
-        success, message = update_applicant_prerequisites(
-            user_code, cs, stat, math, gpa, additional_comments, mds_v, mds_cl, mds_o
+        expected_version=None,
+    ) -> dict:
+        """
+        Update prerequisite courses and GPA. Returns {message, version}.
+        Raises VersionConflictError if expected_version is no longer current.
+        """
+        success, message, version = update_applicant_prerequisites(
+            user_code, cs, stat, math, gpa, additional_comments, mds_v, mds_cl, mds_o,
+            expected_version=expected_version,
         )
-        if not success:
-            raise ValueError(message)
-        return message
+        _raise_on_failure(success, message)
+        invalidate_applicant_cache(user_code)
+        return {"message": message, "version": version}
 
-    def update_english_comment(self, user_code: str, comment: str) -> str:
-        """Update English proficiency comment. Returns success message."""
-        success, message = _update_english_comment(user_code, comment)
-        if not success:
-            raise ValueError(message)
-        return message
+    def update_english_comment(self, user_code: str, comment: str, expected_version=None) -> dict:
+        """
+        Update English proficiency comment. Returns {message, version}.
+        Raises VersionConflictError if expected_version is no longer current.
+        """
+        success, message, version = _update_english_comment(user_code, comment, expected_version)
+        _raise_on_failure(success, message)
+        invalidate_applicant_cache(user_code)
+        return {"message": message, "version": version}
 
-    def update_english_status(self, user_code: str, status: str) -> str:
-        """Validate and update English status. Returns success message."""
+    def update_english_status(self, user_code: str, status: str, expected_version=None) -> dict:
+        """
+        Validate and update English status. Returns {message, version}.
+        Raises VersionConflictError if expected_version is no longer current.
+        """
         if not status:
             raise ValueError("English status is required")
         if status not in _VALID_ENGLISH_STATUSES:
             raise ValueError("Invalid English status value")
 
-        success, message = _update_english_status(user_code, status)
-        if not success:
-            raise ValueError(message)
-        return message
+        success, message, version = _update_english_status(user_code, status, expected_version)
+        _raise_on_failure(success, message)
+        invalidate_applicant_cache(user_code)
+        return {"message": message, "version": version}
 
-    def update_scholarship(self, user_code: str, scholarship: str) -> str:
-        """Validate and update scholarship decision. Returns success message."""
+    def update_scholarship(self, user_code: str, scholarship: str) -> dict:
+        """Validate and update scholarship decision. Returns {message, version}."""
         if scholarship not in {"Yes", "No", "Undecided"}:
             raise ValueError("Invalid scholarship value")
 
-        success, message = update_applicant_scholarship(user_code, scholarship)
+        success, message, version = update_applicant_scholarship(user_code, scholarship)
         if not success:
             raise ValueError(message)
-        return message
+        invalidate_applicant_cache(user_code)
+        return {"message": message, "version": version}
 
     def clear_all_data(self, admin_email: str) -> dict:
         """Clear all applicant data. Returns {message, tables_cleared}."""
         success, message, tables_cleared, records_cleared = clear_all_applicant_data()
         if not success:
             raise ValueError(message)
+        invalidate_applicant_cache()
 
         log_activity(
             action_type="clear_all_data",
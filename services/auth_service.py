@@ -4,10 +4,47 @@ Business logic for authentication and user management.
 No Flask imports. No SQL. Calls models.users and utils.activity_logger.
 """
 import re
+import threading
 import bcrypt
+from cachetools import TTLCache
 import models.users as users_model
 from utils.activity_logger import log_activity
 
+# Flask-Login resolves the session user on every request; keep the User objects
+# so that is a primary-key lookup of updated_at rather than the role join. A
+# cached User is only served while its updated_at stamp still matches, so
+# writes from any process (all of which bump updated_at) take effect on the
+# next request.
+_USER_CACHE_TTL_SECONDS = 60
+_user_cache = TTLCache(maxsize=1024, ttl=_USER_CACHE_TTL_SECONDS)
+_user_cache_lock = threading.Lock()
+
+
+def load_session_user(user_id: int):
+    """Return the User for a session's user id, or None if not found."""
+    found, stamp = users_model.get_user_stamp(user_id)
+    if not found:
+        invalidate_user_cache(user_id)
+        return None
+    with _user_cache_lock:
+        cached = _user_cache.get(user_id)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    user = users_model.get_user_by_id(user_id)
+    if user is not None:
+        with _user_cache_lock:
+            _user_cache[user_id] = (stamp, user)
+    return user
+
+
+def invalidate_user_cache(user_id: int | None = None) -> None:
+    """Drop one cached session user, or all of them if user_id is None."""
+    with _user_cache_lock:
+        if user_id is None:
+            _user_cache.clear()
+        else:
+            _user_cache.pop(user_id, None)
+
 
 class AuthService:
 
@@ -103,6 +140,7 @@ class AuthService:
             user_id, email, first_name, last_name, role_id, password_hash,
             campus=campus or None, program=program or None,
         )
+        invalidate_user_cache(user_id)
         log_activity(
             action_type="user_updated",
             target_entity="user",
@@ -123,6 +161,7 @@ class AuthService:
             target_id=str(user_id),
         )
         users_model.delete_user(user_id)
+        invalidate_user_cache(user_id)
         return True
 
     def delete_users_bulk(self, user_ids, current_user_id, caller_is_super_admin=False):
@@ -144,7 +183,10 @@ class AuthService:
                 target_entity="user",
                 target_id=str(uid),
             )
-        return users_model.delete_users_bulk(user_ids)
+        deleted = users_model.delete_users_bulk(user_ids)
+        for uid in user_ids:
+            invalidate_user_cache(uid)
+        return deleted
 
     def update_email(self, user_id, new_email, current_password):
         """Verify password, check duplicate email, update, log. Raises ValueError."""
@@ -159,6 +201,7 @@ class AuthService:
             raise ValueError("Email already in use.")
 
         user = users_model.update_email(user_id, new_email)
+        invalidate_user_cache(user_id)
         log_activity(
             action_type="email_updated",
             target_entity="user",
@@ -178,6 +221,7 @@ class AuthService:
 
         new_hash = bcrypt.hashpw(new_password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
         users_model.update_password(user_id, new_hash)
+        invalidate_user_cache(user_id)
         log_activity(
             action_type="password_reset",
             target_entity="user",
@@ -4,9 +4,21 @@ No Flask, no SQL. Delegates to models.applicants.process_csv_data.
 """
 
 import io
+import os
+import socket
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-from models.applicants import process_csv_data
+import models.users as users_model
+from models.applicants import CSV_CHUNK_ROWS, process_csv_data
+from models.import_jobs import (
+    claim_import_job,
+    create_import_job,
+    get_import_job,
+    update_import_job,
+)
 from models.sessions import find_session_by_abbrev
+from services.applicant_service import invalidate_applicant_cache
 from utils.activity_logger import log_activity
 
 
@@ -18,6 +30,38 @@ class SessionValidationError(Exception):
         super().__init__("Session validation failed")
 
 
+# Columns read by the validation pass; the full rows are streamed in chunks afterwards
+_SESSION_COLUMNS = ("User Code", "Program CODE", "Session", "Program")
+
+# Background imports run on one thread per worker process. Job state is kept
+# in the import_jobs table and the upload on disk, so any worker can answer a
+# status poll; process_csv_data takes a database advisory lock, so sync and
+# background imports from all processes still run one at a time.
+_IMPORT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="csv-import")
+IMPORT_UPLOAD_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "uploads", "imports"
+)
+_HOST = socket.gethostname()
+
+_SESSION_VALIDATION_MESSAGE = (
+    "Import failed: the following sessions do not exist in the system "
+    "and must be created before importing"
+)
+
+
+def _worker_is_gone(host: str | None, pid: int | None) -> bool:
+    """True if the worker process recorded for a job is known to have exited."""
+    if host != _HOST or pid is None or pid == os.getpid():
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        return False
+    return False
+
+
 class CSVImportService:
 
     def import_file(self, file_bytes: bytes, admin_email: str, user=None) -> dict:
@@ -27,27 +71,32 @@ class CSVImportService:
         Raises ValueError on invalid format.
         Raises SessionValidationError if any sessions in the CSV don't exist.
         """
+        # Check required columns from the header alone before the full parse
+        header = self._validate_header(file_bytes)
+
+        # pyarrow is only needed for uploads; keep it off the app's import path
+        import pyarrow as pa
+
+        # Validation pass: parse only the key and session columns with Arrow's
+        # multithreaded reader (no str decode/copy first)
         try:
-            csv_text = file_bytes.decode("utf-8")
+            df = pd.read_csv(
+                io.BytesIO(file_bytes), encoding="utf-8", engine="pyarrow",
+                usecols=[c for c in header if c.rstrip() in _SESSION_COLUMNS],
+            )
         except UnicodeDecodeError:
             raise ValueError("File encoding error — please upload a UTF-8 encoded CSV")
+        except pa.ArrowInvalid as e:
+            raise ValueError(f"Could not parse CSV file — please upload a UTF-8 encoded CSV ({e})")
 
-        df = pd.read_csv(io.StringIO(csv_text))
         df.columns = df.columns.str.rstrip()
 
-        if "User Code" not in df.columns:
-            raise ValueError("Missing required column: User Code")
-
-        df = df.dropna(subset=["User Code"])
+        # Single mask pass: drop rows whose User Code is missing or blank
+        user_codes = df["User Code"].astype("string").str.strip()
+        df = df.loc[user_codes.notna() & user_codes.ne("")]
         if df.empty:
             raise ValueError("No valid data found in CSV")
 
-        if "Session" not in df.columns:
-            raise ValueError(
-                "CSV is missing the required session column. "
-                "Cannot determine which session to import into."
-            )
-
         # Determine campus scope: None = Super Admin (unrestricted)
         campus = None
         if user is not None and not getattr(user, "is_super_admin", False):
@@ -55,9 +104,14 @@ class CSVImportService:
 
         session_id_map = self._validate_and_resolve_sessions(df, campus)
 
-        success, message, records_processed = process_csv_data(df, session_id_map)
+        # Import pass: stream the full rows chunk by chunk, so memory stays
+        # bounded by CSV_CHUNK_ROWS rather than the size of the file
+        success, message, records_processed = process_csv_data(
+            self._iter_chunks(file_bytes), session_id_map
+        )
         if not success:
             raise ValueError(message)
+        invalidate_applicant_cache()
 
         log_activity(
             action_type="csv_upload",
@@ -68,10 +122,125 @@ class CSVImportService:
                 "records_processed": records_processed,
                 "uploaded_by": admin_email,
             },
+            user=user,
         )
 
         return {"message": message, "records_processed": records_processed}
 
+    def submit_import(self, file_bytes: bytes, admin_email: str, user=None) -> str:
+        """
+        Save the upload to IMPORT_UPLOAD_DIR, record a queued job and run
+        import_file() on this process's background worker. Returns the job id.
+        Poll get_job(job_id) for status: queued, started, finished or failed.
+        Raises ValueError if the job cannot be recorded.
+        """
+        job_id = uuid.uuid4().hex
+        os.makedirs(IMPORT_UPLOAD_DIR, exist_ok=True)
+        file_path = os.path.join(IMPORT_UPLOAD_DIR, f"{job_id}.csv")
+        with open(file_path, "wb") as f:
+            f.write(file_bytes)
+
+        ok, error = create_import_job(
+            job_id, file_path, getattr(user, "id", None), admin_email, _HOST, os.getpid()
+        )
+        if not ok:
+            os.remove(file_path)
+            raise ValueError(error)
+
+        _IMPORT_EXECUTOR.submit(self._run_job, job_id, file_path, admin_email, user)
+        return job_id
+
+    def get_job(self, job_id: str) -> dict | None:
+        """
+        Return the job's status record, or None if unknown or expired.
+
+        A queued/started job whose worker process has exited (e.g. restarted)
+        is picked up again by this process from the saved upload.
+        Raises ValueError on database errors.
+        """
+        job, error = get_import_job(job_id)
+        if error:
+            raise ValueError(error)
+        if job is None:
+            return None
+
+        job = dict(job)
+        host, pid = job.pop("host"), job.pop("pid")
+        if job["status"] in ("queued", "started") and _worker_is_gone(host, pid):
+            self._resume_job(job_id, pid)
+            job["status"] = "queued"
+        return job
+
+    def _resume_job(self, job_id: str, old_pid: int) -> None:
+        """Claim an orphaned job and queue it on this process's worker."""
+        claimed, error = claim_import_job(job_id, old_pid, _HOST, os.getpid())
+        if error:
+            raise ValueError(error)
+        if claimed is None:
+            return  # another worker claimed it first
+
+        file_path = claimed["file_path"]
+        if not file_path or not os.path.exists(file_path):
+            update_import_job(job_id, "failed", message="Uploaded file is no longer available")
+            return
+
+        user_id = claimed["user_id"]
+        user = users_model.get_user_by_id(user_id) if user_id is not None else None
+        _IMPORT_EXECUTOR.submit(self._run_job, job_id, file_path, claimed["admin_email"], user)
+
+    def _run_job(self, job_id: str, file_path: str, admin_email: str, user) -> None:
+        update_import_job(job_id, "started")
+        try:
+            with open(file_path, "rb") as f:
+                file_bytes = f.read()
+            result = self.import_file(file_bytes, admin_email, user)
+            update_import_job(job_id, "finished", result=result)
+        except SessionValidationError as e:
+            update_import_job(
+                job_id, "failed",
+                message=_SESSION_VALIDATION_MESSAGE,
+                unmatched_sessions=e.unmatched_sessions,
+            )
+        except ValueError as e:
+            update_import_job(job_id, "failed", message=str(e))
+        except Exception as e:
+            update_import_job(job_id, "failed", message=f"Error processing file: {str(e)}")
+        finally:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+    @staticmethod
+    def _iter_chunks(file_bytes: bytes):
+        """Yield the CSV as DataFrames of CSV_CHUNK_ROWS rows, minus rows without a User Code."""
+        with pd.read_csv(io.BytesIO(file_bytes), encoding="utf-8", chunksize=CSV_CHUNK_ROWS) as reader:
+            for chunk in reader:
+                chunk.columns = chunk.columns.str.rstrip()
+                user_codes = chunk["User Code"].astype("string").str.strip()
+                yield chunk.loc[user_codes.notna() & user_codes.ne("")]
+
+    @staticmethod
+    def _validate_header(file_bytes: bytes) -> list[str]:
+        """
+        Raise ValueError if the CSV header lacks User Code or Session.
+        Returns the header's column names as they appear in the file.
+        """
+        try:
+            header = pd.read_csv(io.BytesIO(file_bytes), encoding="utf-8", nrows=0)
+        except UnicodeDecodeError:
+            raise ValueError("File encoding error — please upload a UTF-8 encoded CSV")
+        except (pd.errors.EmptyDataError, pd.errors.ParserError) as e:
+            raise ValueError(f"Could not parse CSV file — please upload a UTF-8 encoded CSV ({e})")
+
+        columns = set(header.columns.str.rstrip())
+        if "User Code" not in columns:
+            raise ValueError("Missing required column: User Code")
+        if "Session" not in columns:
+            raise ValueError(
+                "CSV is missing the required session column. "
+                "Cannot determine which session to import into."
+            )
+        return list(header.columns)
+
     def _validate_and_resolve_sessions(self, df: pd.DataFrame, campus: str | None) -> dict:
         """
         Extract distinct (program_code, session_abbrev) combos from df, look up each
@@ -81,20 +250,21 @@ class CSVImportService:
         Raises SessionValidationError listing any unmatched combos.
         """
         # Collect distinct combos (keep program name for error reporting)
-        combos: dict[tuple, str] = {}  # (pc_upper, sa_upper) → program display name
-        for _, row in df.iterrows():
-            program_code = str(row.get("Program CODE", "")).strip()
-            program = str(row.get("Program", "")).strip()
-            session_abbrev = str(row.get("Session", "")).strip()
+        program_codes = _clean_column(df, "Program CODE")
+        session_abbrevs = _clean_column(df, "Session")
+        programs = _clean_column(df, "Program")
 
-            if not program_code or program_code == "nan":
-                continue
-            if not session_abbrev or session_abbrev == "nan":
-                continue
+        valid = program_codes.ne("") & session_abbrevs.ne("")
+        distinct = pd.DataFrame({
+            "pc": program_codes[valid].str.upper(),
+            "sa": session_abbrevs[valid].str.upper(),
+            "program": programs[valid],
+        }).drop_duplicates(subset=["pc", "sa"])
 
-            key = (program_code.upper(), session_abbrev.upper())
-            if key not in combos:
-                combos[key] = program if program and program != "nan" else ""
+        combos: dict[tuple, str] = {  # (pc_upper, sa_upper) → program display name
+            (pc, sa): program
+            for pc, sa, program in distinct.itertuples(index=False, name=None)
+        }
 
         unmatched = []
         session_id_map = {}
@@ -114,3 +284,10 @@ class CSVImportService:
             raise SessionValidationError(unmatched)
 
         return session_id_map
+
+
+def _clean_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """Return a column as stripped strings with missing values as ''."""
+    if column not in df.columns:
+        return pd.Series("", index=df.index, dtype="string")
+    return df[column].astype("string").str.strip().fillna("")
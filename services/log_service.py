@@ -4,7 +4,7 @@ No Flask, no SQL. Delegates to utils.activity_logger and utils.db_helpers.
 """
 
 from utils.activity_logger import get_activity_logs
-from utils.db_helpers import fetch_all
+from utils.db_helpers import fetch_one, stream_rows
 
 
 class LogService:
@@ -25,14 +25,21 @@ class LogService:
 
     def export_status_changes(self, user_ids: list | None = None) -> list:
         """Return status change log rows formatted for CSV export."""
-        where_clause = "WHERE al.action_type = 'status_change'"
-        params = []
-        if user_ids:
-            placeholders = ",".join(["%s"] * len(user_ids))
-            where_clause += f" AND al.user_id IN ({placeholders})"
-            params.extend(user_ids)
-
-        rows = fetch_all(
+        return list(self.iter_status_changes(user_ids))
+
+    def count_status_changes(self, user_ids: list | None = None) -> int:
+        """Return the number of status change log rows an export would contain."""
+        where_clause, params = _status_change_filter(user_ids)
+        row = fetch_one(
+            f"SELECT COUNT(*) AS count FROM activity_log al {where_clause}",
+            params if params else None,
+        )
+        return row["count"] if row else 0
+
+    def iter_status_changes(self, user_ids: list | None = None):
+        """Yield status change log rows formatted for CSV export, newest first."""
+        where_clause, params = _status_change_filter(user_ids)
+        rows = stream_rows(
             f"""
             SELECT al.created_at, u.first_name, u.last_name, u.email,
                    al.target_id, al.old_value, al.new_value
@@ -43,18 +50,26 @@ class LogService:
             """,
             params if params else None,
         )
-
-        export_rows = []
         for row in rows:
             first = row["first_name"]
             last = row["last_name"]
             admin_name = f"{first} {last}".strip() if (first or last) else "Unknown User"
-            export_rows.append({
-                "Date/Time": row["created_at"].strftime("%Y-%m-%d %H:%M:%S") if row["created_at"] else "",
+            yield {
+                # isoformat is C-level; same "%Y-%m-%d %H:%M:%S" output without parsing a format
+                "Date/Time": row["created_at"].isoformat(" ", "seconds") if row["created_at"] else "",
                 "Admin Name": admin_name,
                 "Admin Email": row["email"] or "",
                 "Applicant Code": row["target_id"] or "",
                 "Old Status": row["old_value"] or "",
                 "New Status": row["new_value"] or "",
-            })
-        return export_rows
+            }
+
+
+def _status_change_filter(user_ids: list | None) -> tuple[str, list]:
+    """Build the WHERE clause and params shared by the status change export queries."""
+    where_clause = "WHERE al.action_type = 'status_change'"
+    params = []
+    if user_ids:
+        where_clause += " AND al.user_id = ANY(%s)"
+        params.append(list(user_ids))
+    return where_clause, params
@@ -4,6 +4,7 @@ No Flask, no SQL. Calls models.statuses, logs activity.
 """
 
 from models.statuses import (
+    Status,
     get_all_statuses as _get_all_statuses,
     get_all_statuses_admin as _get_all_statuses_admin,
     get_default_status as _get_default_status,
@@ -12,8 +13,15 @@ from models.statuses import (
     delete_status as _delete_status,
     reorder_statuses as _reorder_statuses,
 )
+from services.applicant_service import invalidate_status_names_cache
 from utils.activity_logger import log_activity
 
+# Badge colors offered by the status configuration page (Tailwind palette names)
+_VALID_BADGE_COLORS = frozenset({
+    "gray", "red", "yellow", "green", "blue",
+    "indigo", "purple", "pink", "orange", "teal",
+})
+
 
 class StatusService:
 
@@ -31,7 +39,7 @@ class StatusService:
             raise ValueError(error)
         return statuses or []
 
-    def get_default_status(self) -> dict | None:
+    def get_default_status(self) -> Status | None:
         """Return the default status, or None."""
         return _get_default_status()
 
@@ -39,10 +47,13 @@ class StatusService:
         """Create a new status. Returns success message."""
         if not status_name or not status_name.strip():
             raise ValueError("Status name is required")
+        if badge_color and badge_color not in _VALID_BADGE_COLORS:
+            raise ValueError("Invalid badge color")
 
         success, message = _create_status(status_name.strip(), badge_color or "gray", display_order)
         if not success:
             raise ValueError(message)
+        invalidate_status_names_cache()
 
         log_activity(
             action_type="create_status",
@@ -58,18 +69,29 @@ class StatusService:
 
     def update_status(self, status_id: int, status_name, badge_color, display_order, is_active, user) -> str:
         """Update a status. Returns success message."""
+        if badge_color is not None and badge_color not in _VALID_BADGE_COLORS:
+            raise ValueError("Invalid badge color")
+
         success, message = _update_status(status_id, status_name, badge_color, display_order, is_active)
         if not success:
             raise ValueError(message)
+        invalidate_status_names_cache()
+
+        metadata = {"status_id": status_id, "updated_by": user.email}
+        if status_name is not None:
+            metadata["status_name"] = status_name
+        if badge_color is not None:
+            metadata["badge_color"] = badge_color
+        if display_order is not None:
+            metadata["display_order"] = display_order
+        if is_active is not None:
+            metadata["is_active"] = is_active
 
         log_activity(
             action_type="update_status",
             target_entity="status_configuration",
             target_id=str(status_id),
-            additional_metadata={
-                "status_id": status_id,
-                "updated_by": user.email,
-            },
+            additional_metadata=metadata,
         )
         return message
 
@@ -78,6 +100,7 @@ class StatusService:
         success, message = _delete_status(status_id)
         if not success:
             raise ValueError(message)
+        invalidate_status_names_cache()
 
         log_activity(
             action_type="delete_status",
@@ -102,6 +125,7 @@ class StatusService:
         success, message = _reorder_statuses(statuses)
         if not success:
             raise ValueError(message)
+        invalidate_status_names_cache()
 
         log_activity(
             action_type="reorder_statuses",
@@ -20,9 +20,20 @@ import { validateRating } from "../utils/validators.js";
  * with the applicant database. This is the primary controller for the main dashboard.
  */
 
+// Fields covered by the applicant search box (matches the #searchFilter options)
+const SEARCH_FIELDS = [
+  "given_name",
+  "family_name",
+  "user_code",
+  "student_number",
+  "status",
+  "review_status",
+];
+
 class ApplicantsManager {
   constructor() {
     this.allApplicants = [];
+    this.searchIndex = new Map(); // applicant -> lowercased search keys
     this.sessionName = "";
     this.sortColumn = null;
     this.sortDirection = "asc";
@@ -40,6 +51,7 @@ class ApplicantsManager {
     this.initializeActionButtons();
     this.selectedApplicants = new Set();
     this.applicantCache = new Map();
+    this.applicationInfoVersions = new Map(); // userCode -> application_info.version
     this.initializeExportButton();
     window.applicantsManager = this;
     this.initializeClearDataButton();
@@ -322,13 +334,14 @@ class ApplicantsManager {
         ? SessionStore.getCurrentSessionId()
         : null;
       const url = sessionId
-        ? `/api/applicants?session_id=${sessionId}`
-        : "/api/applicants";
+        ? `/api/applicants?session_id=${sessionId}&include_staleness=1`
+        : "/api/applicants?include_staleness=1";
       const response = await fetch(url);
       const result = await response.json();
 
       if (result.success) {
         this.allApplicants = result.applicants;
+        this.buildSearchIndex(this.allApplicants);
         this.filterApplicants();
       } else {
         container.innerHTML = `<div class="no-data">Error: ${result.message}</div>`;
@@ -567,6 +580,21 @@ class ApplicantsManager {
       this.displayApplicants(filtered);
     }
   }
+  // Lowercase every searchable field once per load rather than on each keystroke.
+  // `all` joins the fields with a NUL separator so a term can't match across fields.
+  buildSearchIndex(applicants) {
+    this.searchIndex = new Map();
+    for (const applicant of applicants) {
+      const keys = {};
+      for (const field of SEARCH_FIELDS) {
+        const value = applicant[field];
+        keys[field] = value == null ? "" : value.toString().toLowerCase();
+      }
+      keys.all = SEARCH_FIELDS.map((field) => keys[field]).join("\u0000");
+      this.searchIndex.set(applicant, keys);
+    }
+  }
+
   getFilteredApplicants() {
     const searchTerm = document
       .getElementById("searchInput")
@@ -586,18 +614,9 @@ class ApplicantsManager {
     if (!searchTerm) return filtered;
 
     return filtered.filter((applicant) => {
-      if (filter === "all") {
-        return (
-          applicant.given_name?.toLowerCase().includes(searchTerm) ||
-          applicant.family_name?.toLowerCase().includes(searchTerm) ||
-          applicant.user_code?.toString().includes(searchTerm) ||
-          applicant.student_number?.toString().includes(searchTerm) ||
-          applicant.status?.toLowerCase().includes(searchTerm) ||
-          applicant.review_status?.toLowerCase().includes(searchTerm)
-        );
-      } else {
-        return applicant[filter]?.toLowerCase().includes(searchTerm);
-      }
+      const keys = this.searchIndex.get(applicant);
+      const haystack = keys ? keys[filter] : undefined;
+      return haystack !== undefined && haystack.includes(searchTerm);
     });
   }
 
@@ -1614,6 +1633,7 @@ class ApplicantsManager {
       );
 
       const scholarshipResult = await scholarshipResponse.json();
+      this.rememberApplicationInfoVersion(userCode, scholarshipResult);
       if (!scholarshipResult.success) {
         this.showMessage(
           scholarshipResult.message || "Failed to save scholarship",
@@ -1635,6 +1655,7 @@ class ApplicantsManager {
       );
 
       const statusResult = await statusResponse.json();
+      this.rememberApplicationInfoVersion(userCode, statusResult);
 
       if (statusResult.success) {
         this.showMessage("All information saved successfully", "success");
@@ -2015,6 +2036,7 @@ class ApplicantsManager {
           ? englishStatusResult.application_info
           : null;
       }
+      this.rememberApplicationInfoVersion(userCode, applicationInfo);
 
       const container = document.getElementById("testScoresContainer");
 
@@ -3668,6 +3690,7 @@ class ApplicantsManager {
       );
 
       const result = await response.json();
+      this.rememberApplicationInfoVersion(userCode, result);
 
       if (result.success) {
         this.showMessage(result.message, "success");
@@ -3898,6 +3921,7 @@ class ApplicantsManager {
 
       if (result.success && result.application_info) {
         const appInfo = result.application_info;
+        this.rememberApplicationInfoVersion(userCode, appInfo);
         document.getElementById("prerequisiteCs").value = appInfo.cs || "";
         document.getElementById("prerequisiteStat").value = appInfo.stat || "";
         document.getElementById("prerequisiteMath").value = appInfo.math || "";
@@ -4163,17 +4187,22 @@ class ApplicantsManager {
             mds_v: mdsV,
             mds_cl: mdsCL,
             mds_o: mdsO,
+            version: this.applicationInfoVersions.get(userCode),
           }),
         },
       );
 
       const prereqResult = await prereqResponse.json();
+      this.rememberApplicationInfoVersion(userCode, prereqResult);
 
       if (!prereqResult.success) {
         this.showPrerequisitesFeedback(
           prereqResult.message || "Failed to save prerequisites",
           false,
         );
+        if (prereqResult.conflict) {
+          await this.reloadApplicationInfo(userCode);
+        }
         return;
       }
 
@@ -4190,6 +4219,7 @@ class ApplicantsManager {
       );
 
       const statusResult = await statusResponse.json();
+      this.rememberApplicationInfoVersion(userCode, statusResult);
 
       if (statusResult.success) {
         this.showPrerequisitesFeedback(
@@ -4762,6 +4792,27 @@ class ApplicantsManager {
     }
   }
 
+  // Keep the application_info.version the edit forms were filled from (or the
+  // one a save returned); edits send it back so the server rejects them with
+  // a 409 if someone else saved the applicant in between.
+  rememberApplicationInfoVersion(userCode, info) {
+    if (info && Number.isInteger(info.version)) {
+      this.applicationInfoVersions.set(userCode, info.version);
+    }
+  }
+
+  // After a 409 conflict: drop the cached copy and refill the prerequisites
+  // and English forms (and their version) from the current row.
+  async reloadApplicationInfo(userCode) {
+    this.applicantCache.delete(userCode);
+    this.applicationInfoVersions.delete(userCode);
+    await Promise.all([
+      this.loadPrerequisites(userCode),
+      this.loadPrerequisitesSummary(userCode),
+      this.loadTestScores(userCode),
+    ]);
+  }
+
   //saveEnglishComment method
   async saveEnglishComment() {
     const modal = document.getElementById("applicantModal");
@@ -4785,11 +4836,13 @@ class ApplicantsManager {
           },
           body: JSON.stringify({
             english_comment: comment,
+            version: this.applicationInfoVersions.get(userCode),
           }),
         },
       );
 
       const result = await response.json();
+      this.rememberApplicationInfoVersion(userCode, result);
 
       if (result.success) {
         this.showMessage("English comment saved successfully", "success");
@@ -4798,6 +4851,9 @@ class ApplicantsManager {
           result.message || "Failed to save English comment",
           "error",
         );
+        if (result.conflict) {
+          await this.reloadApplicationInfo(userCode);
+        }
       }
     } catch (error) {
       this.showMessage(
@@ -4838,11 +4894,13 @@ class ApplicantsManager {
           },
           body: JSON.stringify({
             english_status: newStatus,
+            version: this.applicationInfoVersions.get(userCode),
           }),
         },
       );
 
       const result = await response.json();
+      this.rememberApplicationInfoVersion(userCode, result);
 
       if (result.success) {
         this.showMessage("English status updated successfully", "success");
@@ -4867,6 +4925,9 @@ class ApplicantsManager {
           result.message || "Failed to update English status",
           "error",
         );
+        if (result.conflict) {
+          await this.reloadApplicationInfo(userCode);
+        }
       }
     } catch (error) {
       this.showMessage(
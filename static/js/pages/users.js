@@ -19,6 +19,7 @@ class UsersManager {
     this._currentUserId = null;
     this._currentUserData = null;
     this._usersCache = [];
+    this._searchKeys = new Map(); // user -> lowercased name/email/role
     this._selectedUsers = new Set();
     this._searchTimeout = null;
     this._sortField = null;
@@ -97,6 +98,7 @@ class UsersManager {
       const result = await authService.getUsers();
       if (result.success) {
         this._usersCache = result.users || [];
+        this._buildSearchKeys(this._usersCache);
         this._displayUsers(this._usersCache);
       } else {
         Notification.error(result.message || "Failed to load users.");
@@ -106,6 +108,21 @@ class UsersManager {
     }
   }
 
+  // Lowercase the searchable/sortable fields once per load, not per keystroke
+  _buildSearchKeys(users) {
+    this._searchKeys = new Map();
+    for (const u of users) {
+      const name = (u.full_name || "").toLowerCase();
+      const email = (u.email || "").toLowerCase();
+      const role = getRoleName(u.role_id).toLowerCase();
+      this._searchKeys.set(u, {
+        name,
+        email,
+        all: [name, email, role].join("\u0000"),
+      });
+    }
+  }
+
   _filterUsers(query) {
     if (!query?.trim()) {
       this._displayUsers(this._usersCache);
@@ -113,11 +130,8 @@ class UsersManager {
     }
     const lq = query.toLowerCase();
     this._displayUsers(
-      this._usersCache.filter(
-        (u) =>
-          u.full_name.toLowerCase().includes(lq) ||
-          u.email.toLowerCase().includes(lq) ||
-          getRoleName(u.role_id).toLowerCase().includes(lq),
+      this._usersCache.filter((u) =>
+        this._searchKeys.get(u)?.all.includes(lq),
       ),
     );
   }
@@ -159,11 +173,11 @@ class UsersManager {
       sorted.sort((a, b) => {
         let av, bv;
         if (this._sortField === "name") {
-          av = a.full_name.toLowerCase();
-          bv = b.full_name.toLowerCase();
+          av = this._searchKeys.get(a)?.name ?? "";
+          bv = this._searchKeys.get(b)?.name ?? "";
         } else if (this._sortField === "email") {
-          av = a.email.toLowerCase();
-          bv = b.email.toLowerCase();
+          av = this._searchKeys.get(a)?.email ?? "";
+          bv = this._searchKeys.get(b)?.email ?? "";
         } else if (this._sortField === "role") {
           av = getRoleName(a.role_id);
           bv = getRoleName(b.role_id);
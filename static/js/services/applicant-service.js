@@ -40,20 +40,22 @@ export class ApplicantService {
     );
   }
 
-  async updateEnglishComment(userCode, comment) {
+  async updateEnglishComment(userCode, comment, version) {
     return api.put(
       `/api/applicant-application-info/${userCode}/english-comment`,
       {
         english_comment: comment,
+        version,
       },
     );
   }
 
-  async updateEnglishStatus(userCode, status) {
+  async updateEnglishStatus(userCode, status, version) {
     return api.put(
       `/api/applicant-application-info/${userCode}/english-status`,
       {
         english_status: status,
+        version,
       },
     );
   }
@@ -19,7 +19,7 @@ import csv
 import io
 import math
 from datetime import datetime
-from flask import make_response
+from flask import Response, make_response, stream_with_context
 
 
 def clean_value(value):
@@ -147,6 +147,37 @@ def create_csv_response(rows, filename, fieldnames=None):
     return response
 
 
+def create_csv_stream_response(rows, filename, fieldnames):
+    """
+    Create a Flask response that streams CSV content as rows are produced.
+
+    Unlike create_csv_response, rows may be any iterable (e.g. a generator
+    over a server-side cursor); only one row is held in memory at a time.
+
+    @param rows: Iterable of dictionaries to export
+    @param filename: Name for the downloaded file
+    @param fieldnames: List of column names
+    @return: Flask Response object streaming CSV content
+
+    @example:
+        return create_csv_stream_response(service.iter_rows(), "logs.csv", ["a", "b"])
+    """
+    def generate():
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=fieldnames)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(clean_row(row))
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+        yield output.getvalue()
+
+    response = Response(stream_with_context(generate()), mimetype='text/csv')
+    response.headers['Content-Disposition'] = f'attachment; filename={filename}'
+    return response
+
+
 def generate_export_filename(prefix, record_count=None, include_date=True):
     """
     Generate a standardized export filename.
@@ -7,12 +7,19 @@ schema initialization from SQL files, database setup functions, and handles
 PostgreSQL-specific operations including complex SQL statement execution.
 """
 
+import atexit
+import hashlib
+import logging
 import psycopg2
 import os
+import threading
 from dotenv import load_dotenv
+from psycopg2.pool import ThreadedConnectionPool
 
 load_dotenv(override=True)
 
+logger = logging.getLogger(__name__)
+
 # Database configuration
 DB_CONFIG = {
     "host": os.getenv("HOST"),
@@ -23,16 +30,107 @@ DB_CONFIG = {
 }
 
 
+# Connection pool bounds for request-path connections (psycopg2 keeps up to
+# DB_POOL_MIN_CONN idle connections open and closes extras on release).
+# DB_POOL_MAX_CONN should cover the server's worker threads.
+DB_POOL_MIN_CONN = int(os.getenv("DB_POOL_MIN_CONN", "5"))
+DB_POOL_MAX_CONN = int(os.getenv("DB_POOL_MAX_CONN", "20"))
+
+_db_pool = None
+_db_pool_lock = threading.Lock()
+
+
 def get_db_connection():
     """Create database connection"""
     try:
         conn = psycopg2.connect(**DB_CONFIG)
         return conn
     except Exception as e:
-        print(f"Database connection error: {e}")
+        logger.error("Database connection error: %s", e)
+        return None
+
+
+def _get_db_pool():
+    """Return the shared connection pool, creating it on first use."""
+    global _db_pool
+    if _db_pool is None:
+        with _db_pool_lock:
+            if _db_pool is None:
+                _db_pool = ThreadedConnectionPool(DB_POOL_MIN_CONN, DB_POOL_MAX_CONN, **DB_CONFIG)
+    return _db_pool
+
+
+def warm_db_pool():
+    """
+    Create the shared pool (and its DB_POOL_MIN_CONN connections) up front so
+    the first requests don't pay the connection handshakes.
+
+    @return: True if the pool is ready, False if the database was unreachable
+    """
+    try:
+        _get_db_pool()
+        return True
+    except Exception as e:
+        logger.error("Database connection pool could not be created: %s", e)
+        return False
+
+
+def get_pooled_connection():
+    """Borrow a connection from the shared pool. Release with release_db_connection()."""
+    try:
+        return _get_db_pool().getconn()
+    except Exception as e:
+        logger.error("Database connection error: %s", e)
         return None
 
 
+def release_db_connection(conn):
+    """Return a pooled connection; broken connections are discarded."""
+    try:
+        _get_db_pool().putconn(conn, close=bool(conn.closed))
+    except Exception as e:
+        logger.error("Error releasing database connection: %s", e)
+
+
+def _drop_db_pool_in_child():
+    """
+    Forget the parent's pool in a forked child; it opens its own on first use.
+
+    The inherited sockets belong to the parent's sessions, so each one is
+    pointed at /dev/null first: the child can then neither read the parent's
+    traffic nor, when the old connections are garbage-collected, send the
+    server a terminate message that would end the parent's sessions.
+    """
+    global _db_pool, _db_pool_lock
+    pool = _db_pool
+    _db_pool = None
+    _db_pool_lock = threading.Lock()
+    if pool is None or pool.closed:
+        return
+    devnull = os.open(os.devnull, os.O_RDWR)
+    try:
+        for conn in list(pool._pool) + list(pool._used.values()):
+            try:
+                os.dup2(devnull, conn.fileno())
+            except (OSError, psycopg2.Error):
+                pass
+    finally:
+        os.close(devnull)
+
+
+os.register_at_fork(after_in_child=_drop_db_pool_in_child)
+
+
+@atexit.register
+def close_db_pool():
+    """Close every pooled connection; registered to run at interpreter exit."""
+    global _db_pool
+    with _db_pool_lock:
+        if _db_pool is not None and not _db_pool.closed:
+            _db_pool.closeall()
+        _db_pool = None
+
+
 def read_schema_file():
     """Read and return the SQL schema file content"""
     try:
@@ -99,24 +197,67 @@ def execute_schema_statements(cursor, schema_content):
             cursor.execute(statement)
 
 
-def init_database():
-    """Initialize database using schema.sql file"""
+def _schema_fingerprint(schema_content):
+    """Hash the schema text; stored in schema_meta after a successful init."""
+    return hashlib.sha256(schema_content.encode("utf-8")).hexdigest()
+
+
+def _read_schema_fingerprint(conn):
+    """Return the fingerprint recorded in schema_meta, or None if absent."""
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT fingerprint FROM schema_meta")
+            row = cursor.fetchone()
+        return row[0] if row else None
+    except psycopg2.Error:
+        # schema_meta doesn't exist yet: a new, recreated or pre-marker database
+        conn.rollback()
+        return None
+
+
+def _write_schema_fingerprint(cursor, fingerprint):
+    cursor.execute(
+        """
+        INSERT INTO schema_meta (id, fingerprint, applied_at)
+        VALUES (TRUE, %s, CURRENT_TIMESTAMP)
+        ON CONFLICT (id) DO UPDATE
+            SET fingerprint = EXCLUDED.fingerprint, applied_at = EXCLUDED.applied_at
+        """,
+        (fingerprint,),
+    )
+
+
+def init_database(lazy=False):
+    """
+    Initialize database using schema.sql file
+
+    @param lazy: Skip the schema run when the fingerprint recorded in the
+                 database's schema_meta table matches the current schema.sql
+    @return: True on success (or when skipped), False on failure
+    """
+    # Read schema file
+    schema_content = read_schema_file()
+    if not schema_content:
+        print("❌ Failed to read schema file")
+        return False
+
     conn = get_db_connection()
     if not conn:
         print("❌ Failed to connect to database")
         return False
 
-    try:
-        # Read schema file
-        schema_content = read_schema_file()
-        if not schema_content:
-            print("❌ Failed to read schema file")
-            return False
+    fingerprint = _schema_fingerprint(schema_content)
+    if lazy and _read_schema_fingerprint(conn) == fingerprint:
+        conn.close()
+        print("✅ Database schema unchanged, skipping initialization")
+        return True
 
+    try:
         cursor = conn.cursor()
 
-        # Execute schema statements
+        # Execute schema statements, then record them in the same transaction
         execute_schema_statements(cursor, schema_content)
+        _write_schema_fingerprint(cursor, fingerprint)
 
         # Commit all changes
         conn.commit()
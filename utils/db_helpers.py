@@ -3,7 +3,8 @@ Database Helper Utilities
 
 This module provides a context manager for database connections, replacing
 repetitive try/except/finally patterns throughout the codebase with a clean,
-reusable interface.
+reusable interface. Connections are borrowed from the shared pool in
+utils.database and returned to it on exit.
 
 Usage:
     from utils.db_helpers import db_connection, db_transaction
@@ -21,7 +22,7 @@ Usage:
 
 from contextlib import contextmanager
 from psycopg2.extras import RealDictCursor
-from utils.database import get_db_connection
+from utils.database import get_pooled_connection, release_db_connection
 
 
 @contextmanager
@@ -43,7 +44,7 @@ def db_connection(cursor_factory=RealDictCursor):
     conn = None
     cursor = None
     try:
-        conn = get_db_connection()
+        conn = get_pooled_connection()
         if conn is None:
             raise ConnectionError("Failed to establish database connection")
         cursor = conn.cursor(cursor_factory=cursor_factory)
@@ -52,7 +53,7 @@ def db_connection(cursor_factory=RealDictCursor):
         if cursor:
             cursor.close()
         if conn:
-            conn.close()
+            release_db_connection(conn)
 
 
 @contextmanager
@@ -74,7 +75,7 @@ def db_transaction(cursor_factory=RealDictCursor):
     conn = None
     cursor = None
     try:
-        conn = get_db_connection()
+        conn = get_pooled_connection()
         if conn is None:
             raise ConnectionError("Failed to establish database connection")
         cursor = conn.cursor(cursor_factory=cursor_factory)
@@ -88,7 +89,7 @@ def db_transaction(cursor_factory=RealDictCursor):
         if cursor:
             cursor.close()
         if conn:
-            conn.close()
+            release_db_connection(conn)
 
 
 def fetch_one(query, params=None, cursor_factory=RealDictCursor):
@@ -125,6 +126,62 @@ def fetch_all(query, params=None, cursor_factory=RealDictCursor):
         return cursor.fetchall()
 
 
+def fetchall_dicts(cursor):
+    """
+    Fetch the remaining rows of a plain (tuple) cursor as dicts.
+
+    Column names are read once from cursor.description and each row is built
+    with dict(zip(...)), which is cheaper than RealDictCursor on wide or long
+    result sets.
+
+    @param cursor: Cursor opened with cursor_factory=None, after execute()
+    @return: List of rows as dicts
+
+    @example:
+        with db_connection(cursor_factory=None) as (conn, cursor):
+            cursor.execute("SELECT * FROM applicant_status")
+            rows = fetchall_dicts(cursor)
+    """
+    columns = [column.name for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def stream_rows(query, params=None, cursor_factory=RealDictCursor, itersize=500):
+    """
+    Execute a query through a named (server-side) cursor and yield rows lazily.
+
+    Rows are pulled from PostgreSQL in batches of `itersize`, so memory stays
+    bounded regardless of result size. The connection is held until the
+    generator is exhausted or closed.
+
+    @param query: SQL query string
+    @param params: Query parameters (tuple or dict)
+    @param cursor_factory: Cursor factory to use
+    @param itersize: Number of rows fetched per network round-trip
+    @yields: One row per iteration (dict by default)
+
+    @example:
+        for row in stream_rows("SELECT * FROM applicant_status"):
+            write(row)
+    """
+    conn = None
+    cursor = None
+    try:
+        conn = get_pooled_connection()
+        if conn is None:
+            raise ConnectionError("Failed to establish database connection")
+        cursor = conn.cursor(name="stream_rows", cursor_factory=cursor_factory)
+        cursor.itersize = itersize
+        cursor.execute(query, params)
+        for row in cursor:
+            yield row
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            release_db_connection(conn)
+
+
 def execute_query(query, params=None, returning=False):
     """
     Execute a write query with automatic commit.
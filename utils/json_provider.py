@@ -0,0 +1,51 @@
+"""
+ORJSON PROVIDER
+
+Flask JSON provider backed by orjson. Installed on the app in main.py so every
+jsonify() call and the streamed applicant list serialize through orjson's C
+encoder instead of the standard library json module.
+
+Dates and datetimes are passed through to the default hook and rendered with
+http_date, so the wire format matches Flask's built-in provider.
+"""
+
+import dataclasses
+import decimal
+import uuid
+from datetime import date
+
+import orjson
+from flask.json.provider import JSONProvider
+from werkzeug.http import http_date
+
+_DUMPS_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def _default(o):
+    """Serialize the types Flask's default provider supports beyond plain JSON."""
+    if isinstance(o, date):
+        return http_date(o)
+    if isinstance(o, (decimal.Decimal, uuid.UUID)):
+        return str(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """JSONProvider that encodes with orjson."""
+
+    mimetype = "application/json"
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=_default, option=_DUMPS_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=_default, option=_DUMPS_OPTIONS)
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -16,11 +16,25 @@ Usage:
     @require_faculty_or_admin
     def faculty_endpoint():
         return jsonify({"success": True})
+
+Each decorator resolves the logged-in user once per request and stores it on
+flask.g.user, so handlers can read g.user instead of re-walking the
+current_user proxy. Role checks test the user's precomputed perms bitmask.
 """
 
 from functools import wraps
-from flask import jsonify
+from flask import g, jsonify, redirect, request, url_for
 from flask_login import current_user, login_required
+from models.users import PERM_ADMIN, PERM_SUPER_ADMIN, PERM_VIEWER
+
+
+def _resolve_user():
+    """Return the request's user object, resolving the current_user proxy once."""
+    user = g.get("user")
+    if user is None:
+        user = current_user._get_current_object()
+        g.user = user
+    return user
 
 
 def require_authenticated(f):
@@ -56,13 +70,14 @@ def require_admin(f):
     """
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if not current_user.is_authenticated:
+        user = _resolve_user()
+        if not user.is_authenticated:
             return jsonify({
                 "success": False,
                 "message": "Authentication required"
             }), 401
 
-        if not current_user.is_admin:
+        if not user.perms & PERM_ADMIN:
             return jsonify({
                 "success": False,
                 "message": "Admin access required"
@@ -89,13 +104,14 @@ def require_super_admin(f):
     """
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if not current_user.is_authenticated:
+        user = _resolve_user()
+        if not user.is_authenticated:
             return jsonify({
                 "success": False,
                 "message": "Authentication required"
             }), 401
 
-        if not current_user.is_super_admin:
+        if not user.perms & PERM_SUPER_ADMIN:
             return jsonify({
                 "success": False,
                 "message": "Super Admin access required"
@@ -119,13 +135,14 @@ def require_faculty_or_admin(f):
     """
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        if not current_user.is_authenticated:
+        user = _resolve_user()
+        if not user.is_authenticated:
             return jsonify({
                 "success": False,
                 "message": "Authentication required"
             }), 401
 
-        if current_user.is_viewer:
+        if user.perms & PERM_VIEWER:
             return jsonify({
                 "success": False,
                 "message": "Access denied. Faculty or Admin role required."
@@ -166,20 +183,21 @@ def check_permission(required_role):
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            if not current_user.is_authenticated:
+            user = _resolve_user()
+            if not user.is_authenticated:
                 return jsonify({
                     "success": False,
                     "message": "Authentication required"
                 }), 401
 
             user_role = None
-            if current_user.is_super_admin:
+            if user.is_super_admin:
                 user_role = 'Super Admin'
-            elif current_user.is_admin:
+            elif user.is_admin:
                 user_role = 'Admin'
-            elif current_user.is_faculty:
+            elif user.is_faculty:
                 user_role = 'Faculty'
-            elif current_user.is_viewer:
+            elif user.is_viewer:
                 user_role = 'Viewer'
 
             # Super Admin and Admin can access everything
@@ -200,3 +218,70 @@ def check_permission(required_role):
             return f(*args, **kwargs)
         return decorated_function
     return decorator
+
+
+_page_redirect_urls = {}
+
+
+def cached_url(endpoint):
+    """
+    url_for(endpoint), built once per script root and reused.
+
+    Only for endpoints that take no arguments (the page routes), so the
+    hot redirect paths skip building the URL through the routing map.
+
+    @param endpoint: Endpoint name, e.g. 'login_page'
+    @return: URL path for the endpoint
+
+    @example:
+        return redirect(cached_url("login_page"))
+    """
+    key = (request.script_root, endpoint)
+    url = _page_redirect_urls.get(key)
+    if url is None:
+        url = _page_redirect_urls[key] = url_for(endpoint)
+    return url
+
+
+def _page_guard(check):
+    """
+    Build a decorator for HTML page routes: anonymous users are sent to the
+    login page, users failing check(user) are sent back to the main page.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            user = _resolve_user()
+            if not user.is_authenticated:
+                return redirect(cached_url("login_page"))
+            if not check(user):
+                return redirect(cached_url("index"))
+            return f(*args, **kwargs)
+        return decorated_function
+    return decorator
+
+
+def require_admin_page(f):
+    """
+    Page-route decorator: Admin or Super Admin only, otherwise redirect.
+
+    @example:
+        @app.route('/logs')
+        @require_admin_page
+        def logs_page():
+            return render_template('logs.html')
+    """
+    return _page_guard(lambda user: user.perms & PERM_ADMIN)(f)
+
+
+def require_super_admin_page(f):
+    """
+    Page-route decorator: Super Admin only, otherwise redirect.
+
+    @example:
+        @app.route('/create-new-session')
+        @require_super_admin_page
+        def create_new_session_page():
+            return render_template('create-session.html')
+    """
+    return _page_guard(lambda user: user.perms & PERM_SUPER_ADMIN)(f)
@@ -26,7 +26,8 @@ Usage:
 
 import pandas as pd
 from dataclasses import dataclass, field
-from typing import List, Optional, Callable, Any
+from datetime import date
+from typing import List, Optional
 
 
 def convert_id_to_string(value):
@@ -45,6 +46,8 @@ def convert_score(value):
 
 def parse_date(value):
     """Parse a date value from CSV, returning None if invalid."""
+    if type(value) is date:  # already parsed column-wise
+        return value
     if pd.isna(value):
         return None
     try:
@@ -115,23 +118,19 @@ class TestScoreConfig:
         return f"{self.prefix_pattern}{entry_num}"
 
 
-def build_insert_query(config: TestScoreConfig) -> str:
-    """
-    Build the INSERT ... ON CONFLICT query for a test score table.
-
-    @param config: TestScoreConfig for the test type
-    @return: SQL query string
-    """
+def test_score_columns(config: TestScoreConfig) -> List[str]:
+    """Column names of a test score table row, in the order build_test_score_rows emits them."""
     columns = ['user_code']
     if not config.has_single_entry:
         columns.append(config.number_field)
 
     columns.extend([f.db_column for f in config.fields])
     columns.extend(['created_at', 'updated_at'])
+    return columns
 
-    placeholders = ', '.join(['%s'] * len(columns))
 
-    # Build the ON CONFLICT clause
+def _on_conflict_clause(config: TestScoreConfig) -> str:
+    """ON CONFLICT ... DO UPDATE clause shared by the per-row and staged upserts."""
     if config.has_single_entry:
         conflict_key = 'user_code'
     else:
@@ -141,24 +140,84 @@ def build_insert_query(config: TestScoreConfig) -> str:
     update_fields = [f.db_column for f in config.fields]
     update_set = ', '.join([f"{col} = EXCLUDED.{col}" for col in update_fields])
 
-    # Build change detection for updated_at
-    change_conditions = ' OR '.join([
-        f"{config.table_name}.{col} IS DISTINCT FROM EXCLUDED.{col}"
-        for col in update_fields
-    ])
+    # Build change detection for updated_at (one row comparison, NULL-safe)
+    existing = ', '.join([f"{config.table_name}.{col}" for col in update_fields])
+    excluded = ', '.join([f"EXCLUDED.{col}" for col in update_fields])
 
-    query = f"""
-    INSERT INTO {config.table_name} ({', '.join(columns)})
-    VALUES ({placeholders})
+    return f"""
     ON CONFLICT ({conflict_key}) DO UPDATE SET
         {update_set},
         updated_at = CASE
-            WHEN {change_conditions}
+            WHEN ROW({existing}) IS DISTINCT FROM ROW({excluded})
             THEN EXCLUDED.updated_at
             ELSE {config.table_name}.updated_at
         END
     """
 
+
+def build_insert_query(config: TestScoreConfig) -> str:
+    """
+    Build the INSERT ... ON CONFLICT query for a test score table.
+
+    @param config: TestScoreConfig for the test type
+    @return: SQL query string
+    """
+    columns = test_score_columns(config)
+    placeholders = ', '.join(['%s'] * len(columns))
+
+    return f"""
+    INSERT INTO {config.table_name} ({', '.join(columns)})
+    VALUES ({placeholders})
+    {_on_conflict_clause(config)}
+    """
+
+
+def build_values_upsert_query(config: TestScoreConfig) -> str:
+    """
+    Build the multi-row INSERT ... VALUES %s ... ON CONFLICT query for
+    psycopg2.extras.execute_values, returning each written row's user_code
+    and updated_at (equal to the row's timestamp when inserted or changed).
+
+    @param config: TestScoreConfig for the test type
+    @return: SQL query string
+    """
+    return f"""
+    INSERT INTO {config.table_name} ({', '.join(test_score_columns(config))})
+    VALUES %s
+    {_on_conflict_clause(config)}
+    RETURNING user_code, updated_at
+    """
+
+
+def build_stage_upsert_query(config: TestScoreConfig) -> str:
+    """
+    Build the INSERT ... SELECT ... ON CONFLICT query that upserts a test score
+    table from a staging table holding test_score_columns(config).
+
+    {stage} is left in the query for the staging table name. Each written
+    row's user_code and updated_at are returned; updated_at equals the staged
+    timestamp when the row was inserted or changed.
+
+    @param config: TestScoreConfig for the test type
+    @return: SQL query string
+    """
+    columns = ', '.join(test_score_columns(config))
+    return f"""
+    INSERT INTO {config.table_name} ({columns})
+    SELECT {columns} FROM {{stage}}
+    {_on_conflict_clause(config)}
+    RETURNING user_code, updated_at
+    """
+
+
+_insert_queries = {}
+
+
+def _insert_query(config: TestScoreConfig) -> str:
+    """build_insert_query(config) returning updated_at, built once per table."""
+    query = _insert_queries.get(config.table_name)
+    if query is None:
+        query = _insert_queries[config.table_name] = build_insert_query(config) + " RETURNING updated_at"
     return query
 
 
@@ -180,46 +239,17 @@ def has_score_data(row, config: TestScoreConfig, prefix: str) -> bool:
     return any(pd.notna(row.get(f.get_csv_column(prefix))) for f in check_fields)
 
 
-def get_old_records(cursor, config: TestScoreConfig, user_code: str) -> dict:
+def build_test_score_rows(user_code: str, row, current_time, config: TestScoreConfig) -> list:
     """
-    Get existing records for change detection.
-
-    @return: Dictionary mapping entry number (or 0 for single) to updated_at timestamp
-    """
-    if config.has_single_entry:
-        cursor.execute(
-            f"SELECT updated_at FROM {config.table_name} WHERE user_code = %s",
-            (user_code,)
-        )
-        result = cursor.fetchone()
-        return {0: result["updated_at"] if result else None}
-    else:
-        cursor.execute(
-            f"SELECT {config.number_field}, updated_at FROM {config.table_name} WHERE user_code = %s ORDER BY {config.number_field}",
-            (user_code,)
-        )
-        return {r[config.number_field]: r["updated_at"] for r in cursor.fetchall()}
-
-
-def get_new_records(cursor, config: TestScoreConfig, user_code: str) -> dict:
-    """Get records after processing for change detection."""
-    return get_old_records(cursor, config, user_code)
-
-
-def process_test_score(user_code: str, row, cursor, current_time, config: TestScoreConfig) -> bool:
-    """
-    Generic function to process test scores from CSV data.
+    Build the parameter tuples (test_score_columns order) for one applicant's CSV row.
 
     @param user_code: Applicant's user code
     @param row: CSV row (pandas Series or dict)
-    @param cursor: Database cursor
     @param current_time: Timestamp for created_at/updated_at
     @param config: TestScoreConfig for the test type
-    @return: True if data changed, False otherwise
+    @return: List of tuples, one per test entry with score data
     """
-    old_records = get_old_records(cursor, config, user_code)
-    query = build_insert_query(config)
-
+    rows = []
     entries_to_process = range(1, config.max_entries + 1) if not config.has_single_entry else [1]
 
     for entry_num in entries_to_process:
@@ -238,20 +268,33 @@ def process_test_score(user_code: str, row, cursor, current_time, config: TestSc
             params.append(field_config.extract_value(row, prefix))
 
         params.extend([current_time, current_time])
+        rows.append(tuple(params))
 
-        cursor.execute(query, tuple(params))
+    return rows
 
-    # Check for changes
-    new_records = get_new_records(cursor, config, user_code)
 
-    if len(old_records) != len(new_records):
-        return True
+def process_test_score(user_code: str, row, cursor, current_time, config: TestScoreConfig) -> bool:
+    """
+    Generic function to process test scores from CSV data.
+
+    @param user_code: Applicant's user code
+    @param row: CSV row (pandas Series or dict)
+    @param cursor: Database cursor
+    @param current_time: Timestamp for created_at/updated_at
+    @param config: TestScoreConfig for the test type
+    @return: True if data changed, False otherwise
+    """
+    query = _insert_query(config)
 
-    for key, new_ts in new_records.items():
-        if old_records.get(key) != new_ts:
-            return True
+    # updated_at only takes current_time when a row is inserted or its data
+    # changed, so the upserts' RETURNING replaces before/after reads
+    changed = False
+    for params in build_test_score_rows(user_code, row, current_time, config):
+        cursor.execute(query, params)
+        if cursor.fetchone()["updated_at"] == current_time:
+            changed = True
 
-    return False
+    return changed
 
 
 # =============================================================================
@@ -424,6 +467,16 @@ TEST_SCORE_CONFIGS = {
 }
 
 
+# Every CSV date cell the configs read; CSV imports parse these column-wise
+TEST_SCORE_DATE_COLUMNS = tuple(dict.fromkeys(
+    score_field.get_csv_column(config.get_prefix(entry_num))
+    for config in TEST_SCORE_CONFIGS.values()
+    for entry_num in (range(1, config.max_entries + 1) if not config.has_single_entry else [1])
+    for score_field in config.fields
+    if score_field.field_type == 'date'
+))
+
+
 def process_all_test_scores(user_code: str, row, cursor, current_time) -> bool:
     """
     Process all test scores for an applicant.
@@ -13,3 +13,9 @@ load_dotenv('/srv/www/mds-review.ok.ubc.ca/.env')
 
 # Import your Flask app
 from main import app as application
+
+# Open this process's pooled DB connections before the first request. A
+# process forked after this (e.g. gunicorn --preload) drops the inherited
+# pool and opens its own on first use.
+from utils.database import warm_db_pool
+warm_db_pool()